@@ -2,8 +2,11 @@ import sys
 import random
 from PyQt5 import QtWidgets, QtCore
 from datetime import datetime, timedelta
-import json
 import os
+import time
+
+from src.core.config import merge_into_file, read_settings_file
+from src.core.schema import parse_clock_time, parse_duration
 
 class BreakReminder(QtWidgets.QWidget):
     FINNISH_FUNNY_MESSAGES = [
@@ -340,24 +343,24 @@ class BreakReminder(QtWidgets.QWidget):
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".break_reminder_config.json")
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except Exception:
-            pass
-    # Defaults
-    return {
+    # Defaults, overridden by whatever the file holds
+    config = {
         "usual_start": "08:00",
         "lunch_start": "10:45",
         "lunch_end": "12:30",
         "workday_length": "08:00"  # hours:minutes
     }
+    settings, _ = read_settings_file(CONFIG_FILE)
+    if settings:
+        config.update(settings)
+    return config
 
 def save_config(config):
+    # Merge only the schedule into the file shared with the enhanced app
+    stamp = time.time_ns()
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f)
+        merge_into_file(CONFIG_FILE, {key: (stamp, config[key]) for key in
+                                      ("usual_start", "lunch_start", "lunch_end", "workday_length")})
     except Exception:
         pass
 
@@ -545,12 +548,11 @@ def main():
     start_str, lunch_start_str, lunch_end_str, workday_length_str = get_start_and_lunch_times()
     today = datetime.now().date()
     try:
-        start_time = datetime.combine(today, datetime.strptime(start_str, '%H:%M').time())
-        lunch_start = datetime.combine(today, datetime.strptime(lunch_start_str, '%H:%M').time())
-        lunch_end = datetime.combine(today, datetime.strptime(lunch_end_str, '%H:%M').time())
+        start_time = datetime.combine(today, parse_clock_time(start_str))
+        lunch_start = datetime.combine(today, parse_clock_time(lunch_start_str))
+        lunch_end = datetime.combine(today, parse_clock_time(lunch_end_str))
         # Parse workday length
-        wh, wm = [int(x) for x in workday_length_str.split(":")] if ":" in workday_length_str else (int(workday_length_str), 0)
-        workday_length = timedelta(hours=wh, minutes=wm)
+        workday_length = parse_duration(workday_length_str)
     except Exception:
         QtWidgets.QMessageBox.warning(None, 'Invalid', 'Please enter time as HH:MM')
         sys.exit()
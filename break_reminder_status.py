@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Break Reminder - Status
+Prints the current break state without starting Qt, for shell prompts and
+status bars. Accepts the options of ``python -m src.cli status``.
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main(["status"] + sys.argv[1:]))
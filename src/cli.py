@@ -0,0 +1,105 @@
+"""Command-line queries that run without Qt.
+
+Only ``src.core`` is imported, so that shell prompts and status bars get
+an answer within milliseconds::
+
+    python -m src.cli status [--json] [--watch]
+"""
+
+import argparse
+import json
+import sys
+
+from .core.break_logic import BreakLogic
+from .core.config import ConfigManager
+from .core.control import status_of, status_text
+
+
+def render(snapshot, as_json: bool) -> str:
+    """Format a break state snapshot for output.
+
+    Args:
+        snapshot: ``StateSnapshot`` of the break logic
+        as_json: True for one line of JSON, False for a short text
+
+    Returns:
+        Line to print
+    """
+    if as_json:
+        return json.dumps(status_of(snapshot), ensure_ascii=False)
+    return status_text(snapshot)
+
+
+def watch(config: ConfigManager, logic: BreakLogic, as_json: bool) -> None:
+    """Print the state whenever it changes, until interrupted.
+
+    The process sleeps until the next state transition or until the config
+    file changes; nothing is printed when the output would be the same.
+
+    Args:
+        config: Configuration, reloaded when its file changes
+        logic: Break logic built from the configuration
+        as_json: True for JSON lines, False for short texts
+    """
+    import threading
+
+    from .core.scheduler import TransitionScheduler
+    from .core.watcher import ConfigWatcher
+
+    file_changed = threading.Event()
+    watcher = ConfigWatcher(config.config_file, file_changed.set)
+    watcher.start()
+    scheduler = TransitionScheduler(logic)
+    last = None
+    try:
+        while True:
+            line = render(logic.get_snapshot(), as_json)
+            if line != last:
+                print(line, flush=True)
+                last = line
+            if file_changed.wait(scheduler.next_delay_ms() / 1000):
+                file_changed.clear()
+                loaded = config.read_file()
+                if loaded is not None:
+                    changed = config.set_layer("user", loaded)
+                    if changed:
+                        logic.update_config(config.snapshot(), changed, config.typed_snapshot())
+    finally:
+        watcher.stop()
+
+
+def main(argv=None) -> int:
+    """Command-line entry point.
+
+    Args:
+        argv: Arguments without the program name, defaults to ``sys.argv[1:]``
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(prog="break-reminder", description="Break Reminder queries")
+    commands = parser.add_subparsers(dest="command", required=True)
+    status = commands.add_parser("status", help="Print the current break state")
+    status.add_argument("--json", action="store_true", help="Print the state as JSON")
+    status.add_argument("--watch", action="store_true",
+                        help="Keep running and print the state each time it changes")
+    args = parser.parse_args(argv)
+
+    # A query must not move or rewrite the file the app is using
+    config = ConfigManager(read_only=True)
+    logic = BreakLogic(config.snapshot(), typed=config.typed_snapshot())
+    try:
+        if args.watch:
+            watch(config, logic, args.json)
+        else:
+            print(render(logic.get_snapshot(), args.json))
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # The reader went away, e.g. a status bar was restarted
+        sys.stderr.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,16 +2,155 @@
 
 import random
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Dict, Any
-from enum import Enum
+from typing import AbstractSet, Callable, List, Mapping, Optional, Tuple, Dict, Any
 
+from .clock import Clock, SystemClock
+from .events import EventQueue
+from .schedule import SCHEDULE_KEYS, ScheduleCompiler
+from .timeline import BreakInterval, BreakState, DayTimeline, Segment
 
-class BreakState(Enum):
-    """Enumeration of possible break states."""
-    WORK = "work"
-    BREAK = "break"
-    LUNCH = "lunch"
-    DONE = "done"
+
+class StateSnapshot:
+    """Break state at one moment.
+
+    The numeric fields are set on creation. The message, next event and
+    debug lines are rendered on first access, using the time labels cached
+    by the day timeline. Snapshots are never modified after creation and can
+    be shared by the widget and the tray.
+
+    ``valid_until`` is the next moment at which any numeric field can change;
+    until then the snapshot describes the current state exactly.
+    """
+
+    __slots__ = ("now", "valid_until", "state", "time_left", "progress_percent",
+                 "_timeline", "_segment", "_message", "_next_event", "_debug_info")
+
+    def __init__(self, now: datetime, valid_until: datetime, timeline: DayTimeline, segment: Segment):
+        """Initialize the snapshot.
+
+        Args:
+            now: Time of the snapshot
+            valid_until: First moment at which the snapshot is outdated
+            timeline: Active day timeline
+            segment: Timeline segment active at ``now``
+        """
+        self.now = now
+        self.valid_until = valid_until
+        self._timeline = timeline
+        self._segment = segment
+        self.state = segment.kind
+        self.time_left = segment.time_left(now)
+        self.progress_percent = segment.progress(now)
+        self._message = None
+        self._next_event = None
+        self._debug_info = None
+
+    @property
+    def next_break(self) -> Optional[datetime]:
+        """Time of the break being counted down to, if any."""
+        return self._segment.next_break
+
+    @property
+    def target(self) -> datetime:
+        """Time of the event counted down to; ``time_left`` is measured to it."""
+        return self._segment.target
+
+    @property
+    def state_until(self) -> datetime:
+        """End of the current state, unless a break is adjusted before it."""
+        return self._segment.end
+
+    @property
+    def message(self) -> str:
+        """Display message."""
+        if self._message is None:
+            self._message = self._render_message()
+        return self._message
+
+    @property
+    def next_event(self) -> str:
+        """Description of the next event."""
+        if self._next_event is None:
+            self._next_event = self._render_next_event()
+        return self._next_event
+
+    @property
+    def debug_info(self) -> List[str]:
+        """Debug information lines."""
+        if self._debug_info is None:
+            self._debug_info = self._render_debug_info()
+        return self._debug_info
+
+    def _render_message(self) -> str:
+        """Render the display message."""
+        state = self.state
+        time_left = self.time_left
+        if state == BreakState.DONE and not self._timeline.is_workday:
+            return "🌴 Day off!\n⏰ No work scheduled today"
+        if state == BreakState.DONE:
+            return f"🎉 {random.choice(BreakLogic.FINNISH_FUNNY_MESSAGES)}"
+        if state == BreakState.LUNCH:
+            return f"🍽️ Lunch break!\n⏰ {time_left} minutes left"
+        next_break = self.next_break
+        if state == BreakState.BREAK:
+            return f"☕ Break time!\n⏰ {self._timeline.format_time(next_break)} ({time_left} min)"
+        if next_break is not None:
+            return f"💼 Next break: {self._timeline.format_time(next_break)}\n⏰ {time_left} minutes to go"
+
+        # No more breaks, show time until workday end
+        hours_left = time_left // 60
+        mins_remaining = time_left % 60
+        if hours_left > 0:
+            time_str = f"{hours_left}h {mins_remaining}m"
+        else:
+            time_str = f"{mins_remaining}m"
+        return f"🏁 No more breaks today!\n⏰ {time_str} until home time"
+
+    def _render_next_event(self) -> str:
+        """Render the description of the next event."""
+        state = self.state
+        if state == BreakState.DONE:
+            return "Workday complete" if self._timeline.is_workday else "Day off"
+        if state == BreakState.LUNCH:
+            return "End of lunch break"
+        if state == BreakState.BREAK:
+            return "Break time"
+        if self.next_break is not None:
+            return f"Break at {self._timeline.format_time(self.next_break)}"
+        return "End of workday"
+
+    def _render_debug_info(self) -> List[str]:
+        """Render the debug information lines."""
+        timeline = self._timeline
+        full = '%Y-%m-%d %H:%M:%S'
+        debug_lines = [
+            f"📅 Now: {self.now.strftime(full)}",
+            f"🚀 Start: {timeline.format_time(timeline.start_time, full)}",
+            f"🏁 Workday end: {timeline.format_time(timeline.workday_end, full)}",
+            f"🍽️ Lunch: {timeline.format_time(timeline.lunch_start)} - {timeline.format_time(timeline.lunch_end)}"
+        ]
+
+        next_break = timeline.next_break(self.now)
+        if next_break is not None:
+            debug_lines.append(f"☕ Next break: {timeline.format_time(next_break, full)}")
+        else:
+            debug_lines.append("☕ Next break: N/A")
+        return debug_lines
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Render the snapshot into the ``get_current_state`` info dict.
+
+        Returns:
+            Dictionary with message, time_left, next_event, progress_percent
+            and debug_info
+        """
+        return {
+            "message": self.message,
+            "time_left": self.time_left,
+            "next_event": self.next_event,
+            "progress_percent": self.progress_percent,
+            "debug_info": self.debug_info,
+        }
 
 
 class BreakLogic:
@@ -30,198 +169,248 @@ class BreakLogic:
         "Hyvää työtä, nyt huilaamaan!"
     ]
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any], clock: Optional[Clock] = None,
+                 typed: Optional[Mapping[str, Any]] = None):
         """Initialize break logic with configuration.
         
         Args:
-            config: Configuration dictionary
+            config: Configuration mapping, e.g. a read-only config snapshot
+            clock: Time source, defaults to the system clock
+            typed: Typed values of ``config``, e.g. from
+                ``ConfigManager.typed_snapshot``; converted if not given
         """
         self.config = config
+        self.typed = typed
+        self.clock = clock if clock is not None else SystemClock()
         self.start_time = None
         self.lunch_start = None
         self.lunch_end = None
         self.workday_end = None
         self.break_times = []
-        self.next_break_idx = 0
+        self.compiler = None
+        self.timeline = None
         self.close_timer_started = False
+        self._snapshot = None
+        # Snoozed, skipped and moved breaks: the new start time (None when
+        # skipped) by the time of the break as originally scheduled
+        self.break_adjustments: Dict[datetime, Optional[datetime]] = {}
+        self._break_origins: Dict[datetime, datetime] = {}
+        # Called with each snapshot that starts a new state
+        self._listeners: List[Callable[["StateSnapshot"], None]] = []
+        self._reported_segment = None
         
         self._setup_times()
     
     def _setup_times(self) -> None:
         """Setup work times based on configuration."""
-        # Get today's date
-        today = datetime.now().date()
-        
-        # Parse start time
-        start_str = self.config.get("usual_start", "08:00")
-        self.start_time = datetime.combine(today, datetime.strptime(start_str, '%H:%M').time())
-        
-        # Parse lunch times
-        lunch_start_str = self.config.get("lunch_start", "10:45")
-        lunch_end_str = self.config.get("lunch_end", "12:30")
-        self.lunch_start = datetime.combine(today, datetime.strptime(lunch_start_str, '%H:%M').time())
-        self.lunch_end = datetime.combine(today, datetime.strptime(lunch_end_str, '%H:%M').time())
-        
-        # Parse workday length
-        workday_length_str = self.config.get("workday_length", "08:00")
-        if ":" in workday_length_str:
-            hours, minutes = map(int, workday_length_str.split(":"))
-        else:
-            hours, minutes = int(workday_length_str), 0
-        
-        workday_length = timedelta(hours=hours, minutes=minutes)
-        self.workday_end = self.start_time + workday_length
-        
-        # Calculate break times
-        break_points = self.config.get("break_points", [0.25, 0.75])
-        total_hours = workday_length.total_seconds() / 3600
-        self.break_times = [
-            self.start_time + timedelta(hours=total_hours * point) 
-            for point in break_points
-        ]
+        self.compiler = ScheduleCompiler(self.config, self.typed)
+        self._snapshot = None
+        # Empty span, so the first lookup activates the current day
+        self._active_span = (datetime.max, datetime.min)
+        self._activate(self.clock.now())
     
-    def get_current_state(self) -> Tuple[BreakState, Dict[str, Any]]:
-        """Get current break state and related information.
+    def _activate(self, now: datetime) -> DayTimeline:
+        """Switch to the timeline of the day that is active at a given time.
         
+        Args:
+            now: Current datetime
+            
         Returns:
-            Tuple of (state, info_dict) where info_dict contains:
-            - message: Display message
-            - time_left: Minutes until next event
-            - next_event: Description of next event
-            - progress_percent: Progress percentage (0-100) until next event
-            - debug_info: Debug information if enabled
+            The active day timeline
         """
-        now = datetime.now()
-        info = {"debug_info": self._get_debug_info(now)}
-        
-        # Check if workday is over
-        if now >= self.workday_end:
-            info.update({
-                "message": f"🎉 {random.choice(self.FINNISH_FUNNY_MESSAGES)}",
-                "time_left": 0,
-                "next_event": "Workday complete",
-                "progress_percent": 100
-            })
-            return BreakState.DONE, info
-        
-        # Check if in lunch break window
-        if self.lunch_start <= now <= self.lunch_end:
-            time_left = int((self.lunch_end - now).total_seconds() // 60)
-            total_lunch_time = int((self.lunch_end - self.lunch_start).total_seconds() // 60)
-            elapsed_lunch_time = total_lunch_time - time_left
-            progress_percent = int((elapsed_lunch_time / total_lunch_time) * 100) if total_lunch_time > 0 else 0
-            
-            info.update({
-                "message": f"🍽️ Lunch break!\n⏰ {time_left} minutes left",
-                "time_left": time_left,
-                "next_event": "End of lunch break",
-                "progress_percent": progress_percent
-            })
-            return BreakState.LUNCH, info
-        
-        # Check regular breaks
-        while self.next_break_idx < len(self.break_times) and now > self.break_times[self.next_break_idx]:
-            self.next_break_idx += 1
-        
-        if self.next_break_idx < len(self.break_times):
-            next_break = self.break_times[self.next_break_idx]
-            time_left = int((next_break - now).total_seconds() // 60)
-            
-            # Calculate progress based on time segment
-            if self.next_break_idx == 0:
-                # Progress from start to first break
-                segment_start = self.start_time
-            else:
-                # Progress from previous break to next break
-                segment_start = self.break_times[self.next_break_idx - 1]
-            
-            total_segment_time = int((next_break - segment_start).total_seconds() // 60)
-            elapsed_segment_time = int((now - segment_start).total_seconds() // 60)
-            progress_percent = int((elapsed_segment_time / total_segment_time) * 100) if total_segment_time > 0 else 0
-            progress_percent = max(0, min(100, progress_percent))  # Clamp to 0-100
-            
-            # Check if we're at break time (within 5 minutes)
-            if time_left <= 5 and time_left >= 0:
-                info.update({
-                    "message": f"☕ Break time!\n⏰ {next_break.strftime('%H:%M')} ({time_left} min)",
-                    "time_left": time_left,
-                    "next_event": "Break time",
-                    "progress_percent": progress_percent
-                })
-                return BreakState.BREAK, info
-            else:
-                info.update({
-                    "message": f"💼 Next break: {next_break.strftime('%H:%M')}\n⏰ {time_left} minutes to go",
-                    "time_left": time_left,
-                    "next_event": f"Break at {next_break.strftime('%H:%M')}",
-                    "progress_percent": progress_percent
-                })
-                return BreakState.WORK, info
-        else:
-            # No more breaks, show time until workday end
-            time_left = int((self.workday_end - now).total_seconds() // 60)
-            hours_left = time_left // 60
-            mins_remaining = time_left % 60
+        span_start, span_end = self._active_span
+        if not span_start <= now < span_end:
+            day = self.compiler.active_day(now)
+            self._active_span = self.compiler.active_span(day)
+            self.timeline = self._apply_adjustments(self.compiler.timeline(day))
+            self.start_time = self.timeline.start_time
+            self.lunch_start = self.timeline.lunch_start
+            self.lunch_end = self.timeline.lunch_end
+            self.workday_end = self.timeline.workday_end
+            self.break_times = list(self.timeline.break_times)
+        return self.timeline
+    
+    def _apply_adjustments(self, timeline: DayTimeline) -> DayTimeline:
+        """Apply snoozed, skipped and moved breaks to a compiled day.
+        
+        The day's breaks go through an event queue in which moved breaks are
+        rescheduled and skipped ones cancelled. A break that overlaps the one
+        before it is pushed back to follow it. Only this day's segments are
+        rebuilt, the compiled schedule itself is left untouched.
+        
+        Args:
+            timeline: Compiled day timeline
             
-            # Calculate progress from last break (or start if no breaks taken) to end
-            if len(self.break_times) > 0 and self.next_break_idx > 0:
-                # Progress from last break to end of workday
-                segment_start = self.break_times[-1]
-            else:
-                # Progress from start to end of workday (no breaks taken yet)
-                segment_start = self.start_time
+        Returns:
+            Timeline with the adjustments applied
+        """
+        # Adjustments of past days no longer matter
+        horizon = self._active_span[0] - timedelta(days=1)
+        self.break_adjustments = {key: start for key, start in self.break_adjustments.items()
+                                  if key >= horizon}
+        self._break_origins = {}
+        adjustments = self.break_adjustments
+        if not any(brk.work_target in adjustments for brk in timeline.breaks):
+            return timeline
+        
+        queue = EventQueue()
+        for brk in timeline.breaks:
+            key = brk.work_target
+            start = adjustments.get(key, brk.start)
+            if start is not None:
+                queue.push(key, start, brk.shifted(start - brk.start))
+        
+        breaks = []
+        while queue:
+            _, key, brk = queue.pop()
+            if breaks and brk.start < breaks[-1].end:
+                brk = brk.shifted(breaks[-1].end - brk.start)
+            breaks.append(brk)
+            self._break_origins[brk.work_target] = key
+        return timeline.with_breaks(breaks)
+    
+    def _adjust_break(self, now: Optional[datetime],
+                      start: Callable[[BreakInterval, datetime], Optional[datetime]]) -> bool:
+        """Record a new start time for the break in progress or coming next.
+        
+        Args:
+            now: Reference time, defaults to the current time
+            start: Function of (break, now) returning the new start time, or
+                None to skip the break
             
-            total_segment_time = int((self.workday_end - segment_start).total_seconds() // 60)
-            elapsed_segment_time = int((now - segment_start).total_seconds() // 60)
-            progress_percent = int((elapsed_segment_time / total_segment_time) * 100) if total_segment_time > 0 else 0
-            progress_percent = max(0, min(100, progress_percent))  # Clamp to 0-100
+        Returns:
+            True if there was a break to adjust
+        """
+        if now is None:
+            now = self.clock.now()
+        brk = self._activate(now).upcoming_break(now)
+        if brk is None:
+            return False
+        key = self._break_origins.get(brk.work_target, brk.work_target)
+        self.break_adjustments[key] = start(brk, now)
+        # Rebuild the active day and drop the cached snapshot
+        self._active_span = (datetime.max, datetime.min)
+        self._snapshot = None
+        self._activate(now)
+        return True
+    
+    def snooze_break(self, minutes: int = 5, now: Optional[datetime] = None) -> bool:
+        """Postpone the break in progress or coming next.
+        
+        Args:
+            minutes: How long to postpone the break for
+            now: Reference time, defaults to the current time
             
-            if hours_left > 0:
-                time_str = f"{hours_left}h {mins_remaining}m"
-            else:
-                time_str = f"{mins_remaining}m"
+        Returns:
+            True if a break was postponed
+        """
+        delay = timedelta(minutes=minutes)
+        return self._adjust_break(now, lambda brk, now: max(brk.start, now) + delay)
+    
+    def skip_break(self, now: Optional[datetime] = None) -> bool:
+        """Skip the break in progress or coming next.
+        
+        Args:
+            now: Reference time, defaults to the current time
             
-            info.update({
-                "message": f"🏁 No more breaks today!\n⏰ {time_str} until home time",
-                "time_left": time_left,
-                "next_event": "End of workday",
-                "progress_percent": progress_percent
-            })
-            return BreakState.WORK, info
+        Returns:
+            True if a break was skipped
+        """
+        return self._adjust_break(now, lambda brk, now: None)
     
-    def _get_debug_info(self, now: datetime) -> List[str]:
-        """Get debug information for current state.
+    def take_break_now(self, now: Optional[datetime] = None) -> bool:
+        """Start the next break right away.
         
         Args:
-            now: Current datetime
+            now: Reference time, defaults to the current time
             
         Returns:
-            List of debug information strings
+            True if a break was moved
         """
-        debug_lines = [
-            f"📅 Now: {now.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"🚀 Start: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"🏁 Workday end: {self.workday_end.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"🍽️ Lunch: {self.lunch_start.strftime('%H:%M')} - {self.lunch_end.strftime('%H:%M')}"
-        ]
+        return self._adjust_break(now, lambda brk, now: min(brk.start, now))
+    
+    def get_snapshot(self, now: Optional[datetime] = None) -> "StateSnapshot":
+        """Get a snapshot of the break state.
+
+        Only the numeric fields are computed here; texts are rendered when a
+        consumer first asks for them. The last snapshot is reused for as long
+        as it stays valid, so repeated queries cost a comparison. A clock that
+        jumps backwards or past the validity window gets a fresh snapshot.
+
+        Args:
+            now: Reference time, defaults to the current time
+
+        Returns:
+            State snapshot
+        """
+        if now is None:
+            now = self.clock.now()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.now <= now < snapshot.valid_until:
+            return snapshot
+
+        timeline = self._activate(now)
+        segment = timeline.segment_at(now)
+        transition = timeline.next_transition(now)
+        # The next day's timeline takes over at the end of the active span
+        rollover = self._active_span[1]
+        valid_until = rollover if transition is None else min(transition, rollover)
+        snapshot = self._snapshot = StateSnapshot(now, valid_until, timeline, segment)
+        if self._listeners and segment != self._reported_segment:
+            self._reported_segment = segment
+            for listener in self._listeners:
+                listener(snapshot)
+        return snapshot
+
+    def add_listener(self, callback: Callable[["StateSnapshot"], None]) -> None:
+        """Get notified of state transitions.
+
+        The callback receives the first snapshot of each new state: a break
+        window opening, lunch, the end of the workday, the next day, or a
+        break that was snoozed, skipped or moved. Minute ticks within a state
+        are not reported. Callbacks run in the thread that queries the state,
+        at the first query after the transition.
+
+        Args:
+            callback: Function called with the new ``StateSnapshot``
+        """
+        self._listeners.append(callback)
+
+    def get_current_state(self, now: Optional[datetime] = None) -> Tuple[BreakState, Dict[str, Any]]:
+        """Get current break state and related information.
         
-        if self.next_break_idx < len(self.break_times):
-            next_break = self.break_times[self.next_break_idx]
-            debug_lines.append(f"☕ Next break: {next_break.strftime('%Y-%m-%d %H:%M:%S')}")
-        else:
-            debug_lines.append("☕ Next break: N/A")
+        Prefer ``get_snapshot`` on hot paths, it avoids rendering texts that
+        are not displayed.
         
-        return debug_lines
+        Args:
+            now: Reference time, defaults to the current time
+            
+        Returns:
+            Tuple of (state, info_dict) where info_dict contains:
+            - message: Display message
+            - time_left: Minutes until next event
+            - next_event: Description of next event
+            - progress_percent: Progress percentage (0-100) until next event
+            - debug_info: Debug information if enabled
+        """
+        snapshot = self.get_snapshot(now)
+        return snapshot.state, snapshot.as_dict()
     
-    def update_config(self, config: Dict[str, Any]) -> None:
-        """Update configuration and recalculate times.
+    def update_config(self, config: Mapping[str, Any],
+                      changed_keys: Optional[AbstractSet[str]] = None,
+                      typed: Optional[Mapping[str, Any]] = None) -> None:
+        """Update configuration and recalculate times if needed.
         
         Args:
-            config: New configuration dictionary
+            config: New configuration mapping
+            changed_keys: Keys that changed, if known. The schedule is only
+                recompiled when one of them affects it.
+            typed: Typed values of ``config``; converted if not given
         """
         self.config = config
-        self._setup_times()
-        self.next_break_idx = 0  # Reset break index
+        self.typed = typed
+        if changed_keys is None or not SCHEDULE_KEYS.isdisjoint(changed_keys):
+            self._setup_times()
     
     def get_time_until_next_event(self) -> Optional[int]:
         """Get minutes until next significant event.
@@ -229,8 +418,39 @@ class BreakLogic:
         Returns:
             Minutes until next event, or None if no events
         """
-        _, info = self.get_current_state()
-        return info.get("time_left")
+        return self.get_snapshot().time_left
+    
+    def get_next_transition(self, now: Optional[datetime] = None) -> datetime:
+        """Get the next moment at which the displayed state can change.
+
+        This covers state boundaries (break window opens, lunch starts or
+        ends, workday ends, the next day takes over) as well as the moments at
+        which the minute counts and progress shown by ``get_current_state``
+        tick over.
+
+        Args:
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Time of the next boundary, the ``valid_until`` of the snapshot
+        """
+        return self.get_snapshot(now).valid_until
+    
+    def get_next_state_change(self, now: Optional[datetime] = None) -> datetime:
+        """Get the next moment at which the break state itself can change.
+        
+        Unlike ``get_next_transition`` this skips minute ticks within a state.
+        
+        Args:
+            now: Reference time, defaults to the current time
+            
+        Returns:
+            Time of the next state boundary or day rollover
+        """
+        if now is None:
+            now = self.clock.now()
+        segment_end = self._activate(now).segment_at(now).end
+        return min(segment_end, self._active_span[1])
     
     def is_workday_complete(self) -> bool:
         """Check if the workday is complete.
@@ -238,4 +458,5 @@ class BreakLogic:
         Returns:
             True if workday is over, False otherwise
         """
-        return datetime.now() >= self.workday_end
\ No newline at end of file
+        now = self.clock.now()
+        return now >= self._activate(now).workday_end
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""Injectable time sources."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+
+
+class Clock(ABC):
+    """Source of the current local time."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Get the current time.
+
+        Returns:
+            Current naive local datetime
+        """
+
+
+class SystemClock(Clock):
+    """Clock that reads the system wall clock."""
+
+    def now(self) -> datetime:
+        """Get the current system time."""
+        return datetime.now()
+
+
+class VirtualClock(Clock):
+    """Manually driven clock for simulations and tests."""
+
+    def __init__(self, start: datetime):
+        """Initialize the clock.
+
+        Args:
+            start: Initial time
+        """
+        self._now = start
+
+    def now(self) -> datetime:
+        """Get the current virtual time."""
+        return self._now
+
+    def set(self, moment: datetime) -> None:
+        """Jump to a given time.
+
+        Args:
+            moment: New current time
+        """
+        self._now = moment
+
+    def advance(self, delta: timedelta) -> None:
+        """Move the clock forward.
+
+        Args:
+            delta: Amount of time to advance
+        """
+        self._now += delta
@@ -2,33 +2,361 @@
 
 import json
 import os
-from typing import Dict, Any
+import threading
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, Mapping, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows has no advisory locks; writes stay atomic
+    fcntl = None
+
+from .migrations import CONFIG_VERSION, VERSION_KEY, migrate, needs_migration
+from .schema import SCHEMA, ConfigValidationError
+
+
+# Configuration layers, from lowest to highest precedence
+LAYERS = ("defaults", "system", "user", "env", "cli")
+
+# Organization-wide settings, e.g. rolled out by configuration management
+SYSTEM_CONFIG_FILE = "/etc/break_reminder/config.json"
+
+# Environment variables named BREAK_REMINDER_<KEY> override settings
+ENV_PREFIX = "BREAK_REMINDER_"
+
+# Entry of the config file holding the modification stamp of each setting
+STAMPS_KEY = "_stamps"
+
+# Marks a setting removed by a change in ``merge_into_file``
+REMOVED = object()
+
+
+def parse_setting(text: str) -> Any:
+    """Parse a setting given as text on the command line or in the environment.
+    
+    JSON values such as ``30``, ``true`` or ``["mon", "tue"]`` are decoded,
+    anything else is taken as a plain string, so "09:00" needs no quotes.
+    
+    Args:
+        text: Value as text
+        
+    Returns:
+        Decoded value
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def environment_overrides(environ: Mapping[str, str]) -> Dict[str, Any]:
+    """Get the settings overridden by ``BREAK_REMINDER_*`` environment variables.
+    
+    Args:
+        environ: Environment, e.g. ``os.environ``
+        
+    Returns:
+        Overridden settings; variables that name no known setting are ignored
+    """
+    overrides = {}
+    for name, text in environ.items():
+        if name.startswith(ENV_PREFIX):
+            key = name[len(ENV_PREFIX):].lower()
+            if key in SCHEMA:
+                overrides[key] = parse_setting(text)
+    return overrides
+
+
+def parse_overrides(pairs: Iterable[str]) -> Dict[str, Any]:
+    """Parse ``KEY=VALUE`` command-line overrides.
+    
+    Args:
+        pairs: Overrides as given on the command line
+        
+    Returns:
+        Overridden settings
+    """
+    overrides = {}
+    for pair in pairs:
+        key, sep, text = pair.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Expected KEY=VALUE, got {pair!r}")
+        overrides[key.strip()] = parse_setting(text)
+    return overrides
+
+
+def diff_configs(old: Mapping[str, Any], new: Mapping[str, Any]) -> Set[str]:
+    """Get the keys whose values differ between two configurations.
+    
+    Args:
+        old: Previous configuration
+        new: Current configuration
+        
+    Returns:
+        Keys that were added, removed or changed
+    """
+    missing = object()
+    return {key for key in old.keys() | new.keys()
+            if old.get(key, missing) != new.get(key, missing)}
+
+
+def atomic_write(path: str, text: str) -> None:
+    """Replace a file's contents so that readers never see a partial write.
+    
+    The text goes to a temporary file in the same directory, is flushed to
+    disk and then renamed over the target.
+    
+    Args:
+        path: File to write
+        text: New contents
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # Imported here to keep it out of quick read-only uses such as the status command
+    import tempfile
+
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Persist the rename itself where directories can be synced
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive advisory lock for a file across processes.
+    
+    The lock is taken on a separate ``<path>.lock`` file, because the file
+    itself is replaced on every write. Where ``fcntl`` is not available
+    this does nothing.
+    
+    Args:
+        path: File to lock
+    """
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd = os.open(path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def read_settings_file(path: str) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """Read a configuration file and its modification stamps.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        Tuple of (settings, or None if the file is missing or invalid,
+        stamp of each setting)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)
+    except (IOError, ValueError):
+        return None, {}
+    if not isinstance(loaded, dict):
+        return None, {}
+    stamps = loaded.pop(STAMPS_KEY, None)
+    return loaded, stamps if isinstance(stamps, dict) else {}
+
+
+def merge_into_file(path: str, changes: Mapping[str, Tuple[int, Any]]) -> Tuple[Dict[str, Any], float]:
+    """Apply changes to a configuration file shared with other processes.
+    
+    Under the file lock, the file is read, each change is applied unless
+    the file already holds a newer change of the same setting, and the
+    result is written back atomically. Settings that were not changed keep
+    whatever other processes wrote. A new file is marked with the current
+    format version, so that loading it never runs the migrations.
+    
+    Args:
+        path: Configuration file
+        changes: Modification stamp (``time.time_ns()``) and new value of
+            each changed setting; ``REMOVED`` removes the setting
+            
+    Returns:
+        Tuple of (settings now in the file, seconds the lock was held)
+    """
+    with file_lock(path):
+        locked = time.perf_counter()
+        settings, stamps = read_settings_file(path)
+        if not settings:
+            settings = {VERSION_KEY: CONFIG_VERSION}
+            stamps = {VERSION_KEY: time.time_ns()}
+        for key, (stamp, value) in changes.items():
+            if stamps.get(key, 0) > stamp:
+                continue
+            if value is REMOVED:
+                settings.pop(key, None)
+            else:
+                settings[key] = value
+            stamps[key] = stamp
+        stamps = {key: stamp for key, stamp in stamps.items() if key in settings or key in changes}
+        write_settings_file(path, settings, stamps)
+        held = time.perf_counter() - locked
+    return settings, held
+
+
+def write_settings_file(path: str, settings: Mapping[str, Any], stamps: Mapping[str, int]) -> None:
+    """Write settings and their modification stamps atomically.
+    
+    Hold ``file_lock`` while calling this if other processes may write too.
+    
+    Args:
+        path: Configuration file
+        settings: Settings to write
+        stamps: Modification stamp of each setting
+    """
+    text = json.dumps(dict(settings, **{STAMPS_KEY: dict(stamps)}), indent=2, ensure_ascii=False)
+    atomic_write(path, text)
 
 
 class ConfigManager:
-    """Manages application configuration with persistence."""
+    """Manages application configuration with persistence.
+    
+    Settings come from layers, each overriding the ones before it: built-in
+    defaults, the system-wide file, the user file, ``BREAK_REMINDER_*``
+    environment variables and command-line overrides. The merged values are
+    kept precomputed, so lookups are plain dictionary hits, and are rebuilt
+    only when a layer changes. ``set`` and ``update`` change the user layer,
+    which is the only one ever saved.
+    
+    The merged view is never modified in place: every change swaps in a new
+    dictionary and increments ``version``. ``snapshot`` hands out a read-only
+    proxy of the current view, which callers can share and keep without
+    copying, and ``changed_since`` tells whether anything changed after a
+    given version.
+    
+    Every value is checked against ``SCHEMA`` when it is loaded or set, and
+    its typed form (``datetime.time``, ``timedelta``, ...) is cached for
+    ``get_typed`` and ``typed_snapshot``; the schedule is compiled from the
+    latter. Invalid values fall back to the layer below and are reported in
+    ``field_errors``.
     
-    def __init__(self, config_file: str = None):
+    ``save`` writes synchronously. ``save_deferred`` coalesces bursts of
+    changes and writes them on a background thread once no new change has
+    arrived for ``save_delay`` seconds; call ``flush`` before exiting. Both
+    replace the file atomically.
+    
+    Other processes may write the same file. Saving therefore only writes
+    the settings changed here, merged into the file under an advisory lock
+    (see ``merge_into_file``), and the newest change of a setting wins.
+    """
+    
+    # Quiet period before a deferred save is written, in seconds
+    SAVE_DELAY = 0.5
+    
+    def __init__(self, config_file: str = None, save_delay: float = SAVE_DELAY,
+                 system_file: Optional[str] = SYSTEM_CONFIG_FILE,
+                 environ: Optional[Mapping[str, str]] = None,
+                 overrides: Optional[Mapping[str, Any]] = None, read_only: bool = False):
         """Initialize configuration manager.
         
         Args:
             config_file: Path to configuration file. If None, uses default location.
+            save_delay: Quiet period before a deferred save is written, in seconds
+            system_file: Path to the system-wide configuration file, or None
+            environ: Environment to read overrides from, defaults to ``os.environ``
+            overrides: Command-line overrides
+            read_only: Leave the files on disk as they are when loading:
+                invalid files stay in place and old formats are upgraded
+                in memory only
         """
         if config_file is None:
             config_file = os.path.join(os.path.expanduser("~"), ".break_reminder_config.json")
         
         self.config_file = config_file
-        self._config = self._load_default_config()
+        self.system_file = system_file
+        self.save_delay = save_delay
+        self.read_only = read_only
+        # Description of the last load failure, if any
+        self.load_error: Optional[str] = None
+        # Settings of the file that were invalid, with their errors
+        self.field_errors: Dict[str, ConfigValidationError] = {}
+        # Format version the user file was upgraded from by the last load
+        self.migrated_from: Optional[int] = None
+        
+        # Guards the values against a concurrent background write
+        self._lock = threading.RLock()
+        # Serializes writes so that the newest snapshot always lands last
+        self._write_lock = threading.Lock()
+        self._save_pending = threading.Condition(self._lock)
+        self._save_due: Optional[float] = None
+        self._writing = False
+        self._writer: Optional[threading.Thread] = None
+        # Unsaved changes of the user layer: stamp and value per setting
+        self._pending: Dict[str, Tuple[int, Any]] = {}
+        # Seconds the file lock was held by the last save
+        self.last_lock_hold: Optional[float] = None
+        
+        # Raw and typed values of each layer, and the merged view
+        self._layers: Dict[str, Dict[str, Any]] = {name: {} for name in LAYERS}
+        self._typed_layers: Dict[str, Dict[str, Any]] = {name: {} for name in LAYERS}
+        self._config: Dict[str, Any] = {}
+        self._typed: Dict[str, Any] = {}
+        self._sources: Dict[str, str] = {}
+        # Incremented whenever the merged view changes
+        self.version = 0
+        self._snapshot: Mapping[str, Any] = MappingProxyType(self._config)
+        self._typed_snapshot: Mapping[str, Any] = MappingProxyType(self._typed)
+        
+        self._assign("defaults", self._load_default_config())
+        # Invalid overrides are reported along with those of the files
+        self._override_errors = self._assign("env", environment_overrides(os.environ if environ is None else environ))
+        self._override_errors.update(self._assign("cli", overrides or {}))
         self.load()
     
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration values."""
         return {
+            "config_version": CONFIG_VERSION,
             "usual_start": "08:00",
             "lunch_start": "10:45", 
             "lunch_end": "12:30",
             "workday_length": "08:00",
             "break_points": [0.25, 0.75],  # 1/4 and 3/4 of workday
+            "break_policy": "points",  # points, cycle
+            "cycle_work_minutes": 25,
+            "cycle_break_minutes": 5,
+            "cycle_long_break_minutes": 15,
+            "cycle_long_break_every": 4,  # cycles per long break, 0 disables
+            "min_break_spacing": 0,  # minutes between breaks
+            "shift_breaks_for_lunch": False,
+            "snooze_minutes": 5,
+            "workdays": ["mon", "tue", "wed", "thu", "fri", "sat", "sun"],
+            "holidays": [],  # ISO dates, e.g. "2025-12-24"
+            "weekday_overrides": {},  # e.g. {"fri": {"workday_length": "06:00"}}
+            "reminders": [],  # e.g. [{"name": "Eye rest", "every_minutes": 20, "quiet": [["11:00", "12:00"]]}]
             "theme": "dark",  # dark, light, auto
             "auto_close_delay": 30,  # minutes
             "window_position": "top-right",  # top-right, top-left, bottom-right, bottom-left
@@ -36,30 +364,347 @@ class ConfigManager:
             "sound_enabled": False,
             "minimize_to_tray": True,
             "start_minimized": False,
+            "release_widget_after": 10,  # minutes hidden before the window is freed, 0 keeps it
             "debug_mode": False
         }
     
     def load(self) -> None:
-        """Load configuration from file."""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    self._config.update(loaded_config)
-            except (json.JSONDecodeError, IOError):
-                # If file is corrupted or unreadable, use defaults
-                pass
+        """Load the system-wide and user configuration files.
+        
+        A user file that cannot be parsed is moved aside to ``<file>.corrupt``
+        so that it is neither lost nor overwritten by the next save, and the
+        layers below it are used. ``load_error`` describes what went wrong.
+        A read-only manager leaves such a file in place and upgrades an old
+        format without saving it.
+        """
+        self.load_error = None
+        self.migrated_from = None
+        errors = dict(self._override_errors)
+        if self.system_file:
+            errors.update(self._assign("system", self._read_layer_file(self.system_file) or {}))
+        user = self._read_layer_file(self.config_file, quarantine=not self.read_only)
+        if user is not None and needs_migration(user):
+            if self.read_only:
+                user, self.migrated_from = migrate(user, self._load_default_config())
+            else:
+                user = self._upgrade_user_file(user)
+        errors.update(self._assign("user", user or {}))
+        self.field_errors = errors
+        self._rebuild()
     
-    def save(self) -> None:
-        """Save configuration to file."""
+    def _upgrade_user_file(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Upgrade the user file to the current format and save the result.
+        
+        The upgraded file carries the current ``config_version``, so later
+        loads skip this step. If the file cannot be written, the upgrade is
+        applied in memory and tried again on the next load.
+        
+        Args:
+            settings: Settings read from the user file
+            
+        Returns:
+            Upgraded settings
+        """
+        defaults = self._load_default_config()
         try:
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            with file_lock(self.config_file):
+                current, stamps = read_settings_file(self.config_file)
+                if current is None or not needs_migration(current):
+                    # Another process upgraded the file in the meantime
+                    return current if current is not None else settings
+                upgraded, self.migrated_from = migrate(current, defaults)
+                stamp = time.time_ns()
+                stamps = {key: value for key, value in stamps.items() if key in upgraded}
+                stamps.update((key, stamp) for key, value in upgraded.items()
+                              if current.get(key, REMOVED) != value)
+                write_settings_file(self.config_file, upgraded, stamps)
+                return upgraded
         except IOError:
-            # If save fails, continue without saving
-            pass
+            upgraded, self.migrated_from = migrate(settings, defaults)
+            return upgraded
+    
+    def _read_layer_file(self, path: str, quarantine: bool = False) -> Optional[Dict[str, Any]]:
+        """Read the settings of one configuration file.
+        
+        Args:
+            path: File to read
+            quarantine: Move an invalid file aside
+            
+        Returns:
+            Parsed settings, or None if the file is missing or invalid
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                loaded_config = json.load(f)
+            if not isinstance(loaded_config, dict):
+                raise ValueError("top level is not an object")
+            loaded_config.pop(STAMPS_KEY, None)
+        except IOError as e:
+            # If file is unreadable, use the layers below
+            self.load_error = f"Could not read {path}: {e}"
+            return None
+        except ValueError as e:
+            backup = path + ".corrupt" if quarantine else None
+            if backup:
+                try:
+                    os.replace(path, backup)
+                except OSError:
+                    backup = None
+            self.load_error = f"Invalid configuration in {path}: {e}"
+            if backup:
+                self.load_error += f" (moved to {backup})"
+            return None
+        return loaded_config
+    
+    def _assign(self, layer: str, values: Mapping[str, Any],
+                keep_invalid: bool = False) -> Dict[str, ConfigValidationError]:
+        """Replace the values of a layer without rebuilding the merged view.
+        
+        Args:
+            layer: Layer name
+            values: New raw values of the layer
+            keep_invalid: Keep the layer's current value of invalid settings
+                instead of dropping them
+                
+        Returns:
+            Error of each invalid setting
+        """
+        raw, typed, errors = self._validated_layer(layer, values, keep_invalid)
+        with self._lock:
+            self._layers[layer] = raw
+            self._typed_layers[layer] = typed
+        return errors
+    
+    def _validated_layer(self, layer: str, values: Mapping[str, Any], keep_invalid: bool
+                         ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, ConfigValidationError]]:
+        """Validate the new values of a layer.
+        
+        Unsaved changes of the user layer are kept on top of new values.
+        Called from the watcher thread too, so the layer is read under the
+        lock, where ``set`` cannot be halfway through changing it.
+        """
+        with self._lock:
+            typed, errors = SCHEMA.convert_all(values)
+            raw = {key: values[key] for key in typed}
+            current, current_typed = self._layers[layer], self._typed_layers[layer]
+            kept = set(errors) if keep_invalid else set()
+            if layer == "user":
+                kept.update(self._pending)
+            for key in kept:
+                if key in current:
+                    raw[key] = current[key]
+                    typed[key] = current_typed[key]
+                elif key in self._pending:
+                    raw.pop(key, None)
+                    typed.pop(key, None)
+            return raw, typed, errors
+    
+    @staticmethod
+    def _merge(layers: Mapping[str, Mapping[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Merge layers into one view, recording where each value came from."""
+        merged, sources = {}, {}
+        for name in LAYERS:
+            merged.update(layers[name])
+            sources.update(dict.fromkeys(layers[name], name))
+        return merged, sources
+    
+    def _rebuild(self) -> Set[str]:
+        """Rebuild the merged view after a layer changed.
+        
+        Returns:
+            Keys whose merged values changed
+        """
+        with self._lock:
+            merged, sources = self._merge(self._layers)
+            typed = {key: self._typed_layers[source][key] for key, source in sources.items()}
+            return self._publish(merged, typed, sources)
+    
+    def _refresh(self, keys: Iterable[str]) -> Set[str]:
+        """Update the merged view for keys changed in one layer.
+        
+        Returns:
+            Keys whose merged values changed
+        """
+        with self._lock:
+            merged, typed, sources = dict(self._config), dict(self._typed), dict(self._sources)
+            for key in keys:
+                for name in reversed(LAYERS):
+                    if key in self._layers[name]:
+                        merged[key] = self._layers[name][key]
+                        typed[key] = self._typed_layers[name][key]
+                        sources[key] = name
+                        break
+                else:
+                    # No layer holds the key anymore
+                    merged.pop(key, None)
+                    typed.pop(key, None)
+                    sources.pop(key, None)
+            return self._publish(merged, typed, sources)
+    
+    def _publish(self, merged: Dict[str, Any], typed: Dict[str, Any], sources: Dict[str, str]) -> Set[str]:
+        """Swap in a new merged view, moving to a new version if it differs.
+        
+        Complete dictionaries are swapped in, so lock-free readers never see
+        a half-built view and earlier snapshots stay unchanged.
+        """
+        changed = diff_configs(self._config, merged)
+        self._sources = sources
+        if changed:
+            self._typed = typed
+            self._typed_snapshot = MappingProxyType(typed)
+            self._config = merged
+            self._snapshot = MappingProxyType(merged)
+            self.version += 1
+        return changed
+    
+    def set_layer(self, layer: str, values: Mapping[str, Any]) -> Set[str]:
+        """Replace all values of one layer, e.g. after the user file changed.
+        
+        Invalid values keep the layer's current value and are reported in
+        ``field_errors``.
+        
+        Args:
+            layer: Layer name, one of ``LAYERS``
+            values: New raw values of the layer
+            
+        Returns:
+            Keys whose merged values changed
+        """
+        if layer not in LAYERS:
+            raise ValueError(f"Unknown configuration layer: {layer}")
+        self.field_errors = self._assign(layer, values, keep_invalid=True)
+        return self._rebuild()
+    
+    def source_of(self, key: str) -> Optional[str]:
+        """Get the layer a configuration value comes from.
+        
+        Args:
+            key: Configuration key
+            
+        Returns:
+            Layer name, one of ``LAYERS``, or None if the key is not set
+        """
+        return self._sources.get(key)
+    
+    def read_file(self) -> Optional[Dict[str, Any]]:
+        """Parse the configuration file without applying it.
+        
+        Unlike ``load`` this leaves an invalid file in place, since another
+        program may still be writing it. A read-only manager upgrades an
+        old format in memory, as ``load`` does.
+        
+        Returns:
+            Parsed settings, or None if the file is missing or invalid
+        """
+        loaded = read_settings_file(self.config_file)[0]
+        if self.read_only and loaded is not None and needs_migration(loaded):
+            loaded = migrate(loaded, self._load_default_config())[0]
+        return loaded
+    
+    def external_changes(self, loaded_config: Mapping[str, Any]) -> Dict[str, Any]:
+        """Get the changes to the user layer if the user file were reloaded.
+        
+        This does the validation and the comparison, so it can run on the
+        thread that noticed the change; ``apply_external_changes`` then only
+        swaps in the result. Invalid values and unsaved changes keep their
+        current value; the errors are reported in ``field_errors``.
+        
+        Args:
+            loaded_config: Settings as returned by ``read_file``
+            
+        Returns:
+            Raw and typed value of each added or changed setting, and
+            ``REMOVED`` for each setting missing from the file
+        """
+        raw, typed, self.field_errors = self._validated_layer("user", loaded_config, keep_invalid=True)
+        with self._lock:
+            current = self._layers["user"]
+            changes: Dict[str, Any] = {key: (raw[key], typed[key]) for key in raw
+                                       if current.get(key, REMOVED) != raw[key]}
+            changes.update((key, REMOVED) for key in current if key not in raw)
+        return changes
+    
+    def apply_external_changes(self, changes: Mapping[str, Any]) -> Set[str]:
+        """Apply changes to the user layer computed by ``external_changes``.
+        
+        Settings changed here since then keep their unsaved value.
+        
+        Args:
+            changes: Changes as returned by ``external_changes``
+            
+        Returns:
+            Keys whose merged values changed
+        """
+        with self._lock:
+            user, typed_user = self._layers["user"], self._typed_layers["user"]
+            for key, change in changes.items():
+                if key in self._pending:
+                    continue
+                if change is REMOVED:
+                    user.pop(key, None)
+                    typed_user.pop(key, None)
+                else:
+                    user[key], typed_user[key] = change
+            return self._refresh(changes)
+    
+    def save(self) -> None:
+        """Save configuration to file right away."""
+        with self._lock:
+            self._save_due = None
+        self._write()
+    
+    def save_deferred(self) -> None:
+        """Save configuration to file in the background.
+        
+        Calls in quick succession result in a single write.
+        """
+        with self._lock:
+            self._save_due = time.monotonic() + self.save_delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="config-writer",
+                                                daemon=True)
+                self._writer.start()
+            self._save_pending.notify()
+    
+    def flush(self) -> None:
+        """Write any deferred save now and wait until it is on disk."""
+        with self._lock:
+            pending = self._save_due is not None
+            self._save_due = None
+            while self._writing:
+                self._save_pending.wait()
+        if pending:
+            self._write()
+    
+    def _write_behind(self) -> None:
+        """Background thread writing deferred saves."""
+        while True:
+            with self._lock:
+                while self._save_due is None or time.monotonic() < self._save_due:
+                    timeout = None if self._save_due is None else self._save_due - time.monotonic()
+                    self._save_pending.wait(timeout)
+                self._save_due = None
+                self._writing = True
+            try:
+                self._write()
+            finally:
+                with self._lock:
+                    self._writing = False
+                    self._save_pending.notify_all()
+    
+    def _write(self) -> None:
+        """Merge the unsaved changes of the user layer into the file."""
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            try:
+                self.last_lock_hold = merge_into_file(self.config_file, pending)[1]
+            except IOError:
+                # If save fails, keep the changes for the next attempt
+                with self._lock:
+                    self._pending = dict(pending, **self._pending)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value.
@@ -73,31 +718,125 @@ class ConfigManager:
         """
         return self._config.get(key, default)
     
+    def get_typed(self, key: str, default: Any = None) -> Any:
+        """Get the validated, converted form of a configuration value.
+        
+        Args:
+            key: Configuration key
+            default: Default value if key doesn't exist
+            
+        Returns:
+            Typed value, e.g. ``datetime.time`` for "usual_start", or default
+        """
+        return self._typed.get(key, default)
+    
     def set(self, key: str, value: Any) -> None:
-        """Set configuration value.
+        """Set configuration value in the user layer.
+        
+        Environment and command-line overrides of the key keep precedence.
+        Setting the value the user layer already holds changes nothing, so
+        the change of another process is not outdated by a newer stamp.
         
         Args:
             key: Configuration key
             value: Value to set
+            
+        Raises:
+            ConfigValidationError: If the value does not match the schema
         """
-        self._config[key] = value
+        typed = SCHEMA.convert(key, value)
+        with self._lock:
+            if self._layers["user"].get(key, REMOVED) == value:
+                return
+            self._layers["user"][key] = value
+            self._typed_layers["user"][key] = typed
+            self._pending[key] = (time.time_ns(), value)
+            self._refresh((key,))
     
     def update(self, config_dict: Dict[str, Any]) -> None:
-        """Update multiple configuration values.
+        """Update multiple configuration values in the user layer.
+        
+        Nothing is changed if any of the values is invalid.
         
         Args:
             config_dict: Dictionary of configuration values to update
+            
+        Raises:
+            ConfigValidationError: If a value does not match the schema
         """
-        self._config.update(config_dict)
+        typed, errors = SCHEMA.convert_all(config_dict)
+        if errors:
+            raise next(iter(errors.values()))
+        with self._lock:
+            # Values the user layer already holds are not stamped again
+            config_dict = {key: value for key, value in config_dict.items()
+                           if self._layers["user"].get(key, REMOVED) != value}
+            self._layers["user"].update(config_dict)
+            self._typed_layers["user"].update((key, typed[key]) for key in config_dict)
+            stamp = time.time_ns()
+            self._pending.update((key, (stamp, value)) for key, value in config_dict.items())
+            self._refresh(config_dict)
     
     def get_all(self) -> Dict[str, Any]:
-        """Get all configuration values.
+        """Get a private, modifiable copy of all configuration values.
         
         Returns:
             Dictionary of all configuration values
         """
-        return self._config.copy()
+        with self._lock:
+            return self._config.copy()
+    
+    def snapshot(self) -> Mapping[str, Any]:
+        """Get a read-only view of all configuration values.
+        
+        The view is shared rather than copied and never changes; later
+        changes produce a new snapshot.
+        
+        Returns:
+            Read-only mapping of all configuration values
+        """
+        return self._snapshot
+    
+    def typed_snapshot(self) -> Mapping[str, Any]:
+        """Get a read-only view of all values in their typed form.
+        
+        It belongs to the same version as ``snapshot`` and is shared the
+        same way.
+        
+        Returns:
+            Read-only mapping of the typed configuration values
+        """
+        return self._typed_snapshot
+    
+    def changed_since(self, version: int) -> bool:
+        """Check whether the configuration changed after a given version.
+        
+        Args:
+            version: Value of ``version`` seen earlier
+            
+        Returns:
+            True if any value changed since then
+        """
+        return self.version != version
+    
+    def changed_keys(self, previous: Mapping[str, Any]) -> Set[str]:
+        """Get the keys that changed since an earlier snapshot or copy.
+        
+        Args:
+            previous: Configuration as returned by ``snapshot`` or ``get_all`` earlier
+            
+        Returns:
+            Keys whose values differ from the current configuration
+        """
+        return diff_configs(previous, self._config)
     
     def reset_to_defaults(self) -> None:
-        """Reset configuration to default values."""
-        self._config = self._load_default_config()
\ No newline at end of file
+        """Reset configuration to default values by clearing the user layer."""
+        with self._lock:
+            stamp = time.time_ns()
+            # The format version stays, so the file is not upgraded again
+            self._pending = {key: (stamp, REMOVED) for key in self._layers["user"] if key != VERSION_KEY}
+            self._layers["user"] = {key: value for key, value in self._layers["user"].items() if key == VERSION_KEY}
+            self._typed_layers["user"] = {key: value for key, value in self._typed_layers["user"].items()
+                                          if key == VERSION_KEY}
+            self._rebuild()
\ No newline at end of file
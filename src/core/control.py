@@ -0,0 +1,218 @@
+"""Control channel of the running instance, usable without Qt.
+
+The running app listens on a local socket. Each request is one line with a
+command name and is answered with one line of JSON, e.g.
+``{"ok": true, "status": {...}}`` or ``{"ok": false, "error": "..."}``.
+A connection may carry any number of requests.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Commands understood by the running instance
+COMMANDS = ("show", "hide", "settings", "reload", "status", "quit")
+
+SOCKET_NAME = "break_reminder.sock"
+
+
+def runtime_path(name: str) -> str:
+    """Get the path of a per-user runtime file.
+
+    Args:
+        name: File name
+
+    Returns:
+        Path under ``$XDG_RUNTIME_DIR``, or a per-user path in the temporary
+        directory
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, name)
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    temp_dir = os.environ.get("TMPDIR") or os.environ.get("TEMP") or "/tmp"
+    return os.path.join(temp_dir, f"{name}-{user}")
+
+
+def control_socket_path() -> str:
+    """Get the address of the control socket for the current user.
+
+    Returns:
+        Socket path from ``runtime_path``; on Windows a per-user pipe name
+    """
+    if hasattr(os, "getuid"):
+        return runtime_path(SOCKET_NAME)
+    return f"{SOCKET_NAME}-{os.environ.get('USERNAME', 'user')}"
+
+
+def encode_reply(reply: Dict[str, Any]) -> bytes:
+    """Encode a reply as one line of JSON.
+
+    Args:
+        reply: Reply with at least the ``ok`` key
+
+    Returns:
+        Encoded line
+    """
+    return json.dumps(reply, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def status_text(snapshot) -> str:
+    """Describe a break state snapshot in one short line.
+
+    Args:
+        snapshot: ``StateSnapshot`` of the break logic
+
+    Returns:
+        Next event and the minutes until it, e.g. "Break in 12 minutes"
+    """
+    if snapshot.time_left > 0:
+        return f"{snapshot.next_event} in {snapshot.time_left} minutes"
+    return snapshot.next_event
+
+
+def status_of(snapshot) -> Dict[str, Any]:
+    """Describe a break state snapshot for the ``status`` command.
+
+    Args:
+        snapshot: ``StateSnapshot`` of the break logic
+
+    Returns:
+        JSON serializable dictionary
+    """
+    next_break = snapshot.next_break
+    return {
+        "state": snapshot.state.value,
+        "message": snapshot.message,
+        "next_event": snapshot.next_event,
+        "time_left": snapshot.time_left,
+        "progress_percent": snapshot.progress_percent,
+        "next_break": None if next_break is None else next_break.isoformat(timespec="seconds"),
+        "target": snapshot.target.isoformat(timespec="seconds"),
+        "state_until": snapshot.state_until.isoformat(timespec="seconds"),
+        "valid_until": snapshot.valid_until.isoformat(timespec="seconds"),
+    }
+
+
+class ControlClient:
+    """Connection to the control socket of the running instance.
+
+    Keeping the client open avoids reconnecting for every command.
+    """
+
+    def __init__(self, path: Optional[str] = None, timeout: float = 2.0):
+        """Connect to the running instance.
+
+        Args:
+            path: Socket path, defaults to ``control_socket_path()``
+            timeout: Seconds to wait for connecting and for each reply
+
+        Raises:
+            OSError: If no instance is listening
+        """
+        # Imported here so that the status command does not pay for it
+        import socket
+
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("The control socket needs Unix domain sockets")
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self._buffer = b""
+        try:
+            self.sock.connect(path or control_socket_path())
+        except OSError:
+            self.sock.close()
+            raise
+
+    def send(self, command: str) -> Dict[str, Any]:
+        """Send a command and wait for the reply.
+
+        Args:
+            command: One of ``COMMANDS``
+
+        Returns:
+            Decoded reply
+        """
+        self.sock.sendall(command.encode("utf-8") + b"\n")
+        while b"\n" not in self._buffer:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("The running instance closed the connection")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.sock.close()
+
+    def __enter__(self) -> "ControlClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def send_command(command: str, path: Optional[str] = None, timeout: float = 2.0) -> Dict[str, Any]:
+    """Send one command to the running instance.
+
+    Args:
+        command: One of ``COMMANDS``
+        path: Socket path, defaults to ``control_socket_path()``
+        timeout: Seconds to wait for connecting and for the reply
+
+    Returns:
+        Decoded reply
+
+    Raises:
+        OSError: If no instance is listening
+    """
+    with ControlClient(path, timeout) as client:
+        return client.send(command)
+
+
+class InstanceLock:
+    """Advisory lock held by the instance that owns the control socket.
+
+    It closes the race between two launches that both find no running
+    instance. Where ``fcntl`` is not available the lock always succeeds.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the lock.
+
+        Args:
+            path: Lock file
+        """
+        self.path = path
+        self.fd = None
+
+    def acquire(self) -> bool:
+        """Try to take the lock without waiting.
+
+        Returns:
+            True if this process now holds the lock
+        """
+        if fcntl is None or self.fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self.fd = fd
+        return True
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self.fd is not None:
+            # Closing the descriptor releases the lock
+            os.close(self.fd)
+            self.fd = None
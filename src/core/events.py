@@ -0,0 +1,88 @@
+"""Priority queue of pending timed events."""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class EventQueue:
+    """Timed events in a heap, each identified by a key.
+
+    Pushing an existing key reschedules it and cancelling a key only marks
+    its heap entry as removed, so both are O(log n). Removed entries are
+    discarded once they reach the top of the heap.
+    """
+
+    _REMOVED = object()
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._heap: List[list] = []
+        self._entries: Dict[Hashable, list] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def push(self, key: Hashable, at: datetime, payload: Any = None) -> None:
+        """Schedule an event, replacing any pending event with the same key.
+
+        Args:
+            key: Event identifier
+            at: Time of the event
+            payload: Data returned with the event
+        """
+        self.cancel(key)
+        entry = [at, next(self._counter), key, payload]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Remove a pending event.
+
+        Args:
+            key: Event identifier
+
+        Returns:
+            True if the event was pending
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[3] = self._REMOVED
+        return True
+
+    def _discard_removed(self) -> None:
+        """Drop cancelled entries from the top of the heap."""
+        heap = self._heap
+        while heap and heap[0][3] is self._REMOVED:
+            heapq.heappop(heap)
+
+    def peek(self) -> Optional[Tuple[datetime, Hashable, Any]]:
+        """Get the earliest pending event without removing it.
+
+        Returns:
+            Tuple of (time, key, payload), or None if the queue is empty
+        """
+        self._discard_removed()
+        if not self._heap:
+            return None
+        at, _, key, payload = self._heap[0]
+        return at, key, payload
+
+    def pop(self) -> Tuple[datetime, Hashable, Any]:
+        """Remove and return the earliest pending event.
+
+        Returns:
+            Tuple of (time, key, payload)
+        """
+        self._discard_removed()
+        if not self._heap:
+            raise IndexError("pop from an empty event queue")
+        at, _, key, payload = heapq.heappop(self._heap)
+        del self._entries[key]
+        return at, key, payload
@@ -0,0 +1,280 @@
+"""Vectorized break state evaluation for many schedules at once.
+
+Requires: pip install numpy
+"""
+
+from datetime import date
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from .schedule import ScheduleCompiler
+from .timeline import BreakState, DayTimeline
+
+
+# State codes used in evaluation results, indexed by code
+STATES = (BreakState.WORK, BreakState.BREAK, BreakState.LUNCH, BreakState.DONE)
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+_WORK, _BREAK, _LUNCH, _DONE = range(len(STATES))
+_MINUTE_US = 60 * 1000 * 1000
+_PADDING = np.iinfo(np.int64).max
+_MAX_BREAKS = np.iinfo(np.int8).max
+
+
+def _to_us(values: Any) -> np.ndarray:
+    """Convert datetimes to int64 microseconds."""
+    return np.asarray(values, dtype='datetime64[us]').astype(np.int64)
+
+
+class FleetState(NamedTuple):
+    """Evaluation results, one row per schedule and one column per timestamp."""
+    states: np.ndarray  # uint8 state codes, see STATES
+    time_left: np.ndarray  # int32 minutes until the next event
+    progress_percent: np.ndarray  # uint8 progress (0-100)
+
+
+class FleetSchedule:
+    """Day schedules of many users packed into NumPy arrays.
+
+    All times are stored as int64 microseconds. Break times are sorted per
+    row and padded on the right so that every row has the same width.
+    """
+
+    def __init__(self, start_times: Any, lunch_starts: Any, lunch_ends: Any,
+                 workday_ends: Any, break_times: Sequence[Sequence[Any]]):
+        """Pack schedules into arrays.
+
+        Args:
+            start_times: Start of each workday
+            lunch_starts: Start of each lunch break
+            lunch_ends: End of each lunch break
+            workday_ends: End of each workday
+            break_times: Break times of each schedule, may differ in length
+        """
+        self.start = _to_us(start_times)
+        self.lunch_start = _to_us(lunch_starts)
+        self.lunch_end = _to_us(lunch_ends)
+        self.workday_end = _to_us(workday_ends)
+
+        rows = len(self.start)
+        self.break_counts = np.array([len(row) for row in break_times], dtype=np.int64)
+        width = int(self.break_counts.max()) if rows else 0
+        if width > _MAX_BREAKS:
+            raise ValueError(f"At most {_MAX_BREAKS} breaks per schedule are supported")
+
+        # Each row holds [start, breaks..., end, padding...]. After passing
+        # k breaks, progress is measured from item k towards item k + 1.
+        self.breaks = np.full((rows, width), _PADDING, dtype=np.int64)
+        self.milestones = np.full((rows, width + 2), _PADDING, dtype=np.int64)
+        self.milestones[:, 0] = self.start
+        for row, times in enumerate(break_times):
+            count = len(times)
+            if count:
+                self.breaks[row, :count] = np.sort(_to_us(list(times)))
+            self.milestones[row, 1:count + 1] = self.breaks[row, :count]
+            self.milestones[row, count + 1] = self.workday_end[row]
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @classmethod
+    def from_timelines(cls, timelines: Iterable[DayTimeline]) -> "FleetSchedule":
+        """Pack compiled day timelines.
+
+        Args:
+            timelines: Timelines to pack
+
+        Returns:
+            Packed schedules
+        """
+        timelines = list(timelines)
+        if any(not brk.is_point for t in timelines for brk in t.breaks):
+            raise ValueError("Fleet evaluation supports break point schedules only")
+        return cls(
+            [t.start_time for t in timelines],
+            [t.lunch_start for t in timelines],
+            [t.lunch_end for t in timelines],
+            [t.workday_end for t in timelines],
+            [t.break_times for t in timelines],
+        )
+
+    @classmethod
+    def from_configs(cls, configs: Iterable[Mapping[str, Any]], day: date) -> "FleetSchedule":
+        """Compile and pack the schedules of many configurations for one day.
+
+        Args:
+            configs: Configuration dictionaries
+            day: Day to compile
+
+        Returns:
+            Packed schedules
+        """
+        return cls.from_timelines(ScheduleCompiler(config).timeline(day) for config in configs)
+
+
+def evaluate_fleet(schedule: FleetSchedule, timestamps: Any, chunk_size: int = 1 << 16) -> FleetState:
+    """Evaluate the break state of every schedule at every timestamp.
+
+    Results are identical to ``DayTimeline.state_at`` for each pair.
+
+    Args:
+        schedule: Packed schedules
+        timestamps: Datetimes, either one row shared by all schedules or one
+            row per schedule
+        chunk_size: Approximate number of cells evaluated per pass; small
+            chunks keep the temporaries in the CPU cache
+
+    Returns:
+        State codes, minutes left and progress percentages
+    """
+    now_us = _to_us(timestamps)
+    rows = len(schedule)
+    if now_us.ndim == 1:
+        now_us = np.broadcast_to(now_us, (rows, now_us.shape[0]))
+    columns = now_us.shape[1]
+
+    states = np.empty((rows, columns), dtype=np.uint8)
+    time_left = np.empty((rows, columns), dtype=np.int32)
+    progress = np.empty((rows, columns), dtype=np.uint8)
+    if rows == 0 or columns == 0:
+        return FleetState(states, time_left, progress)
+
+    # Work in float64 microseconds relative to a common base. Differences of
+    # up to centuries are exact integers in float64 and true division is
+    # correctly rounded, so flooring gives the same minutes as the scalar
+    # integer arithmetic.
+    base = int(now_us.min())
+    now = (now_us - base).astype(np.float64)
+    tables = _Tables(schedule, base)
+
+    step = min(rows, max(1, chunk_size // columns))
+    workspace = _Workspace((step, columns))
+    for first in range(0, rows, step):
+        block = slice(first, min(rows, first + step))
+        _evaluate_block(tables, workspace.view(block.stop - block.start), block, now[block],
+                        states[block], time_left[block], progress[block])
+
+    return FleetState(states, time_left, progress)
+
+
+class _Tables:
+    """Float64 copies of the schedule arrays, relative to a base time."""
+
+    def __init__(self, schedule: FleetSchedule, base: int):
+        def relative(values: np.ndarray) -> np.ndarray:
+            result = (values - base).astype(np.float64)
+            result[values == _PADDING] = np.inf
+            return result
+
+        column = (slice(None), None)
+        self.lunch_start = relative(schedule.lunch_start)[column]
+        self.lunch_end = relative(schedule.lunch_end)[column]
+        self.workday_end = relative(schedule.workday_end)[column]
+        self.break_counts = schedule.break_counts[column]
+        self.breaks = relative(schedule.breaks)
+
+        # Anchors and targets of each row, indexed by the number of breaks
+        # passed plus the row offset
+        milestones = relative(schedule.milestones)
+        anchors = milestones[:, :-1]
+        targets = milestones[:, 1:]
+        self.width = anchors.shape[1]
+        self.anchors = anchors.ravel()
+        self.targets = targets.ravel()
+
+        # A non-positive segment length means no progress; dividing by
+        # infinity yields the same zero without a separate branch
+        with np.errstate(invalid='ignore'):
+            minutes = np.floor((targets - anchors) / _MINUTE_US)
+        minutes[~np.isfinite(minutes) | (minutes <= 0)] = np.inf
+        self.segment_minutes = minutes.ravel()
+
+        self.lunch_minutes = np.floor((self.lunch_end - self.lunch_start) / _MINUTE_US)
+        self.lunch_divisor = np.where(self.lunch_minutes > 0, self.lunch_minutes, np.inf)
+
+
+class _Workspace:
+    """Scratch buffers reused by every block of an evaluation."""
+
+    def __init__(self, shape: Tuple[int, int]):
+        self.passed = np.empty(shape, dtype=np.int8)
+        self.index = np.empty(shape, dtype=np.intp)
+        self.left = np.empty(shape, dtype=np.float64)
+        self.percent = np.empty(shape, dtype=np.float64)
+        self.scratch = np.empty(shape, dtype=np.float64)
+        self.lunch_left = np.empty(shape, dtype=np.float64)
+        self.flag = np.empty(shape, dtype=bool)
+        self.in_break = np.empty(shape, dtype=bool)
+        self.in_lunch = np.empty(shape, dtype=bool)
+
+    def view(self, rows: int) -> "_Workspace":
+        """Get a workspace limited to the first rows of each buffer."""
+        if rows == len(self.passed):
+            return self
+        view = _Workspace.__new__(_Workspace)
+        for name, buffer in vars(self).items():
+            setattr(view, name, buffer[:rows])
+        return view
+
+
+def _evaluate_block(tables: _Tables, ws: _Workspace, block: slice, now: np.ndarray,
+                    states: np.ndarray, time_left: np.ndarray, progress: np.ndarray) -> None:
+    """Evaluate a block of rows in place."""
+    # Number of breaks strictly before now selects the countdown target;
+    # counting in int8 avoids a widening cast per break
+    passed = ws.passed
+    passed.fill(0)
+    for breaks in tables.breaks[block].T:
+        np.less(breaks[:, None], now, out=ws.flag)
+        passed += ws.flag.view(np.int8)
+    np.less(passed, tables.break_counts[block], out=ws.in_break)
+    index = ws.index
+    np.add(passed, (np.arange(block.start, block.stop) * tables.width)[:, None], out=index)
+
+    # Minutes left until the target
+    left = tables.targets.take(index, out=ws.left)
+    np.subtract(left, now, out=left)
+    left /= _MINUTE_US
+    np.floor(left, out=left)
+
+    # Progress from the anchor, clamped to 0-100
+    percent = tables.anchors.take(index, out=ws.percent)
+    np.subtract(now, percent, out=percent)
+    percent /= _MINUTE_US
+    np.floor(percent, out=percent)
+    percent /= tables.segment_minutes.take(index, out=ws.scratch)
+    percent *= 100
+    np.trunc(percent, out=percent)
+    np.clip(percent, 0, 100, out=percent)
+
+    # Break window opens once at most 5 whole minutes are left
+    np.less_equal(left, 5, out=ws.flag)
+    ws.in_break &= ws.flag
+    code = states
+    code[...] = ws.in_break
+
+    # Lunch takes precedence over breaks
+    in_lunch = np.greater_equal(now, tables.lunch_start[block], out=ws.in_lunch)
+    np.less_equal(now, tables.lunch_end[block], out=ws.flag)
+    in_lunch &= ws.flag
+    if in_lunch.any():
+        lunch_left = np.subtract(tables.lunch_end[block], now, out=ws.lunch_left)
+        lunch_left /= _MINUTE_US
+        np.floor(lunch_left, out=lunch_left)
+        lunch_percent = np.subtract(tables.lunch_minutes[block], lunch_left, out=ws.scratch)
+        lunch_percent /= tables.lunch_divisor[block]
+        lunch_percent *= 100
+        np.trunc(lunch_percent, out=lunch_percent)
+        np.copyto(code, _LUNCH, where=in_lunch)
+        np.copyto(left, lunch_left, where=in_lunch)
+        np.copyto(percent, lunch_percent, where=in_lunch)
+
+    # The end of the day takes precedence over everything
+    done = np.greater_equal(now, tables.workday_end[block], out=ws.flag)
+    np.copyto(code, _DONE, where=done)
+    np.copyto(left, 0, where=done)
+    np.copyto(percent, 100, where=done)
+
+    time_left[...] = left
+    progress[...] = percent
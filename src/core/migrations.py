@@ -0,0 +1,101 @@
+"""Upgrades of configuration files written by earlier versions."""
+
+import re
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+# Version of the configuration format written by this release
+CONFIG_VERSION = 2
+
+# Key of the configuration file holding its format version
+VERSION_KEY = "config_version"
+
+_LEGACY_TIME = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+
+def _pad_time(value: Any, whole_hours: bool = False) -> Any:
+    """Normalize a time like "8:5" to "08:05", and optionally "8" to "08:00"."""
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    match = _LEGACY_TIME.fullmatch(text)
+    if match is not None:
+        return f"{int(match.group(1)):02d}:{int(match.group(2)):02d}"
+    if whole_hours and text.isdigit():
+        return f"{int(text):02d}:00"
+    return value
+
+
+def _from_legacy(settings: Dict[str, Any], defaults: Mapping[str, Any]) -> Dict[str, Any]:
+    """Version 0 to 1: normalize the times written by ``break_reminder.py``.
+
+    The legacy app accepted times such as "8:0" and workday lengths in
+    whole hours; both are rewritten as "HH:MM".
+    """
+    for key in ("usual_start", "lunch_start", "lunch_end"):
+        if key in settings:
+            settings[key] = _pad_time(settings[key])
+    if "workday_length" in settings:
+        settings["workday_length"] = _pad_time(settings["workday_length"], whole_hours=True)
+    return settings
+
+
+def _to_layered(settings: Dict[str, Any], defaults: Mapping[str, Any]) -> Dict[str, Any]:
+    """Version 1 to 2: mark the file as the user layer of layered configuration.
+
+    Releases before layered configuration saved every setting, including
+    copies of the defaults. They are kept: a copy cannot be told from a
+    setting the user chose on purpose, and the settings dialog no longer
+    writes settings that were not changed.
+    """
+    return settings
+
+
+# Migration steps; step ``n`` upgrades version ``n`` to ``n + 1``
+MIGRATIONS: List[Callable[[Dict[str, Any], Mapping[str, Any]], Dict[str, Any]]] = [
+    _from_legacy,
+    _to_layered,
+]
+
+
+def config_version(settings: Mapping[str, Any]) -> int:
+    """Get the format version of parsed configuration file settings.
+
+    Args:
+        settings: Settings of a configuration file
+
+    Returns:
+        Format version, 0 for files without one
+    """
+    version = settings.get(VERSION_KEY, 0)
+    return version if isinstance(version, int) and not isinstance(version, bool) else 0
+
+
+def needs_migration(settings: Mapping[str, Any]) -> bool:
+    """Check whether settings were written in an older format.
+
+    Args:
+        settings: Settings of a configuration file
+
+    Returns:
+        True if ``migrate`` would change them
+    """
+    return config_version(settings) < CONFIG_VERSION
+
+
+def migrate(settings: Mapping[str, Any], defaults: Mapping[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Upgrade settings to the current format in a single pass.
+
+    Args:
+        settings: Settings of a configuration file
+        defaults: Built-in default settings
+
+    Returns:
+        Tuple of (upgraded settings, version they were upgraded from)
+    """
+    version = config_version(settings)
+    upgraded = {key: value for key, value in settings.items() if key != VERSION_KEY}
+    for step in MIGRATIONS[version:]:
+        upgraded = step(upgraded, defaults)
+    upgraded[VERSION_KEY] = max(version, CONFIG_VERSION)
+    return upgraded, version
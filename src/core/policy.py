@@ -0,0 +1,264 @@
+"""Break policies that place the breaks of a workday."""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator, List, Mapping, Optional
+
+from .timeline import BreakInterval, point_break, timed_break
+
+
+# Configuration keys read by the break policies
+POLICY_KEYS = (
+    "break_policy",
+    "cycle_work_minutes",
+    "cycle_break_minutes",
+    "cycle_long_break_minutes",
+    "cycle_long_break_every",
+    "min_break_spacing",
+    "shift_breaks_for_lunch",
+)
+
+
+class IntervalIndex:
+    """Sorted, non-overlapping break intervals with logarithmic lookups.
+
+    Intervals that overlap an earlier one are dropped, so the index can hold
+    the breaks of many days in one place.
+    """
+
+    def __init__(self, intervals: Iterable[BreakInterval]):
+        """Build the index.
+
+        Args:
+            intervals: Break intervals in any order
+        """
+        self.intervals: List[BreakInterval] = []
+        for interval in sorted(intervals, key=lambda item: item.start):
+            if not self.intervals or interval.start >= self.intervals[-1].end:
+                self.intervals.append(interval)
+        self._starts = [interval.start for interval in self.intervals]
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __iter__(self) -> Iterator[BreakInterval]:
+        return iter(self.intervals)
+
+    def active_at(self, moment: datetime) -> Optional[BreakInterval]:
+        """Get the interval containing a given time.
+
+        Args:
+            moment: Time to look up
+
+        Returns:
+            The active interval, or None between intervals
+        """
+        idx = bisect_right(self._starts, moment) - 1
+        if idx >= 0 and moment < self.intervals[idx].end:
+            return self.intervals[idx]
+        return None
+
+    def next_after(self, moment: datetime) -> Optional[BreakInterval]:
+        """Get the first interval starting after a given time.
+
+        Args:
+            moment: Reference time
+
+        Returns:
+            The next interval, or None if there are no more
+        """
+        idx = bisect_right(self._starts, moment)
+        return self.intervals[idx] if idx < len(self.intervals) else None
+
+
+class BreakPolicy(ABC):
+    """Places the breaks of a workday.
+
+    Subclasses generate the raw breaks; this base class then moves breaks out
+    of the lunch window and enforces a minimum spacing between breaks.
+    """
+
+    def __init__(self, min_spacing: timedelta = timedelta(0), shift_for_lunch: bool = False):
+        """Initialize the policy.
+
+        Args:
+            min_spacing: Minimum time from the end of one break to the start
+                of the next; breaks closer than that are dropped
+            shift_for_lunch: Move breaks that overlap lunch to right after it
+        """
+        self.min_spacing = min_spacing
+        self.shift_for_lunch = shift_for_lunch
+
+    @abstractmethod
+    def generate(self, start_time: datetime, lunch_start: datetime, lunch_end: datetime,
+                 workday_end: datetime) -> List[BreakInterval]:
+        """Generate the raw breaks of a workday.
+
+        Args:
+            start_time: Start of the workday
+            lunch_start: Start of the lunch break
+            lunch_end: End of the lunch break
+            workday_end: End of the workday
+
+        Returns:
+            Break intervals in chronological order
+        """
+
+    def breaks(self, start_time: datetime, lunch_start: datetime, lunch_end: datetime,
+               workday_end: datetime) -> List[BreakInterval]:
+        """Get the breaks of a workday.
+
+        Args:
+            start_time: Start of the workday
+            lunch_start: Start of the lunch break
+            lunch_end: End of the lunch break
+            workday_end: End of the workday
+
+        Returns:
+            Break intervals in chronological order
+        """
+        breaks = self.generate(start_time, lunch_start, lunch_end, workday_end)
+        if self.shift_for_lunch and lunch_start <= lunch_end:
+            breaks = self._shift_for_lunch(breaks, lunch_start, lunch_end, workday_end)
+        if self.min_spacing > timedelta(0):
+            breaks = self._space(breaks)
+        return breaks
+
+    def index(self, start_time: datetime, lunch_start: datetime, lunch_end: datetime,
+              workday_end: datetime) -> IntervalIndex:
+        """Compile the breaks of a workday into an interval index.
+
+        Args:
+            start_time: Start of the workday
+            lunch_start: Start of the lunch break
+            lunch_end: End of the lunch break
+            workday_end: End of the workday
+
+        Returns:
+            Interval index of the breaks
+        """
+        return IntervalIndex(self.breaks(start_time, lunch_start, lunch_end, workday_end))
+
+    @staticmethod
+    def _shift_for_lunch(breaks: List[BreakInterval], lunch_start: datetime, lunch_end: datetime,
+                         workday_end: datetime) -> List[BreakInterval]:
+        """Move breaks overlapping lunch to right after it."""
+        resume = lunch_end + timedelta(microseconds=1)
+        result = []
+        for brk in breaks:
+            if brk.start < resume and brk.end > lunch_start:
+                brk = brk.shifted(resume - brk.start)
+            if brk.start < workday_end:
+                result.append(brk)
+        result.sort(key=lambda brk: brk.start)
+        # Breaks moved onto each other merge into the first one
+        return list(IntervalIndex(result))
+
+    def _space(self, breaks: List[BreakInterval]) -> List[BreakInterval]:
+        """Drop breaks that follow the previous one too closely."""
+        result = []
+        for brk in breaks:
+            if not result or brk.start - result[-1].end >= self.min_spacing:
+                result.append(brk)
+        return result
+
+
+class PointBreakPolicy(BreakPolicy):
+    """Breaks at fixed fractions of the workday, announced ahead of time."""
+
+    def __init__(self, break_points: Iterable[float], **kwargs: Any):
+        """Initialize the policy.
+
+        Args:
+            break_points: Fractions (0-1) of the workday at which to break
+            **kwargs: Options of ``BreakPolicy``
+        """
+        super().__init__(**kwargs)
+        self.break_points = sorted(break_points)
+
+    def generate(self, start_time: datetime, lunch_start: datetime, lunch_end: datetime,
+                 workday_end: datetime) -> List[BreakInterval]:
+        total_hours = (workday_end - start_time).total_seconds() / 3600
+        return [point_break(start_time + timedelta(hours=total_hours * point))
+                for point in self.break_points]
+
+
+class CycleBreakPolicy(BreakPolicy):
+    """Repeating work and break cycles, e.g. Pomodoro.
+
+    Cycles start at the beginning of the workday. Lunch pauses the cycle
+    clock, so a work period interrupted by lunch continues after it. Every
+    ``long_break_every``-th break is a long one.
+    """
+
+    def __init__(self, work: timedelta, short_break: timedelta, long_break: timedelta,
+                 long_break_every: int = 0, **kwargs: Any):
+        """Initialize the policy.
+
+        Args:
+            work: Length of a work period
+            short_break: Length of a regular break
+            long_break: Length of a long break
+            long_break_every: Cycles per long break, 0 for no long breaks
+            **kwargs: Options of ``BreakPolicy``
+        """
+        super().__init__(**kwargs)
+        if work <= timedelta(0):
+            raise ValueError("Cycle work period must be positive")
+        self.work = work
+        self.short_break = short_break
+        self.long_break = long_break
+        self.long_break_every = long_break_every
+
+    def generate(self, start_time: datetime, lunch_start: datetime, lunch_end: datetime,
+                 workday_end: datetime) -> List[BreakInterval]:
+        lunch_length = lunch_end - lunch_start
+        has_lunch = start_time <= lunch_start < workday_end and lunch_length > timedelta(0)
+
+        breaks = []
+        moment = start_time
+        cycle = 0
+        while True:
+            cycle += 1
+            if has_lunch and lunch_start <= moment < lunch_end:
+                moment = lunch_end
+            # Work, pausing the cycle clock for lunch
+            break_start = moment + self.work
+            if has_lunch and moment <= lunch_start < break_start:
+                break_start += lunch_length
+            if break_start >= workday_end:
+                break
+            long = self.long_break_every > 0 and cycle % self.long_break_every == 0
+            length = self.long_break if long else self.short_break
+            if length > timedelta(0):
+                breaks.append(timed_break(break_start, length, long))
+            moment = break_start + length
+        return breaks
+
+
+def policy_from_config(rules: Mapping[str, Any]) -> BreakPolicy:
+    """Create the break policy described by schedule rules.
+
+    Args:
+        rules: Configuration or per-day schedule rules
+
+    Returns:
+        Break policy
+    """
+    options = {
+        "min_spacing": timedelta(minutes=rules.get("min_break_spacing", 0)),
+        "shift_for_lunch": bool(rules.get("shift_breaks_for_lunch", False)),
+    }
+    name = rules.get("break_policy", "points")
+    if name == "points":
+        return PointBreakPolicy(rules.get("break_points", [0.25, 0.75]), **options)
+    if name == "cycle":
+        return CycleBreakPolicy(
+            work=timedelta(minutes=rules.get("cycle_work_minutes", 25)),
+            short_break=timedelta(minutes=rules.get("cycle_break_minutes", 5)),
+            long_break=timedelta(minutes=rules.get("cycle_long_break_minutes", 15)),
+            long_break_every=rules.get("cycle_long_break_every", 4),
+            **options,
+        )
+    raise ValueError(f"Unknown break policy: {name}")
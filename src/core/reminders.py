@@ -0,0 +1,183 @@
+"""Periodic reminder streams merged into a single event stream."""
+
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .clock import Clock, SystemClock
+
+
+@dataclass(frozen=True)
+class Reminder:
+    """A single reminder that is due."""
+    at: datetime
+    name: str
+    message: str
+
+
+class ReminderStream:
+    """A reminder that repeats with a fixed period.
+
+    Occurrences lie on a grid of ``period`` steps from midnight, so every
+    stream has the same rhythm each day. Occurrences that fall into one of
+    the daily quiet windows are skipped.
+    """
+
+    # How far ahead to look for an occurrence outside the quiet windows
+    LOOKAHEAD = timedelta(days=8)
+
+    def __init__(self, name: str, period: timedelta, message: str,
+                 quiet: Sequence[Tuple[time, time]] = ()):
+        """Initialize the stream.
+
+        Args:
+            name: Short name, e.g. "Eye rest"
+            period: Time between reminders
+            message: Text shown when the reminder is due
+            quiet: Daily (start, end) windows without reminders; a window
+                whose end is before its start runs past midnight
+        """
+        if period <= timedelta(0):
+            raise ValueError(f"Reminder period must be positive: {name}")
+        self.name = name
+        self.period = period
+        self.message = message
+        self.quiet = tuple(quiet)
+
+    @classmethod
+    def from_config(cls, entry: Mapping[str, Any]) -> "ReminderStream":
+        """Create a stream from a typed ``reminders`` configuration entry.
+
+        Args:
+            entry: Dictionary with name, message, every and quiet, as
+                parsed by the configuration schema
+
+        Returns:
+            Reminder stream
+        """
+        return cls(entry["name"], entry["every"], entry["message"], entry["quiet"])
+
+    def _quiet_end(self, moment: datetime) -> Optional[datetime]:
+        """Get the end of the quiet window containing a time, if any."""
+        clock_time = moment.time()
+        for start, end in self.quiet:
+            if start <= end:
+                if start <= clock_time < end:
+                    return datetime.combine(moment.date(), end)
+            elif clock_time >= start:
+                return datetime.combine(moment.date(), end) + timedelta(days=1)
+            elif clock_time < end:
+                return datetime.combine(moment.date(), end)
+        return None
+
+    def next_after(self, moment: datetime) -> Optional[datetime]:
+        """Get the first occurrence after a given time.
+
+        Args:
+            moment: Reference time
+
+        Returns:
+            Time of the next reminder, or None if every occurrence is quiet
+        """
+        limit = moment + self.LOOKAHEAD
+        while moment < limit:
+            midnight = datetime.combine(moment.date(), time.min)
+            steps = (moment - midnight) // self.period + 1
+            candidate = midnight + steps * self.period
+            # The grid restarts at each midnight
+            next_midnight = midnight + timedelta(days=1)
+            if candidate > next_midnight:
+                candidate = next_midnight
+            quiet_end = self._quiet_end(candidate)
+            if quiet_end is None:
+                return candidate
+            # Continue just before the end of the quiet window, so an
+            # occurrence exactly at its end still counts
+            moment = max(candidate, quiet_end - timedelta(microseconds=1))
+        return None
+
+
+class ReminderMultiplexer:
+    """Merges reminder streams lazily through a priority queue.
+
+    Only the next occurrence of each stream is kept in the heap, so finding
+    the earliest upcoming reminder is O(1) and firing one is O(log n) in the
+    number of streams.
+    """
+
+    def __init__(self, streams: Iterable[ReminderStream], clock: Optional[Clock] = None):
+        """Initialize the multiplexer.
+
+        Args:
+            streams: Reminder streams to merge
+            clock: Time source, defaults to the system clock
+        """
+        self.clock = clock if clock is not None else SystemClock()
+        self.streams = list(streams)
+        self._heap: List[Tuple[datetime, int, ReminderStream]] = []
+        self.reset()
+
+    @classmethod
+    def from_config(cls, reminders: Iterable[Mapping[str, Any]],
+                    clock: Optional[Clock] = None) -> "ReminderMultiplexer":
+        """Create a multiplexer for the ``reminders`` setting.
+
+        Args:
+            reminders: Typed ``reminders`` setting, e.g. from
+                ``ConfigManager.get_typed``
+            clock: Time source, defaults to the system clock
+
+        Returns:
+            Reminder multiplexer
+        """
+        return cls((ReminderStream.from_config(entry) for entry in reminders), clock)
+
+    def reset(self, now: Optional[datetime] = None) -> None:
+        """Schedule the next occurrence of every stream from a given time.
+
+        Args:
+            now: Reference time, defaults to the current time
+        """
+        if now is None:
+            now = self.clock.now()
+        self._heap = []
+        for order, stream in enumerate(self.streams):
+            at = stream.next_after(now)
+            if at is not None:
+                self._heap.append((at, order, stream))
+        heapq.heapify(self._heap)
+
+    def next_time(self) -> Optional[datetime]:
+        """Get the time of the earliest pending reminder.
+
+        Returns:
+            Time of the next reminder, or None if there are none
+        """
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Reminder]:
+        """Take all reminders that are due.
+
+        A stream that fell behind, e.g. after the computer slept, fires once
+        and continues from the current time instead of catching up.
+
+        Args:
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Due reminders in chronological order
+        """
+        if now is None:
+            now = self.clock.now()
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            at, order, stream = heap[0]
+            due.append(Reminder(at, stream.name, stream.message))
+            following = stream.next_after(max(at, now))
+            if following is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (following, order, stream))
+        return due
@@ -0,0 +1,198 @@
+"""Multi-day schedule compilation with weekday rules, holidays and night shifts."""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from .policy import POLICY_KEYS, IntervalIndex, policy_from_config
+from .schema import SCHEMA, WEEKDAYS
+from .timeline import DayTimeline
+
+
+# Configuration keys that can be overridden per weekday
+DAY_RULE_KEYS = ("usual_start", "lunch_start", "lunch_end", "workday_length", "break_points") + POLICY_KEYS
+
+# Configuration keys the compiled schedule depends on
+SCHEDULE_KEYS = frozenset(DAY_RULE_KEYS + ("workdays", "holidays", "weekday_overrides"))
+
+# Typed defaults of the day rules read here; the break policy has its own
+DEFAULT_DAY_RULES = {
+    "usual_start": time(8, 0),
+    "lunch_start": time(10, 45),
+    "lunch_end": time(12, 30),
+    "workday_length": timedelta(hours=8),
+}
+
+
+def typed_schedule(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """Convert the schedule settings of a raw configuration.
+
+    ``ConfigManager`` keeps these values converted already (see
+    ``typed_snapshot``); this is for plain dictionaries, e.g. in simulations.
+
+    Args:
+        config: Raw configuration
+
+    Returns:
+        Typed value of each schedule setting in the configuration
+
+    Raises:
+        ConfigValidationError: If a schedule setting is invalid
+    """
+    typed, errors = SCHEMA.convert_all({key: config[key] for key in SCHEDULE_KEYS if key in config})
+    if errors:
+        raise next(iter(errors.values()))
+    return typed
+
+
+class ScheduleCompiler:
+    """Compiles day timelines on demand and caches them per date.
+
+    A day's timeline stays active from its midnight (or the end of the
+    previous day's shift, if that runs past midnight) until the next midnight
+    (or the end of its own shift, if that runs past midnight). This lets a
+    long-running process roll over from one day to the next by looking up
+    the next cached timeline instead of rebuilding anything.
+    """
+
+    # Days kept in the cache around the most recently requested one
+    CACHE_DAYS = 7
+
+    def __init__(self, config: Mapping[str, Any], typed: Optional[Mapping[str, Any]] = None):
+        """Initialize the compiler.
+
+        Args:
+            config: Configuration dictionary
+            typed: Typed values of the configuration, e.g. from
+                ``ConfigManager.typed_snapshot``; converted from ``config``
+                if not given
+        """
+        self.config = config
+        self.typed = typed_schedule(config) if typed is None else typed
+        self.workdays = self.typed.get("workdays", frozenset(range(len(WEEKDAYS))))
+        self.holidays = self.typed.get("holidays", frozenset())
+        self.weekday_overrides = self.typed.get("weekday_overrides", {})
+        self._cache: Dict[date, DayTimeline] = {}
+
+    def rules_for(self, day: date) -> Optional[Dict[str, Any]]:
+        """Get the schedule rules that apply to a day.
+
+        Args:
+            day: Day to look up
+
+        Returns:
+            Typed schedule settings for the day, or None if it is a day off
+        """
+        if day.weekday() not in self.workdays or day in self.holidays:
+            return None
+        rules = dict(DEFAULT_DAY_RULES)
+        rules.update((key, self.typed[key]) for key in DAY_RULE_KEYS if key in self.typed)
+        rules.update(self.weekday_overrides.get(WEEKDAYS[day.weekday()], {}))
+        return rules
+
+    def timeline(self, day: date) -> DayTimeline:
+        """Get the compiled timeline of a day.
+
+        Args:
+            day: Day to compile
+
+        Returns:
+            Compiled, cached timeline
+        """
+        timeline = self._cache.get(day)
+        if timeline is None:
+            timeline = self._compile_day(day)
+            self._cache[day] = timeline
+            if len(self._cache) > self.CACHE_DAYS:
+                self._evict(day)
+        return timeline
+
+    def _evict(self, center: date) -> None:
+        """Drop cached days far away from the given day."""
+        horizon = timedelta(days=self.CACHE_DAYS // 2)
+        for day in list(self._cache):
+            if abs(day - center) > horizon:
+                del self._cache[day]
+
+    def _compile_day(self, day: date) -> DayTimeline:
+        """Compile the timeline of a single day."""
+        rules = self.rules_for(day)
+        if rules is None:
+            return DayTimeline.day_off(day)
+
+        start_time = datetime.combine(day, rules["usual_start"])
+        workday_end = start_time + rules["workday_length"]
+
+        # On a shift that runs past midnight a lunch earlier than the start
+        # time belongs to the following morning
+        lunch_start = datetime.combine(day, rules["lunch_start"])
+        lunch_end = datetime.combine(day, rules["lunch_end"])
+        if workday_end.date() > day:
+            if lunch_start < start_time:
+                lunch_start += timedelta(days=1)
+            if lunch_end < lunch_start:
+                lunch_end += timedelta(days=1)
+
+        # Place the breaks
+        breaks = policy_from_config(rules).breaks(start_time, lunch_start, lunch_end, workday_end)
+
+        return DayTimeline(start_time, lunch_start, lunch_end, workday_end, breaks=breaks)
+
+    def active_span(self, day: date) -> Tuple[datetime, datetime]:
+        """Get the period during which a day's timeline is the active one.
+
+        Args:
+            day: Day to look up
+
+        Returns:
+            Tuple of (start, end) of the active period, end exclusive
+        """
+        previous = self.timeline(day - timedelta(days=1))
+        current = self.timeline(day)
+        start = datetime.combine(day, time.min)
+        end = start + timedelta(days=1)
+        if previous.is_workday:
+            start = max(start, previous.workday_end)
+        if current.is_workday:
+            end = max(end, current.workday_end)
+        return start, end
+
+    def active_day(self, now: datetime) -> date:
+        """Get the day whose timeline applies at a given time.
+
+        Args:
+            now: Time to look up
+
+        Returns:
+            The current date, or yesterday while its shift is still running
+        """
+        today = now.date()
+        yesterday = today - timedelta(days=1)
+        previous = self.timeline(yesterday)
+        if previous.is_workday and now < previous.workday_end:
+            return yesterday
+        return today
+
+    def break_index(self, first: date, count: int) -> IntervalIndex:
+        """Compile the breaks of a range of days into one interval index.
+
+        Args:
+            first: First day
+            count: Number of days
+
+        Returns:
+            Interval index over the breaks of all days
+        """
+        return IntervalIndex(brk for timeline in self.days(first, count) for brk in timeline.breaks)
+
+    def days(self, first: date, count: int) -> Iterator[DayTimeline]:
+        """Iterate over the compiled timelines of a range of days.
+
+        Args:
+            first: First day
+            count: Number of days
+
+        Yields:
+            Timeline of each day in order
+        """
+        for offset in range(count):
+            yield self.timeline(first + timedelta(days=offset))
@@ -0,0 +1,131 @@
+"""Event-driven scheduling of display updates."""
+
+import math
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from .break_logic import BreakLogic
+from .clock import Clock
+
+if TYPE_CHECKING:
+    # Only the app's reminder timer needs the reminders module
+    from .reminders import ReminderMultiplexer
+
+
+class WakeupScheduler(ABC):
+    """Computes the delay until the next moment something is due.
+
+    Subclasses tell ``next_wakeup`` what that moment is; callers arm a
+    single-shot timer with ``next_delay_ms`` instead of polling.
+    """
+
+    # Upper bound for a single sleep so that suspend/resume and wall clock
+    # changes are picked up even when nothing is pending.
+    MAX_DELAY_MS = 15 * 60 * 1000
+
+    # Fire slightly after the due time so the new state is already visible.
+    MARGIN_MS = 20
+
+    def __init__(self, clock: Clock, max_delay_ms: int = MAX_DELAY_MS, margin_ms: int = MARGIN_MS):
+        """Initialize the scheduler.
+
+        Args:
+            clock: Time source
+            max_delay_ms: Longest delay ever returned
+            margin_ms: Extra delay added after each due time
+        """
+        self.clock = clock
+        self.max_delay_ms = max_delay_ms
+        self.margin_ms = margin_ms
+
+    @abstractmethod
+    def next_wakeup(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Get the next due time.
+
+        Args:
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Next due time, or None if nothing is pending
+        """
+
+    def next_delay_ms(self, now: Optional[datetime] = None) -> int:
+        """Get the delay until the next update is due.
+
+        Args:
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Delay in milliseconds, capped at ``max_delay_ms``
+        """
+        if now is None:
+            now = self.clock.now()
+
+        wakeup = self.next_wakeup(now)
+        if wakeup is None:
+            return self.max_delay_ms
+
+        delta = wakeup - now
+        # Round up to whole milliseconds so the timer never fires early
+        delay = math.ceil(delta.total_seconds() * 1000) + self.margin_ms
+        return max(0, min(delay, self.max_delay_ms))
+
+
+class TransitionScheduler(WakeupScheduler):
+    """Computes when the display next needs to be refreshed.
+
+    Instead of polling on a fixed interval, the scheduler asks the break logic
+    for the exact moment of the next state boundary so that callers can arm a
+    single-shot timer for that moment only.
+    """
+
+    def __init__(self, break_logic: BreakLogic, max_delay_ms: int = WakeupScheduler.MAX_DELAY_MS,
+                 margin_ms: int = WakeupScheduler.MARGIN_MS):
+        """Initialize the scheduler.
+
+        Args:
+            break_logic: Break logic to query for upcoming transitions
+            max_delay_ms: Longest delay ever returned
+            margin_ms: Extra delay added after each boundary
+        """
+        super().__init__(break_logic.clock, max_delay_ms, margin_ms)
+        self.break_logic = break_logic
+
+    def next_wakeup(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Get the time of the next state boundary.
+
+        Args:
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Time of the next boundary, or None if nothing changes anymore
+        """
+        return self.break_logic.get_next_transition(now)
+
+
+class ReminderScheduler(WakeupScheduler):
+    """Computes when the next periodic reminder is due."""
+
+    def __init__(self, reminders: "ReminderMultiplexer", max_delay_ms: int = WakeupScheduler.MAX_DELAY_MS,
+                 margin_ms: int = WakeupScheduler.MARGIN_MS):
+        """Initialize the scheduler.
+
+        Args:
+            reminders: Merged reminder streams
+            max_delay_ms: Longest delay ever returned
+            margin_ms: Extra delay added after each reminder time
+        """
+        super().__init__(reminders.clock, max_delay_ms, margin_ms)
+        self.reminders = reminders
+
+    def next_wakeup(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Get the time of the earliest pending reminder.
+
+        Args:
+            now: Reference time, unused
+
+        Returns:
+            Time of the next reminder, or None if there are none
+        """
+        return self.reminders.next_time()
@@ -0,0 +1,339 @@
+"""Declarative configuration schema that validates and converts settings."""
+
+import re
+from datetime import date, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+_CLOCK_TIME = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+
+class ConfigValidationError(ValueError):
+    """A configuration value that does not match its field."""
+
+    def __init__(self, field: str, message: str):
+        """Initialize the error.
+
+        Args:
+            field: Configuration key of the invalid value
+            message: What is wrong with the value
+        """
+        super().__init__(f"{field}: {message}")
+        self.field = field
+        self.message = message
+
+
+@lru_cache(maxsize=256)
+def parse_clock_time(value: str) -> time:
+    """Parse a time of day given as "HH:MM".
+
+    Args:
+        value: Time string
+
+    Returns:
+        Parsed time
+    """
+    match = _CLOCK_TIME.fullmatch(value)
+    if match is None:
+        raise ValueError(f"expected a time as HH:MM, got {value!r}")
+    hours, minutes = int(match.group(1)), int(match.group(2))
+    if hours > 23:
+        raise ValueError("hours must be between 0 and 23")
+    if minutes > 59:
+        raise ValueError("minutes must be between 0 and 59")
+    return time(hours, minutes)
+
+
+@lru_cache(maxsize=256)
+def parse_duration(value: str) -> timedelta:
+    """Parse a duration given as "HH:MM" or whole hours.
+
+    Args:
+        value: Duration string
+
+    Returns:
+        Parsed duration
+    """
+    try:
+        if ":" in value:
+            hours, minutes = map(int, value.split(":"))
+        else:
+            hours, minutes = int(value), 0
+    except ValueError:
+        raise ValueError(f"expected a duration as HH:MM, got {value!r}") from None
+    if hours < 0 or not 0 <= minutes <= 59:
+        raise ValueError("minutes must be between 0 and 59 and hours not negative")
+    return timedelta(hours=hours, minutes=minutes)
+
+
+class Field:
+    """Converts the raw value of one setting into its typed form.
+
+    ``parse`` raises ``ValueError`` with a short description when the raw
+    value is invalid; ``convert`` turns that into a
+    ``ConfigValidationError`` naming the setting.
+    """
+
+    def parse(self, value: Any) -> Any:
+        """Convert a raw value.
+
+        Args:
+            value: Value as stored in the configuration file
+
+        Returns:
+            Typed value
+        """
+        return value
+
+    def convert(self, key: str, value: Any) -> Any:
+        """Convert a raw value, naming the setting on failure.
+
+        Args:
+            key: Configuration key
+            value: Value as stored in the configuration file
+
+        Returns:
+            Typed value
+        """
+        try:
+            return self.parse(value)
+        except ValueError as e:
+            raise ConfigValidationError(key, str(e)) from None
+
+
+class TimeField(Field):
+    """Time of day as "HH:MM", converted to ``datetime.time``."""
+
+    def parse(self, value: Any) -> time:
+        if not isinstance(value, str):
+            raise ValueError(f"expected a time as HH:MM, got {value!r}")
+        return parse_clock_time(value)
+
+
+class DurationField(Field):
+    """Positive duration as "HH:MM" or whole hours, converted to ``timedelta``."""
+
+    def parse(self, value: Any) -> timedelta:
+        if not isinstance(value, str):
+            raise ValueError(f"expected a duration as HH:MM, got {value!r}")
+        duration = parse_duration(value)
+        if duration <= timedelta(0):
+            raise ValueError("must be longer than zero")
+        return duration
+
+
+class ChoiceField(Field):
+    """One of a fixed set of names."""
+
+    def __init__(self, *choices: str):
+        self.choices = choices
+
+    def parse(self, value: Any) -> str:
+        if value not in self.choices:
+            raise ValueError(f"must be one of {', '.join(self.choices)}, got {value!r}")
+        return value
+
+
+class IntField(Field):
+    """Whole number within a range."""
+
+    def __init__(self, minimum: int = 0, maximum: Optional[int] = None):
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def parse(self, value: Any) -> int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"expected a whole number, got {value!r}")
+        if value < self.minimum or (self.maximum is not None and value > self.maximum):
+            upper = "" if self.maximum is None else f" and at most {self.maximum}"
+            raise ValueError(f"must be at least {self.minimum}{upper}")
+        return value
+
+
+class BoolField(Field):
+    """Boolean flag."""
+
+    def parse(self, value: Any) -> bool:
+        if not isinstance(value, bool):
+            raise ValueError(f"expected true or false, got {value!r}")
+        return value
+
+
+class FractionsField(Field):
+    """List of fractions between 0 and 1, converted to a sorted tuple."""
+
+    def parse(self, value: Any) -> Tuple[float, ...]:
+        if not isinstance(value, (list, tuple)):
+            raise ValueError("expected a list of fractions")
+        for item in value:
+            if isinstance(item, bool) or not isinstance(item, (int, float)) or not 0 <= item <= 1:
+                raise ValueError(f"fractions must be between 0 and 1, got {item!r}")
+        return tuple(sorted(float(item) for item in value))
+
+
+class WeekdaysField(Field):
+    """List of weekday names, converted to a set of weekday numbers."""
+
+    def parse(self, value: Any) -> frozenset:
+        if not isinstance(value, (list, tuple)):
+            raise ValueError("expected a list of weekdays")
+        for item in value:
+            if item not in WEEKDAYS:
+                raise ValueError(f"unknown weekday {item!r}, use {', '.join(WEEKDAYS)}")
+        return frozenset(WEEKDAYS.index(item) for item in value)
+
+
+class DatesField(Field):
+    """List of ISO dates, converted to a set of ``date`` objects."""
+
+    def parse(self, value: Any) -> frozenset:
+        if not isinstance(value, (list, tuple)):
+            raise ValueError("expected a list of dates")
+        try:
+            return frozenset(date.fromisoformat(item) for item in value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"dates must be given as YYYY-MM-DD ({e})") from None
+
+
+class OverridesField(Field):
+    """Per-weekday overrides of schedule settings, each checked by its own field."""
+
+    def __init__(self, fields: Mapping[str, Field]):
+        """Initialize the field.
+
+        Args:
+            fields: Fields of the settings that may be overridden
+        """
+        self.fields = fields
+
+    def parse(self, value: Any) -> Dict[str, Dict[str, Any]]:
+        if not isinstance(value, dict):
+            raise ValueError("expected an object keyed by weekday")
+        result = {}
+        for day, rules in value.items():
+            if day not in WEEKDAYS:
+                raise ValueError(f"unknown weekday {day!r}")
+            if not isinstance(rules, dict):
+                raise ValueError(f"{day}: expected an object of settings")
+            result[day] = {}
+            for key, raw in rules.items():
+                field = self.fields.get(key)
+                if field is None:
+                    raise ValueError(f"{day}: {key} cannot be set per weekday")
+                try:
+                    result[day][key] = field.parse(raw)
+                except ValueError as e:
+                    raise ValueError(f"{day}.{key}: {e}") from None
+        return result
+
+
+class RemindersField(Field):
+    """List of periodic reminder entries."""
+
+    def parse(self, value: Any) -> Tuple[Dict[str, Any], ...]:
+        if not isinstance(value, (list, tuple)):
+            raise ValueError("expected a list of reminders")
+        result = []
+        for position, entry in enumerate(value, 1):
+            if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+                raise ValueError(f"reminder {position} needs a name")
+            every = entry.get("every_minutes")
+            if isinstance(every, bool) or not isinstance(every, (int, float)) or every <= 0:
+                raise ValueError(f"reminder {position}: every_minutes must be a positive number")
+            try:
+                quiet = tuple((parse_clock_time(start), parse_clock_time(end))
+                              for start, end in entry.get("quiet", []))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"reminder {position}: quiet windows need two HH:MM times ({e})") from None
+            result.append({"name": entry["name"], "message": entry.get("message", entry["name"]),
+                           "every": timedelta(minutes=every), "quiet": quiet})
+        return tuple(result)
+
+
+# Settings that can be overridden per weekday
+DAY_RULE_FIELDS: Dict[str, Field] = {
+    "usual_start": TimeField(),
+    "lunch_start": TimeField(),
+    "lunch_end": TimeField(),
+    "workday_length": DurationField(),
+    "break_points": FractionsField(),
+    "break_policy": ChoiceField("points", "cycle"),
+    "cycle_work_minutes": IntField(minimum=1),
+    "cycle_break_minutes": IntField(),
+    "cycle_long_break_minutes": IntField(),
+    "cycle_long_break_every": IntField(),
+    "min_break_spacing": IntField(),
+    "shift_breaks_for_lunch": BoolField(),
+}
+
+
+class ConfigSchema:
+    """Fields of all known settings.
+
+    Settings without a field are passed through unchanged, so that newer
+    configuration files keep working with older versions of the program.
+    """
+
+    def __init__(self, fields: Mapping[str, Field]):
+        """Initialize the schema.
+
+        Args:
+            fields: Field of each known setting
+        """
+        self.fields = dict(fields)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.fields
+
+    def convert(self, key: str, value: Any) -> Any:
+        """Validate and convert one setting.
+
+        Args:
+            key: Configuration key
+            value: Raw value
+
+        Returns:
+            Typed value
+        """
+        field = self.fields.get(key)
+        return value if field is None else field.convert(key, value)
+
+    def convert_all(self, config: Mapping[str, Any]) -> Tuple[Dict[str, Any], Dict[str, ConfigValidationError]]:
+        """Validate and convert every setting of a configuration.
+
+        Args:
+            config: Raw settings
+
+        Returns:
+            Tuple of (typed values of the valid settings, error of each invalid one)
+        """
+        typed, errors = {}, {}
+        for key, value in config.items():
+            try:
+                typed[key] = self.convert(key, value)
+            except ConfigValidationError as e:
+                errors[key] = e
+        return typed, errors
+
+
+SCHEMA = ConfigSchema({
+    "config_version": IntField(),
+    **DAY_RULE_FIELDS,
+    "snooze_minutes": IntField(minimum=1),
+    "workdays": WeekdaysField(),
+    "holidays": DatesField(),
+    "weekday_overrides": OverridesField(DAY_RULE_FIELDS),
+    "reminders": RemindersField(),
+    "theme": ChoiceField("dark", "light", "auto"),
+    "auto_close_delay": IntField(),
+    "window_position": ChoiceField("top-right", "top-left", "bottom-right", "bottom-left"),
+    "notifications_enabled": BoolField(),
+    "sound_enabled": BoolField(),
+    "minimize_to_tray": BoolField(),
+    "start_minimized": BoolField(),
+    "release_widget_after": IntField(),
+    "debug_mode": BoolField(),
+})
@@ -0,0 +1,213 @@
+"""Break state published in a memory-mapped file for status bars.
+
+The running app writes the state of each new break state into a small file
+under ``$XDG_RUNTIME_DIR``. Status bars map the file once and read it
+without locks or system calls, so polling it costs next to nothing.
+
+Layout, little endian::
+
+    0   4s  magic b"BRKS"
+    4   I   layout version
+    8   Q   sequence, odd while a write is in progress
+    16  I   process id of the writer, 0 once it has stopped
+    20  I   length of the payload
+    24      payload, the state as UTF-8 JSON
+
+A reader takes the sequence, copies the payload and takes the sequence
+again. If the two differ or the first one is odd, a write overlapped the
+read and it is repeated after yielding the processor to the writer. Python
+cannot issue memory barriers, so a payload that fails to decode is treated
+the same way.
+
+Only the start of each state is published. Consumers that show a countdown
+compute it from ``target``; ``time_left`` is the value at publication.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from .control import runtime_path, status_of
+
+
+STATE_FILE_NAME = "break_reminder.state"
+
+MAGIC = b"BRKS"
+LAYOUT_VERSION = 1
+FILE_SIZE = 4096
+
+_HEADER = struct.Struct("<4sIQII")
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 8
+_WRITER = struct.Struct("<II")
+_WRITER_OFFSET = 16
+_PAYLOAD_OFFSET = _HEADER.size
+CAPACITY = FILE_SIZE - _PAYLOAD_OFFSET
+
+# Lets a writer that was interrupted mid-write finish, e.g. on a single CPU
+_yield_cpu = getattr(os, "sched_yield", None) or (lambda: time.sleep(0))
+
+
+def state_file_path() -> str:
+    """Get the path of the shared state file for the current user.
+
+    Returns:
+        Path from ``runtime_path``
+    """
+    return runtime_path(STATE_FILE_NAME)
+
+
+class StatePublisher:
+    """Writes the break state into the shared state file."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Create or reuse the state file and map it.
+
+        Args:
+            path: State file, defaults to ``state_file_path()``
+        """
+        self.path = path or state_file_path()
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        fd = os.open(self.path, flags, 0o600)
+        try:
+            if os.fstat(fd).st_size != FILE_SIZE:
+                os.ftruncate(fd, FILE_SIZE)
+            self.map = mmap.mmap(fd, FILE_SIZE)
+        finally:
+            # The mapping stays valid after the descriptor is closed
+            os.close(fd)
+        magic, _, sequence, _, _ = _HEADER.unpack_from(self.map)
+        # Continue the sequence of an earlier run, so readers that still map
+        # the file notice the change
+        self.sequence = sequence + (sequence & 1) if magic == MAGIC else 0
+        self.map[:_PAYLOAD_OFFSET] = _HEADER.pack(MAGIC, LAYOUT_VERSION, self.sequence, os.getpid(), 0)
+
+    def publish(self, state: Optional[Mapping[str, Any]], pid: Optional[int] = None) -> None:
+        """Replace the published state.
+
+        Args:
+            state: JSON serializable state, or None to clear it
+            pid: Writer process id to record, defaults to this process
+        """
+        payload = b"" if state is None else json.dumps(
+            state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(payload) > CAPACITY:
+            raise ValueError(f"State of {len(payload)} bytes does not fit into {CAPACITY}")
+        # An odd sequence tells readers that a write is in progress. Fields are
+        # stored by slice assignment: pack_into clears its target first, which
+        # would briefly show readers a sequence of 0.
+        self._store_sequence(self.sequence + 1)
+        self.map[_PAYLOAD_OFFSET:_PAYLOAD_OFFSET + len(payload)] = payload
+        self.map[_WRITER_OFFSET:_PAYLOAD_OFFSET] = _WRITER.pack(
+            os.getpid() if pid is None else pid, len(payload))
+        self.sequence += 2
+        self._store_sequence(self.sequence)
+
+    def _store_sequence(self, sequence: int) -> None:
+        """Store the sequence number with a single copy."""
+        self.map[_SEQUENCE_OFFSET:_WRITER_OFFSET] = _SEQUENCE.pack(sequence)
+
+    def publish_snapshot(self, snapshot) -> None:
+        """Publish a break state snapshot, e.g. as a ``BreakLogic`` listener.
+
+        Args:
+            snapshot: ``StateSnapshot`` of the break logic
+        """
+        self.publish(status_of(snapshot))
+
+    def close(self) -> None:
+        """Mark the state as stopped and unmap the file.
+
+        The file is kept, so that readers which mapped it see the change.
+        """
+        if self.map.closed:
+            return
+        self.publish(None, pid=0)
+        self.map.close()
+
+
+class StateReader:
+    """Reads the shared state file without locking."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Map the state file.
+
+        Args:
+            path: State file, defaults to ``state_file_path()``
+
+        Raises:
+            OSError: If the app has never published its state
+        """
+        fd = os.open(path or state_file_path(), os.O_RDONLY)
+        try:
+            self.map = mmap.mmap(fd, FILE_SIZE, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        if self.map[:4] != MAGIC:
+            self.map.close()
+            raise ValueError("Not a break reminder state file")
+
+    def sequence(self) -> int:
+        """Get the sequence number, which changes with every update.
+
+        Pollers can compare it with the previous value and skip ``read``
+        while it stays the same.
+
+        Returns:
+            Current sequence number
+        """
+        return _SEQUENCE.unpack_from(self.map, _SEQUENCE_OFFSET)[0]
+
+    def read(self, attempts: int = 10000) -> Optional[Dict[str, Any]]:
+        """Get a consistent copy of the published state.
+
+        Args:
+            attempts: Reads to try while the writer is busy
+
+        Returns:
+            Published state, or None if the app has stopped
+
+        Raises:
+            TimeoutError: If every attempt overlapped a write
+        """
+        for attempt in range(attempts):
+            if attempt:
+                _yield_cpu()
+            before = _SEQUENCE.unpack_from(self.map, _SEQUENCE_OFFSET)[0]
+            if before & 1:
+                continue
+            _, _, _, pid, length = _HEADER.unpack_from(self.map)
+            payload = self.map[_PAYLOAD_OFFSET:_PAYLOAD_OFFSET + min(length, CAPACITY)]
+            if _SEQUENCE.unpack_from(self.map, _SEQUENCE_OFFSET)[0] != before:
+                continue
+            if not pid or not payload:
+                return None
+            try:
+                return json.loads(payload)
+            except ValueError:
+                continue
+        raise TimeoutError("The state file kept changing while it was read")
+
+    def writer_pid(self) -> int:
+        """Get the process id of the app that published the state.
+
+        A reader can check that the process still exists to detect a state
+        left behind by a crash.
+
+        Returns:
+            Process id, 0 once the app has stopped
+        """
+        return _HEADER.unpack_from(self.map)[3]
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self.map.close()
+
+    def __enter__(self) -> "StateReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
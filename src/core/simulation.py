@@ -0,0 +1,119 @@
+"""Headless simulation of break schedules on a virtual clock."""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from .break_logic import BreakLogic, BreakState
+from .clock import VirtualClock
+
+
+@dataclass(frozen=True)
+class Transition:
+    """A change of the displayed state during a simulation."""
+    at: datetime
+    state: BreakState
+    previous: Optional[BreakState]
+    time_left: int
+    progress_percent: int
+    message: str
+    next_event: str
+
+
+def simulate(config: Dict[str, Any], start: datetime, end: datetime,
+             include_ticks: bool = False) -> Iterator[Transition]:
+    """Replay the break schedule between two points in time.
+
+    The virtual clock jumps straight from one transition to the next, so a
+    full week is replayed in a fraction of a second.
+
+    Args:
+        config: Configuration dictionary
+        start: Simulation start time
+        end: Simulation end time (exclusive)
+        include_ticks: Also emit minute ticks that don't change the state
+
+    Yields:
+        Transitions in chronological order
+    """
+    clock = VirtualClock(start)
+    logic = BreakLogic(config, clock=clock)
+    previous = None
+
+    now = start
+    while now < end:
+        snapshot = logic.get_snapshot()
+        state = snapshot.state
+        if include_ticks or state != previous:
+            yield Transition(
+                at=now,
+                state=state,
+                previous=previous,
+                time_left=snapshot.time_left,
+                progress_percent=snapshot.progress_percent,
+                message=snapshot.message,
+                next_event=snapshot.next_event,
+            )
+        previous = state
+
+        if include_ticks:
+            now = logic.get_next_transition()
+        else:
+            now = logic.get_next_state_change()
+        clock.set(now)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Replay break schedules on a virtual clock.")
+    parser.add_argument("--config", action="append", default=[],
+                        help="Configuration file to simulate (can be repeated)")
+    parser.add_argument("--start", default=datetime.now().date().isoformat(),
+                        help="First day to simulate (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=1, help="Number of days to simulate")
+    parser.add_argument("--ticks", action="store_true", help="Also print minute ticks")
+    parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+    args = parser.parse_args(argv)
+
+    configs = []
+    for path in args.config or [None]:
+        if path is None:
+            configs.append(("defaults", {}))
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            configs.append((path, json.load(f)))
+
+    start = datetime.fromisoformat(args.start)
+    end = start + timedelta(days=args.days)
+
+    started = time.perf_counter()
+    total = 0
+    for name, config in configs:
+        if not args.quiet:
+            print(f"== {name}")
+        for transition in simulate(config, start, end, include_ticks=args.ticks):
+            total += 1
+            if not args.quiet:
+                message = transition.message.replace("\n", " · ")
+                print(f"{transition.at:%Y-%m-%d %H:%M:%S}  {transition.state.value:<5}  {message}")
+    elapsed = time.perf_counter() - started
+
+    speedup = (end - start).total_seconds() * len(configs) / max(elapsed, 1e-9)
+    print(f"Simulated {len(configs)} schedule(s) over {args.days} day(s): "
+          f"{total} transitions in {elapsed * 1000:.1f} ms ({speedup:,.0f}x real time)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
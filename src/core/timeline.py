@@ -0,0 +1,350 @@
+"""Compiled day timeline for fast, side-effect free state lookups."""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+
+class BreakState(Enum):
+    """Enumeration of possible break states."""
+    WORK = "work"
+    BREAK = "break"
+    LUNCH = "lunch"
+    DONE = "done"
+
+
+# Smallest datetime step; boundaries that are inclusive on the left side of a
+# comparison take effect one tick after the reference time.
+_TICK = timedelta(microseconds=1)
+_MINUTE = timedelta(minutes=1)
+
+# A break is announced once less than this much time is left until it.
+BREAK_WINDOW = timedelta(minutes=6)
+
+
+class BreakInterval(NamedTuple):
+    """A span of the day spent in the break state.
+
+    Work before the interval counts down to ``work_target``, the break itself
+    counts down to ``break_target``, and the next work span measures its
+    progress from ``break_target`` on.
+    """
+    start: datetime
+    end: datetime
+    work_target: datetime
+    break_target: datetime
+    long: bool = False
+
+    @property
+    def is_point(self) -> bool:
+        """True for a break announced ahead of a single moment."""
+        return self.work_target == self.break_target
+
+    def shifted(self, delta: timedelta) -> "BreakInterval":
+        """Get the same break moved by a time difference.
+
+        Args:
+            delta: Amount of time to move the break by
+
+        Returns:
+            Moved break
+        """
+        return self._replace(start=self.start + delta, end=self.end + delta,
+                             work_target=self.work_target + delta,
+                             break_target=self.break_target + delta)
+
+
+def point_break(break_time: datetime) -> BreakInterval:
+    """Create the break window announcing a break at a given time.
+
+    Args:
+        break_time: Time of the break
+
+    Returns:
+        Break interval ending right after ``break_time``
+    """
+    return BreakInterval(break_time - BREAK_WINDOW + _TICK, break_time + _TICK,
+                         break_time, break_time)
+
+
+def timed_break(start: datetime, length: timedelta, long: bool = False) -> BreakInterval:
+    """Create a break that lasts for a given time.
+
+    Args:
+        start: Start of the break
+        length: Duration of the break
+        long: True for a long break
+
+    Returns:
+        Break interval counting down to its own end
+    """
+    return BreakInterval(start, start + length, start, start + length, long)
+
+
+class Segment(NamedTuple):
+    """A span of the day during which the break state does not change kind.
+
+    Segments are half-open ``[start, end)`` intervals. Progress is measured
+    from ``anchor`` towards ``target``, the event counted down to.
+    """
+    kind: BreakState
+    start: datetime
+    end: datetime
+    length: timedelta
+    target: datetime
+    anchor: datetime
+    next_break: Optional[datetime]
+    total_minutes: int
+
+    def time_left(self, now: datetime) -> int:
+        """Get whole minutes left until the segment target.
+
+        Args:
+            now: Time inside the segment
+
+        Returns:
+            Minutes until target, 0 once the workday is done
+        """
+        if self.kind == BreakState.DONE:
+            return 0
+        return (self.target - now) // _MINUTE
+
+    def progress(self, now: datetime) -> int:
+        """Get progress percentage (0-100) towards the segment target.
+
+        Args:
+            now: Time inside the segment
+
+        Returns:
+            Progress percentage
+        """
+        if self.kind == BreakState.DONE:
+            return 100
+        if self.total_minutes <= 0:
+            return 0
+        if self.kind == BreakState.LUNCH:
+            elapsed = self.total_minutes - self.time_left(now)
+            return int((elapsed / self.total_minutes) * 100)
+        elapsed = (now - self.anchor) // _MINUTE
+        return max(0, min(100, int((elapsed / self.total_minutes) * 100)))
+
+
+def _segment(kind: BreakState, start: datetime, end: datetime, target: datetime,
+             anchor: datetime, next_break: Optional[datetime] = None) -> Segment:
+    """Create a segment with its derived fields precomputed."""
+    return Segment(
+        kind=kind,
+        start=start,
+        end=end,
+        length=end - start,
+        target=target,
+        anchor=anchor,
+        next_break=next_break,
+        total_minutes=(target - anchor) // _MINUTE,
+    )
+
+
+def _overlay(segments: List[Segment], top: Segment) -> List[Segment]:
+    """Place a segment over a sorted segment list, clipping what it covers."""
+    result = []
+    for segment in segments:
+        if segment.end <= top.start or segment.start >= top.end:
+            result.append(segment)
+            continue
+        if segment.start < top.start:
+            result.append(segment._replace(end=top.start, length=top.start - segment.start))
+        if segment.end > top.end:
+            result.append(segment._replace(start=top.end, length=segment.end - top.end))
+    result.append(top)
+    result.sort(key=lambda segment: segment.start)
+    return result
+
+
+class DayTimeline:
+    """Immutable, sorted timeline of the typed segments of one workday.
+
+    The timeline covers all of time: before the first break the day counts
+    down towards it, and after the workday end it stays done. Looking up the
+    state at a given time is a single bisect followed by plain arithmetic, so
+    one compiled timeline can be shared by any number of readers.
+    """
+
+    def __init__(self, start_time: datetime, lunch_start: datetime, lunch_end: datetime,
+                 workday_end: datetime, break_times: Sequence[datetime] = (), is_workday: bool = True,
+                 breaks: Optional[Sequence[BreakInterval]] = None):
+        """Compile the timeline.
+
+        Args:
+            start_time: Start of the workday
+            lunch_start: Start of the lunch break
+            lunch_end: End of the lunch break
+            workday_end: End of the workday
+            break_times: Times of the regular breaks, announced by a window
+                before each of them
+            is_workday: False for weekends and holidays
+            breaks: Break intervals, used instead of ``break_times``
+        """
+        self.is_workday = is_workday
+        self.start_time = start_time
+        self.lunch_start = lunch_start
+        self.lunch_end = lunch_end
+        self.workday_end = workday_end
+        if breaks is None:
+            breaks = [point_break(break_time) for break_time in break_times]
+        self.breaks = tuple(sorted(breaks, key=lambda brk: (brk.start, brk.work_target)))
+        self.break_times = tuple(sorted(brk.work_target for brk in self.breaks))
+        self._break_ends = [brk.end for brk in self.breaks]
+        self.segments = tuple(self._compile())
+        self._starts = [segment.start for segment in self.segments]
+        # Formatted times of this day never change, so render them once
+        self._labels = {}
+
+    @classmethod
+    def day_off(cls, day: date) -> "DayTimeline":
+        """Create a timeline for a day without work.
+
+        Args:
+            day: The day off
+
+        Returns:
+            Timeline that is done from midnight on
+        """
+        midnight = datetime.combine(day, time.min)
+        return cls(midnight, midnight, midnight, midnight, [], is_workday=False)
+
+    def with_breaks(self, breaks: Sequence[BreakInterval]) -> "DayTimeline":
+        """Get the same day with different breaks.
+
+        Args:
+            breaks: Break intervals of the new timeline
+
+        Returns:
+            New timeline
+        """
+        return DayTimeline(self.start_time, self.lunch_start, self.lunch_end, self.workday_end,
+                           is_workday=self.is_workday, breaks=breaks)
+
+    def _compile(self) -> List[Segment]:
+        """Build the sorted segment list."""
+        segments = []
+        lower = datetime.min
+        anchor = self.start_time
+        for brk in self.breaks:
+            window = max(lower, brk.start)
+            if window > lower:
+                segments.append(_segment(BreakState.WORK, lower, window, brk.work_target,
+                                         anchor, brk.work_target))
+            if brk.end > window:
+                # A break window keeps counting down the work before it, a
+                # timed break measures its own progress
+                break_anchor = anchor if brk.is_point else brk.work_target
+                segments.append(_segment(BreakState.BREAK, window, brk.end, brk.break_target,
+                                         break_anchor, brk.break_target))
+            lower = max(lower, brk.end)
+            anchor = brk.break_target
+        segments.append(_segment(BreakState.WORK, lower, datetime.max, self.workday_end, anchor))
+
+        # Lunch takes precedence over breaks, and the end of the day over both
+        if self.lunch_start <= self.lunch_end:
+            lunch = _segment(BreakState.LUNCH, self.lunch_start, self.lunch_end + _TICK,
+                             self.lunch_end, self.lunch_start)
+            segments = _overlay(segments, lunch)
+        done = _segment(BreakState.DONE, self.workday_end, datetime.max,
+                        self.workday_end, self.workday_end)
+        return _overlay(segments, done)
+
+    def segment_at(self, now: datetime) -> Segment:
+        """Get the segment active at a given time.
+
+        Args:
+            now: Time to look up
+
+        Returns:
+            Active segment
+        """
+        return self.segments[bisect_right(self._starts, now) - 1]
+
+    def state_at(self, now: datetime) -> Tuple[BreakState, Segment, int, int]:
+        """Get the break state at a given time.
+
+        Args:
+            now: Time to look up
+
+        Returns:
+            Tuple of (state, segment, time_left, progress_percent)
+        """
+        segment = self.segment_at(now)
+        return segment.kind, segment, segment.time_left(now), segment.progress(now)
+
+    def next_break(self, now: datetime) -> Optional[datetime]:
+        """Get the first break at or after a given time.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Time of the next break, or None if no breaks are left
+        """
+        idx = bisect_left(self.break_times, now)
+        return self.break_times[idx] if idx < len(self.break_times) else None
+
+    def upcoming_break(self, now: datetime) -> Optional[BreakInterval]:
+        """Get the break in progress at a given time, or else the next one.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Break interval, or None if no breaks are left before the workday end
+        """
+        idx = bisect_right(self._break_ends, now)
+        if idx < len(self.breaks) and self.breaks[idx].start < self.workday_end:
+            return self.breaks[idx]
+        return None
+
+    def format_time(self, moment: datetime, fmt: str = '%H:%M') -> str:
+        """Format one of this day's fixed times, caching the result.
+
+        Args:
+            moment: Time to format, e.g. a break time or the workday end
+            fmt: strftime format
+
+        Returns:
+            Formatted time
+        """
+        key = (moment, fmt)
+        label = self._labels.get(key)
+        if label is None:
+            label = self._labels[key] = moment.strftime(fmt)
+        return label
+
+    def next_transition(self, now: datetime) -> Optional[datetime]:
+        """Get the next moment at which the state at ``now`` changes.
+
+        This covers segment boundaries as well as the moments at which the
+        minutes left and the progress percentage tick over. Minutes in which
+        the whole percentage stays the same do not count.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Time of the next change, or None once the workday is done
+        """
+        segment = self.segment_at(now)
+        if segment.kind == BreakState.DONE:
+            return None
+
+        # Minutes left drop one tick after each whole minute before target
+        remaining = (segment.target - now) // _MINUTE
+        candidates = [segment.end, segment.target - remaining * _MINUTE + _TICK]
+        if segment.kind != BreakState.LUNCH:
+            # Progress follows the elapsed minutes on the anchor's grid, but
+            # only ticks over at multiples of total_minutes / 100
+            percent = segment.progress(now)
+            if percent < 100 and segment.total_minutes > 0:
+                elapsed = (now - segment.anchor) // _MINUTE
+                step = max(elapsed + 1, -(-(percent + 1) * segment.total_minutes // 100))
+                candidates.append(segment.anchor + step * _MINUTE)
+        return min(moment for moment in candidates if moment > now)
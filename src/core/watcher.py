@@ -0,0 +1,213 @@
+"""Watching the configuration file for changes made by other programs."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+
+# inotify event flags, see <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+# Writes to the file itself
+_FILE_MASK = _IN_MODIFY | _IN_CLOSE_WRITE
+# Entries of the directory appearing and disappearing, e.g. replacing the file
+_DIRECTORY_MASK = _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal inotify binding over ctypes."""
+
+    def __init__(self):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """Watch a file or directory.
+
+        Returns:
+            Watch descriptor, or -1 if the path cannot be watched
+        """
+        return self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+
+    def read_events(self):
+        """Read pending events and get their watch descriptors and file names."""
+        events = []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return events
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            events.append((wd, os.fsdecode(data[offset:offset + length].rstrip(b"\0"))))
+            offset += length
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ConfigWatcher:
+    """Calls back when a file is created, rewritten, replaced or deleted.
+
+    On Linux the file is watched through inotify for writes, and its parent
+    directory for files being created, renamed or deleted, so that editors
+    and deployment tools that replace the file by renaming are noticed as
+    well. An idle watcher costs nothing. Plain writes to other files do not
+    wake the thread, but creating, renaming or deleting any file in the
+    directory does, for a read of the event only; the callback runs for
+    events of the watched file alone. Elsewhere, or if inotify is
+    unavailable, the file is polled. Bursts of changes are debounced into a
+    single callback, which runs on the watcher thread.
+    """
+
+    def __init__(self, path: str, callback: Callable[[], None], debounce: float = 0.2,
+                 poll_interval: float = 1.0, use_inotify: bool = True):
+        """Initialize the watcher.
+
+        Args:
+            path: File to watch
+            callback: Called on the watcher thread after the file changed
+            debounce: Quiet period that ends a burst of changes, in seconds
+            poll_interval: Time between checks when polling, in seconds
+            use_inotify: Use inotify where available
+        """
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and sys.platform.startswith("linux")
+        self.backend: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        # Wakes up the inotify thread when stopping
+        self._stop_pipe: Optional[Tuple[int, int]] = None
+        self._directory_watch = -1
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self._thread is not None:
+            return
+        inotify = None
+        if self.use_inotify:
+            try:
+                inotify = _Inotify()
+            except (OSError, AttributeError):
+                inotify = None
+            else:
+                self._directory_watch = inotify.add_watch(os.path.dirname(self.path), _DIRECTORY_MASK)
+                if self._directory_watch < 0:
+                    inotify.close()
+                    inotify = None
+                else:
+                    inotify.add_watch(self.path, _FILE_MASK)
+        self._stopping.clear()
+        if inotify is not None:
+            self.backend = "inotify"
+            self._stop_pipe = os.pipe()
+            self._thread = threading.Thread(target=self._watch_inotify, args=(inotify,),
+                                            name="config-watcher", daemon=True)
+        else:
+            self.backend = "polling"
+            self._thread = threading.Thread(target=self._watch_polling,
+                                            name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to end."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        if self._stop_pipe is not None:
+            os.write(self._stop_pipe[1], b"x")
+        self._thread.join()
+        self._thread = None
+        if self._stop_pipe is not None:
+            for fd in self._stop_pipe:
+                os.close(fd)
+            self._stop_pipe = None
+
+    def _watch_inotify(self, inotify: _Inotify) -> None:
+        """Watcher thread using inotify."""
+        watched = [self._stop_pipe[0], inotify.fd]
+        try:
+            while not self._stopping.is_set():
+                select.select(watched, [], [])
+                if self._stopping.is_set() or not self._file_changed(inotify):
+                    continue
+                # Let the burst settle before reading the file; events of
+                # other files do not extend the wait
+                deadline = time.monotonic() + self.debounce
+                while not self._stopping.is_set():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not select.select(watched, [], [], remaining)[0]:
+                        break
+                    if self._file_changed(inotify):
+                        deadline = time.monotonic() + self.debounce
+                if not self._stopping.is_set():
+                    self._notify()
+        finally:
+            inotify.close()
+
+    def _file_changed(self, inotify: _Inotify) -> bool:
+        """Read pending inotify events and check whether any is about the file.
+
+        A file created under the watched name, e.g. by a rename, gets a new
+        watch for its writes.
+        """
+        name = os.path.basename(self.path)
+        changed = False
+        for wd, event_name in inotify.read_events():
+            if wd != self._directory_watch:
+                changed = True
+            elif event_name == name:
+                changed = True
+                inotify.add_watch(self.path, _FILE_MASK)
+        return changed
+
+    def _notify(self) -> None:
+        """Run the callback, watching on even if it fails."""
+        try:
+            self.callback()
+        except Exception as e:
+            print(f"Could not reload {self.path}: {e}", file=sys.stderr)
+
+    def _signature(self) -> Optional[Tuple[int, int, int]]:
+        """Get values that change whenever the file is rewritten."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _watch_polling(self) -> None:
+        """Watcher thread polling the file."""
+        last = self._signature()
+        while not self._stopping.wait(self.poll_interval):
+            current = self._signature()
+            if current == last:
+                continue
+            # Wait until the file stops changing
+            while not self._stopping.wait(self.debounce):
+                settled = self._signature()
+                if settled == current:
+                    break
+                current = settled
+            last = current
+            if not self._stopping.is_set():
+                self._notify()
@@ -1,46 +1,224 @@
 """Main application entry point for Break Reminder."""
 
+import time
+
+# Start of the imports, the first phase reported by --profile-startup
+IMPORT_STARTED_NS = time.perf_counter_ns()
+
+import argparse
+import json
 import sys
-import tkinter as tk
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QEvent, QObject, QTimer, Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 
-from .core.config import ConfigManager
-from .ui.main_widget import BreakReminderWidget
-from .ui.config_dialog import ConfigDialog
+from .core.break_logic import BreakLogic
+from .core.config import ConfigManager, parse_overrides
+from .core.control import (COMMANDS, InstanceLock, control_socket_path, encode_reply,
+                           status_of, status_text)
+from .utils import profiler
+from .utils.memory import resident_memory_mb
+from .utils.profiler import phase
+from .utils.transition_timer import TransitionTimer
 
+# End of the imports
+IMPORTS_DONE_NS = time.perf_counter_ns()
 
-class BreakReminderApp:
-    """Main application class with system tray support."""
 
-    def __init__(self):
-        """Initialize the application."""
-        self.root = tk.Tk()
-        self.setup_window()
+class ConfigReloader(QObject):
+    """Carries changes of the config file from the watcher thread to the GUI thread."""
 
-        self.app = QApplication(sys.argv)
-        self.app.setQuitOnLastWindowClosed(False)  # Keep running in system tray
+    # Changed settings of the user layer, see ConfigManager.external_changes
+    changed = pyqtSignal(object)
 
-        # Initialize configuration
-        self.config_manager = ConfigManager()
 
-        # Initialize main widget
-        self.main_widget = None
+class FirstPaintWatcher(QObject):
+    """Reports the first time a widget is painted."""
+
+    painted = pyqtSignal()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self.painted.emit()
+        return False
+
+
+class ControlServer(QObject):
+    """Answers the commands sent to the control socket, one line each."""
+
+    def __init__(self, handler, parent=None):
+        """Initialize the server.
+
+        Args:
+            handler: Called with each command, returns the reply dictionary
+            parent: Parent object
+        """
+        from PyQt5.QtNetwork import QLocalServer
+
+        super().__init__(parent)
+        self.handler = handler
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.accept_connections)
+
+    def listen(self, name):
+        """Listen on the control socket, replacing one left behind by a crash.
+
+        Args:
+            name: Socket path or pipe name
+
+        Returns:
+            True if listening
+        """
+        self.server.removeServer(name)
+        return self.server.listen(name)
+
+    def close(self):
+        """Stop listening and remove the socket."""
+        self.server.close()
+
+    def accept_connections(self):
+        """Serve the connections waiting to be accepted."""
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self.answer(connection))
+            connection.disconnected.connect(connection.deleteLater)
 
-        # Initialize system tray
-        self.init_system_tray()
+    def answer(self, connection):
+        """Reply to each complete command line received on a connection.
+
+        Args:
+            connection: Client connection
+        """
+        while connection.canReadLine():
+            command = bytes(connection.readLine()).decode("utf-8", "replace").strip()
+            connection.write(encode_reply(self.handler(command)))
+        connection.flush()
+
+
+def forward_command(name, command, timeout_ms=2000):
+    """Send a command to an instance that is already running.
+
+    Args:
+        name: Control socket path or pipe name
+        command: One of ``COMMANDS``
+        timeout_ms: Milliseconds to wait for connecting and for the reply
+
+    Returns:
+        Decoded reply, or None if no instance is listening
+    """
+    from PyQt5.QtNetwork import QLocalSocket
+
+    connection = QLocalSocket()
+    connection.connectToServer(name)
+    if not connection.waitForConnected(timeout_ms):
+        return None
+    connection.write(command.encode("utf-8") + b"\n")
+    connection.flush()
+    reply = b""
+    while not reply.endswith(b"\n") and connection.waitForReadyRead(timeout_ms):
+        reply += bytes(connection.readAll())
+    connection.disconnectFromServer()
+    return json.loads(reply) if reply.endswith(b"\n") else None
+
+
+class BreakReminderApp:
+    """Main application class with system tray support."""
+
+    def __init__(self, argv=None, overrides=None, on_started=None):
+        """Initialize the application.
+
+        Args:
+            argv: Arguments for Qt, defaults to ``sys.argv``
+            overrides: Settings given on the command line
+            on_started: Called once the main widget has been painted, or
+                once the event loop runs when starting minimized
+        """
+        with phase("QApplication"):
+            self.app = QApplication(sys.argv if argv is None else argv)
+            self.app.setQuitOnLastWindowClosed(False)  # Keep running in system tray
+
+        # Initialize configuration; deferred saves must reach the disk on exit
+        with phase("ConfigManager"):
+            self.config_manager = ConfigManager(overrides=overrides)
+            self.app.aboutToQuit.connect(self.config_manager.flush)
+
+        # Break schedule shared by the widget and the tray menu
+        with phase("BreakLogic"):
+            self.break_logic = BreakLogic(self.config_manager.snapshot(),
+                                          typed=self.config_manager.typed_snapshot())
+
+        # The main widget is built when first shown and destroyed once it has
+        # stayed hidden for release_widget_after minutes
+        self.main_widget = None
+        self.release_timer = QTimer()
+        self.release_timer.setSingleShot(True)
+        self.release_timer.timeout.connect(self.release_main_widget)
+
+        # Publish each new break state for status bars; the app runs on
+        # without it if the state file cannot be created
+        from .core.shared_state import StatePublisher, state_file_path
+
+        try:
+            self.state_publisher = StatePublisher(state_file_path())
+        except OSError as e:
+            print(f"Break state is not shared: {e}", file=sys.stderr)
+            self.state_publisher = None
+        else:
+            self.break_logic.add_listener(self.state_publisher.publish_snapshot)
+            self.app.aboutToQuit.connect(self.state_publisher.close)
+
+        # Initialize system tray; its tooltip follows the break logic, so it
+        # works without the widget. The transition timer also runs without a
+        # tray, since it drives the published state, and the widget shares it.
+        self.tray_icon = None
+        with phase("init_system_tray"):
+            self.transition_timer = TransitionTimer(self.break_logic)
+            self.transition_timer.ticked.connect(self.update_tray_status)
+            self.init_system_tray()
+            self.update_tray_status()
+        self.report_config_problems()
+
+        # Periodic reminders next to the break schedule, one timer for all
+        with phase("reminders"):
+            self.reminder_timer = QTimer()
+            self.reminder_timer.setSingleShot(True)
+            self.reminder_timer.setTimerType(Qt.PreciseTimer)
+            self.reminder_timer.timeout.connect(self.fire_reminders)
+            self.load_reminders()
+
+        # Pick up changes that other programs make to the config file; the
+        # file is parsed on the watcher thread and only changes are applied
+        with phase("config watcher"):
+            from .core.watcher import ConfigWatcher
+
+            self.config_reloader = ConfigReloader()
+            self.config_reloader.changed.connect(self.apply_external_config)
+            self.config_watcher = ConfigWatcher(self.config_manager.config_file, self.read_external_config)
+            self.config_watcher.start()
+            self.app.aboutToQuit.connect(self.config_watcher.stop)
 
         # Show main widget or start minimized
         if not self.config_manager.get("start_minimized", False):
-            self.show_main_widget()
-
-    def setup_window(self):
-        """Set up the main window."""
-        self.root.title("Break Reminder Enhanced")
-        self.root.geometry("400x300")  # Set initial size only
-        self.root.minsize(380, 160)    # Set minimum size
-        # Remove any code that sets window position explicitly
+            with phase("BreakReminderWidget"):
+                self.show_main_widget()
+
+        self.on_started = on_started
+        if on_started is not None:
+            if self.main_widget is not None and self.main_widget.isVisible():
+                self.first_paint = FirstPaintWatcher()
+                self.first_paint.painted.connect(self.startup_painted)
+                self.main_widget.installEventFilter(self.first_paint)
+            else:
+                QTimer.singleShot(0, on_started)
+
+    def startup_painted(self):
+        """Record the first paint of the main widget and report the startup."""
+        active = profiler.active()
+        if active is not None:
+            active.mark_first_paint()
+        self.on_started()
 
     def init_system_tray(self):
         """Initialize system tray icon and menu."""
@@ -63,9 +241,6 @@ class BreakReminderApp:
         # Create context menu
         self.create_tray_menu()
 
-        # Set tooltip
-        self.tray_icon.setToolTip("Break Reminder")
-
         # Handle double-click
         self.tray_icon.activated.connect(self.tray_icon_activated)
 
@@ -76,11 +251,34 @@ class BreakReminderApp:
         """Create system tray context menu."""
         menu = QMenu()
 
+        # Current state, kept up to date by update_tray_status
+        self.status_action = QAction("Break Reminder", self.app)
+        self.status_action.setEnabled(False)
+        menu.addAction(self.status_action)
+        menu.addSeparator()
+
         # Show/Hide action
         self.show_action = QAction("Show Break Reminder", self.app)
         self.show_action.triggered.connect(self.show_main_widget)
         menu.addAction(self.show_action)
 
+        # Break actions
+        snooze_action = QAction("Snooze Break", self.app)
+        snooze_action.triggered.connect(
+            lambda: self.adjust_break(self.break_logic.snooze_break,
+                                      self.config_manager.get("snooze_minutes", 5)))
+        menu.addAction(snooze_action)
+
+        skip_action = QAction("Skip Break", self.app)
+        skip_action.triggered.connect(lambda: self.adjust_break(self.break_logic.skip_break))
+        menu.addAction(skip_action)
+
+        take_now_action = QAction("Take Break Now", self.app)
+        take_now_action.triggered.connect(lambda: self.adjust_break(self.break_logic.take_break_now))
+        menu.addAction(take_now_action)
+
+        menu.addSeparator()
+
         # Settings action
         settings_action = QAction("Settings", self.app)
         settings_action.triggered.connect(self.show_settings)
@@ -100,6 +298,35 @@ class BreakReminderApp:
 
         self.tray_icon.setContextMenu(menu)
 
+    def report_config_problems(self):
+        """Tell the user about settings that could not be loaded.
+
+        Problems are printed to stderr and shown as a tray message, since
+        the app otherwise carries on with the defaults.
+        """
+        problems = [str(error) for error in self.config_manager.field_errors.values()]
+        if self.config_manager.load_error:
+            problems.insert(0, self.config_manager.load_error)
+        if not problems:
+            return
+        text = "\n".join(problems)
+        print(f"Using defaults for settings that could not be loaded:\n{text}", file=sys.stderr)
+        if self.tray_icon is not None:
+            self.tray_icon.showMessage("Break Reminder settings", text, QSystemTrayIcon.Warning, 15000)
+
+    def update_tray_status(self):
+        """Show the current break state in the tray tooltip and menu.
+
+        Querying the state at each transition also publishes it.
+        """
+        snapshot = self.break_logic.get_snapshot()
+        self.transition_timer.schedule()
+        if self.tray_icon is None:
+            return
+        status = status_text(snapshot)
+        self.tray_icon.setToolTip(f"Break Reminder\n{status}")
+        self.status_action.setText(status)
+
     def tray_icon_activated(self, reason):
         """Handle system tray icon activation.
 
@@ -110,13 +337,18 @@ class BreakReminderApp:
             self.show_main_widget()
 
     def show_main_widget(self):
-        """Show the main widget."""
+        """Show the main widget, building it first if needed."""
+        self.release_timer.stop()
         if self.main_widget is None:
-            self.main_widget = BreakReminderWidget(self.config_manager)
+            from .ui.main_widget import BreakReminderWidget
+
+            self.main_widget = BreakReminderWidget(self.config_manager, self.break_logic,
+                                                   self.transition_timer)
             self.main_widget.setMinimumSize(380, 160)
             self.main_widget.setMaximumSize(520, 280)
             # Ensure layout is updated before showing
             self.main_widget.updateGeometry()
+            self.main_widget.hidden.connect(self.main_widget_hidden)
         # Only show if not already visible
         if not self.main_widget.isVisible():
             self.main_widget.show()
@@ -125,28 +357,185 @@ class BreakReminderApp:
         self.main_widget.activateWindow()
 
         # Update tray menu
-        self.show_action.setText("Hide Break Reminder")
-        self.show_action.triggered.disconnect()
-        self.show_action.triggered.connect(self.hide_main_widget)
+        self.set_show_action(self.hide_main_widget, "Hide Break Reminder")
 
     def hide_main_widget(self):
         """Hide the main widget."""
         if self.main_widget is not None:
             self.main_widget.hide()
 
-        # Update tray menu
-        self.show_action.setText("Show Break Reminder")
+    def main_widget_hidden(self):
+        """Update the tray menu and start counting down to releasing the widget."""
+        self.set_show_action(self.show_main_widget, "Show Break Reminder")
+        minutes = self.config_manager.get("release_widget_after", 10)
+        if minutes > 0:
+            self.release_timer.start(minutes * 60 * 1000)
+
+    def set_show_action(self, slot, text):
+        """Point the show/hide tray action at a slot.
+
+        Args:
+            slot: Method to call when the action is triggered
+            text: Action text
+        """
+        if self.tray_icon is None:
+            return
+        self.show_action.setText(text)
         self.show_action.triggered.disconnect()
-        self.show_action.triggered.connect(self.show_main_widget)
+        self.show_action.triggered.connect(slot)
+
+    def release_main_widget(self):
+        """Destroy the hidden main widget to free its memory.
+
+        The widget is built again the next time it is shown. With debug mode
+        on, the resident memory before and after is printed to stderr.
+        """
+        widget = self.main_widget
+        if widget is None or widget.isVisible():
+            return
+        before = resident_memory_mb()
+        self.main_widget = None
+        self.transition_timer.ticked.disconnect(widget.update_display)
+        widget.hidden.disconnect(self.main_widget_hidden)
+        widget.deleteLater()
+        if before is not None and self.config_manager.get("debug_mode", False):
+            # Memory is freed once the event loop has deleted the widget
+            QTimer.singleShot(0, lambda: print(
+                f"Released hidden window: {before:.1f} MB -> {resident_memory_mb():.1f} MB resident",
+                file=sys.stderr))
+
+    def load_reminders(self):
+        """Build the reminder streams from the configuration."""
+        from .core.reminders import ReminderMultiplexer
+        from .core.scheduler import ReminderScheduler
+
+        self.reminders = ReminderMultiplexer.from_config(self.config_manager.get_typed("reminders", ()))
+        self.reminder_scheduler = ReminderScheduler(self.reminders)
+        self.schedule_reminders()
+
+    def schedule_reminders(self):
+        """Arm the reminder timer for the earliest pending reminder."""
+        if self.reminders.next_time() is None:
+            self.reminder_timer.stop()
+        else:
+            self.reminder_timer.start(self.reminder_scheduler.next_delay_ms())
+
+    def fire_reminders(self):
+        """Show the reminders that are due."""
+        show = self.tray_icon is not None and self.config_manager.get("notifications_enabled", True)
+        for reminder in self.reminders.pop_due():
+            if show:
+                self.tray_icon.showMessage(reminder.name, reminder.message,
+                                           QSystemTrayIcon.Information, 10000)
+        self.schedule_reminders()
+
+    def adjust_break(self, action, *args):
+        """Run a break action and refresh the widget.
+
+        Args:
+            action: Break logic method such as ``snooze_break``
+            *args: Arguments for the action
+        """
+        if action(*args):
+            if self.main_widget is not None:
+                self.main_widget.update_display()
+            self.update_tray_status()
 
     def show_settings(self):
         """Show settings dialog."""
+        version = self.config_manager.version
+        previous = self.config_manager.snapshot()
+        from .ui.config_dialog import ConfigDialog
+
         dialog = ConfigDialog(self.config_manager)
-        if dialog.exec_() == ConfigDialog.Accepted:
-            # If main widget exists, update it
-            if self.main_widget is not None:
-                self.main_widget.break_logic.update_config(self.config_manager.get_all())
-                self.main_widget.update_display()
+        if dialog.exec_() == ConfigDialog.Accepted and self.config_manager.changed_since(version):
+            self.apply_config_changes(self.config_manager.changed_keys(previous))
+
+    def apply_config_changes(self, changed):
+        """Apply configuration changes, updating only what depends on them.
+
+        Args:
+            changed: Configuration keys whose values changed
+        """
+        if "reminders" in changed:
+            self.load_reminders()
+        # If main widget exists, it applies the rest
+        if self.main_widget is not None:
+            self.main_widget.apply_config_changes(changed)
+        else:
+            self.break_logic.update_config(self.config_manager.snapshot(), changed,
+                                           self.config_manager.typed_snapshot())
+        self.update_tray_status()
+
+    def read_external_config(self):
+        """Parse the changed config file and report what differs (watcher thread)."""
+        loaded = self.config_manager.read_file()
+        if loaded is not None:
+            changes = self.config_manager.external_changes(loaded)
+            if changes:
+                self.config_reloader.changed.emit(changes)
+
+    def apply_external_config(self, changes):
+        """Apply settings changed by another program.
+
+        Args:
+            changes: Changes of the user layer from ``ConfigManager.external_changes``
+        """
+        changed = self.config_manager.apply_external_changes(changes)
+        if changed:
+            self.apply_config_changes(changed)
+
+    def reload_config(self):
+        """Re-read the config file and apply what changed."""
+        loaded = self.config_manager.read_file()
+        if loaded is not None:
+            self.apply_external_config(self.config_manager.external_changes(loaded))
+
+    def start_control_server(self, name):
+        """Accept commands from later launches and other tools.
+
+        Args:
+            name: Control socket path or pipe name
+
+        Returns:
+            True if the server is listening
+        """
+        self.control_server = ControlServer(self.handle_command)
+        if not self.control_server.listen(name):
+            return False
+        self.app.aboutToQuit.connect(self.control_server.close)
+        return True
+
+    def handle_command(self, command):
+        """Run a command received on the control socket.
+
+        Args:
+            command: One of ``COMMANDS``
+
+        Returns:
+            Reply dictionary
+        """
+        if command == "show":
+            self.show_main_widget()
+        elif command == "hide":
+            self.hide_main_widget()
+        elif command == "settings":
+            # The dialog runs its own event loop; answer first
+            QTimer.singleShot(0, self.show_settings)
+        elif command == "reload":
+            self.reload_config()
+        elif command == "status":
+            status = status_of(self.break_logic.get_snapshot())
+            if self.main_widget is None:
+                status["window"] = "released"
+            else:
+                status["window"] = "shown" if self.main_widget.isVisible() else "hidden"
+            return {"ok": True, "status": status}
+        elif command == "quit":
+            QTimer.singleShot(0, self.quit_application)
+        else:
+            return {"ok": False, "error": f"unknown command {command!r}, use {', '.join(COMMANDS)}"}
+        return {"ok": True}
 
     def show_about(self):
         """Show about dialog."""
@@ -168,7 +557,11 @@ class BreakReminderApp:
         """Quit the application."""
         if self.main_widget is not None:
             self.main_widget.close()
-        self.tray_icon.hide()
+        self.reminder_timer.stop()
+        self.transition_timer.stop()
+        self.release_timer.stop()
+        if self.tray_icon is not None:
+            self.tray_icon.hide()
         self.app.quit()
 
     def run(self):
@@ -176,9 +569,79 @@ class BreakReminderApp:
         return self.app.exec_()
 
 
-def main():
-    """Main entry point."""
-    app = BreakReminderApp()
+def main(argv=None):
+    """Main entry point.
+
+    Args:
+        argv: Command-line arguments, defaults to ``sys.argv``
+    """
+    argv = sys.argv if argv is None else argv
+    parser = argparse.ArgumentParser(description="Break Reminder")
+    parser.add_argument("command", nargs="?", choices=COMMANDS,
+                        help="Command for the running instance; without one it is shown. "
+                             "Unless it is status or quit, the app starts if it is not running")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override a setting for this run (can be repeated)")
+    parser.add_argument("--profile-startup", nargs="?", const="", default=None, metavar="JSON_FILE",
+                        help="Print the time of each startup phase to stderr and "
+                             "optionally append it as a JSON line to JSON_FILE")
+    parser.add_argument("--profile-label", default="", metavar="LABEL",
+                        help="Name of the profiled run, such as cold or warm")
+    parser.add_argument("--profile-exit", action="store_true",
+                        help="Quit as soon as the startup profile is written")
+    # Leave the remaining arguments to Qt
+    args, qt_args = parser.parse_known_args(argv[1:])
+    try:
+        overrides = parse_overrides(args.set)
+    except ValueError as e:
+        parser.error(str(e))
+
+    on_started = None
+    if args.profile_startup is not None:
+        startup = profiler.StartupProfiler(IMPORT_STARTED_NS, args.profile_label)
+        startup.record("imports", IMPORT_STARTED_NS, IMPORTS_DONE_NS)
+        profiler.activate(startup)
+
+        def on_started():
+            profiler.activate(None)
+            print(startup.format_text(), file=sys.stderr)
+            if args.profile_startup:
+                startup.write_json(args.profile_startup)
+            if args.profile_exit:
+                app.quit_application()
+
+    # Hand the command over to a running instance instead of starting another
+    command = args.command or "show"
+    with phase("instance check"):
+        control_name = control_socket_path()
+        reply = forward_command(control_name, command)
+        instance_lock = InstanceLock(control_name + ".lock")
+        deadline = time.monotonic() + 5
+        while reply is None and not instance_lock.acquire():
+            # Another instance is starting up; wait for it to listen
+            if time.monotonic() > deadline:
+                print("Break Reminder is starting in another process", file=sys.stderr)
+                return 1
+            time.sleep(0.05)
+            reply = forward_command(control_name, command)
+    if reply is not None:
+        if not reply.get("ok"):
+            print(reply.get("error"), file=sys.stderr)
+            return 1
+        if "status" in reply:
+            print(json.dumps(reply["status"], indent=2, ensure_ascii=False))
+        return 0
+    if command in ("status", "quit"):
+        instance_lock.release()
+        print("Break Reminder is not running", file=sys.stderr)
+        return 1
+
+    app = BreakReminderApp(argv[:1] + qt_args, overrides, on_started)
+    if not app.start_control_server(control_name):
+        print(f"Cannot listen on {control_name}; later launches will start another instance",
+              file=sys.stderr)
+    if command in ("hide", "settings"):
+        app.handle_command(command)
     return app.run()
 
 
@@ -7,6 +7,7 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
 from PyQt5.QtCore import Qt
 
 from ..core.config import ConfigManager
+from ..core.schema import SCHEMA, ConfigValidationError
 from ..ui.styles import StyleManager, Theme
 
 
@@ -17,6 +18,8 @@ class ConfigDialog(QDialog):
         super().__init__(parent)
         self.config_manager = config_manager
         self.style_manager = StyleManager(Theme(config_manager.get("theme", "dark")))
+        # Current error of each invalid field, by configuration key
+        self.field_errors = {}
         
         self.init_ui()
         self.load_values()
@@ -106,6 +109,29 @@ class ConfigDialog(QDialog):
         time_layout.addRow(self.create_label("🍽️ Lunch end (HH:MM):", label_style), self.lunch_end_edit)
         time_layout.addRow(self.create_label("⏰ Workday length (HH:MM):", label_style), self.workday_length_edit)
         
+        # Error of the first invalid field
+        self.error_label = QLabel()
+        self.error_label.setWordWrap(True)
+        self.error_label.setStyleSheet("color: #e53e3e; font-size: 13px;")
+        self.error_label.hide()
+        time_layout.addRow(self.error_label)
+        
+        # Validate each field as it is edited
+        self.time_fields = {
+            "usual_start": self.start_time_edit,
+            "lunch_start": self.lunch_start_edit,
+            "lunch_end": self.lunch_end_edit,
+            "workday_length": self.workday_length_edit,
+        }
+        self.field_names = {
+            "usual_start": "Start time",
+            "lunch_start": "Lunch start",
+            "lunch_end": "Lunch end",
+            "workday_length": "Workday length",
+        }
+        for key, edit in self.time_fields.items():
+            edit.textChanged.connect(lambda text, key=key: self.validate_field(key, text))
+        
         time_group.setLayout(time_layout)
         main_layout.addWidget(time_group)
     
@@ -182,6 +208,13 @@ class ConfigDialog(QDialog):
         self.auto_close_spin.setSuffix(" minutes")
         self.auto_close_spin.setStyleSheet(self.style_manager.get_style("dialog_input"))
         
+        # Minutes a hidden window is kept before its memory is freed
+        self.release_spin = QSpinBox()
+        self.release_spin.setRange(0, 240)
+        self.release_spin.setSuffix(" minutes")
+        self.release_spin.setSpecialValueText("Never")
+        self.release_spin.setStyleSheet(self.style_manager.get_style("dialog_input"))
+        
         # Checkboxes
         checkbox_style = """
             QCheckBox {
@@ -220,6 +253,7 @@ class ConfigDialog(QDialog):
         label_style = self.style_manager.get_style("dialog_label")
         
         behavior_layout.addRow(self.create_label("🔔 Auto-close after workday:", label_style), self.auto_close_spin)
+        behavior_layout.addRow(self.create_label("🧹 Free hidden window after:", label_style), self.release_spin)
         behavior_layout.addRow(self.notifications_check)
         behavior_layout.addRow(self.sound_check)
         behavior_layout.addRow(self.start_minimized_check)
@@ -308,7 +342,7 @@ class ConfigDialog(QDialog):
     
     def load_values(self):
         """Load current configuration values into the form."""
-        config = self.config_manager.get_all()
+        config = self.config_manager.snapshot()
         
         # Time settings
         self.start_time_edit.setText(config.get("usual_start", "08:00"))
@@ -316,6 +350,14 @@ class ConfigDialog(QDialog):
         self.lunch_end_edit.setText(config.get("lunch_end", "12:30"))
         self.workday_length_edit.setText(config.get("workday_length", "08:00"))
         
+        # Settings overridden for this run cannot be changed here
+        for key, edit in self.time_fields.items():
+            source = self.config_manager.source_of(key)
+            overridden = source in ("env", "cli")
+            edit.setEnabled(not overridden)
+            edit.setToolTip(f"Overridden by the {'environment' if source == 'env' else 'command line'}"
+                            if overridden else "")
+        
         # Appearance settings
         theme = config.get("theme", "dark")
         self.theme_combo.setCurrentText("Dark" if theme == "dark" else "Light")
@@ -331,6 +373,7 @@ class ConfigDialog(QDialog):
         
         # Behavior settings
         self.auto_close_spin.setValue(config.get("auto_close_delay", 30))
+        self.release_spin.setValue(config.get("release_widget_after", 10))
         self.notifications_check.setChecked(config.get("notifications_enabled", True))
         self.sound_check.setChecked(config.get("sound_enabled", False))
         self.start_minimized_check.setChecked(config.get("start_minimized", False))
@@ -338,11 +381,9 @@ class ConfigDialog(QDialog):
     def accept_settings(self):
         """Validate and accept the settings."""
         try:
-            # Validate time formats
-            self.validate_time_format(self.start_time_edit.text(), "Start time")
-            self.validate_time_format(self.lunch_start_edit.text(), "Lunch start")
-            self.validate_time_format(self.lunch_end_edit.text(), "Lunch end")
-            self.validate_time_format(self.workday_length_edit.text(), "Workday length")
+            # Fields are validated as they are edited
+            if self.field_errors:
+                raise ValueError(next(iter(self.field_errors.values())))
             
             # Save settings
             self.save_settings()
@@ -355,60 +396,78 @@ class ConfigDialog(QDialog):
         except ValueError as e:
             QMessageBox.warning(self, "Invalid Input", str(e))
     
-    def validate_time_format(self, time_str: str, field_name: str):
-        """Validate time format.
+    def validate_field(self, key: str, text: str) -> bool:
+        """Validate a single field against the configuration schema.
+        
+        Marks the field, shows the first remaining error and enables the OK
+        button only while every field is valid.
         
         Args:
-            time_str: Time string to validate
-            field_name: Name of the field for error messages
+            key: Configuration key of the field
+            text: Current text of the field
             
-        Raises:
-            ValueError: If time format is invalid
+        Returns:
+            True if the field is valid
         """
-        if not time_str:
-            raise ValueError(f"{field_name} cannot be empty")
-        
-        if ":" not in time_str:
-            raise ValueError(f"{field_name} must be in HH:MM format")
-        
         try:
-            hours, minutes = map(int, time_str.split(":"))
-            if hours < 0 or hours > 23:
-                raise ValueError(f"{field_name} hours must be between 0 and 23")
-            if minutes < 0 or minutes > 59:
-                raise ValueError(f"{field_name} minutes must be between 0 and 59")
-        except ValueError:
-            raise ValueError(f"{field_name} must be in HH:MM format with valid numbers")
+            SCHEMA.convert(key, text)
+            self.field_errors.pop(key, None)
+        except ConfigValidationError as e:
+            self.field_errors[key] = f"{self.field_names[key]}: {e.message}"
+        
+        edit = self.time_fields[key]
+        invalid = key in self.field_errors
+        if edit.property("invalid") != invalid:
+            # Restyle only when the invalid selector in the stylesheet changes
+            edit.setProperty("invalid", invalid)
+            edit.setStyleSheet(self.style_manager.get_style("dialog_input"))
+        
+        if self.field_errors:
+            self.error_label.setText(next(iter(self.field_errors.values())))
+            self.error_label.show()
+        else:
+            self.error_label.hide()
+        self.ok_btn.setEnabled(not self.field_errors)
+        return not invalid
     
     def save_settings(self):
-        """Save the current form values to configuration."""
-        # Time settings
-        self.config_manager.set("usual_start", self.start_time_edit.text())
-        self.config_manager.set("lunch_start", self.lunch_start_edit.text())
-        self.config_manager.set("lunch_end", self.lunch_end_edit.text())
-        self.config_manager.set("workday_length", self.workday_length_edit.text())
-        
-        # Appearance settings
-        theme = "dark" if self.theme_combo.currentText() == "Dark" else "light"
-        self.config_manager.set("theme", theme)
+        """Save the form values that differ from the current configuration.
         
+        Settings overridden by the environment or the command line are left
+        alone, and unchanged ones are not written, so that they keep coming
+        from the system file or the defaults.
+        """
         position_map = {
             "Top Right": "top-right",
             "Top Left": "top-left",
             "Bottom Right": "bottom-right",
             "Bottom Left": "bottom-left"
         }
-        position = position_map.get(self.position_combo.currentText(), "top-right")
-        self.config_manager.set("window_position", position)
-        
-        # Behavior settings
-        self.config_manager.set("auto_close_delay", self.auto_close_spin.value())
-        self.config_manager.set("notifications_enabled", self.notifications_check.isChecked())
-        self.config_manager.set("sound_enabled", self.sound_check.isChecked())
-        self.config_manager.set("start_minimized", self.start_minimized_check.isChecked())
+        values = {
+            # Time settings
+            "usual_start": self.start_time_edit.text(),
+            "lunch_start": self.lunch_start_edit.text(),
+            "lunch_end": self.lunch_end_edit.text(),
+            "workday_length": self.workday_length_edit.text(),
+            # Appearance settings
+            "theme": "dark" if self.theme_combo.currentText() == "Dark" else "light",
+            "window_position": position_map.get(self.position_combo.currentText(), "top-right"),
+            # Behavior settings
+            "auto_close_delay": self.auto_close_spin.value(),
+            "release_widget_after": self.release_spin.value(),
+            "notifications_enabled": self.notifications_check.isChecked(),
+            "sound_enabled": self.sound_check.isChecked(),
+            "start_minimized": self.start_minimized_check.isChecked(),
+        }
+        changes = {key: value for key, value in values.items()
+                   if self.config_manager.source_of(key) not in ("env", "cli")
+                   and value != self.config_manager.get(key)}
+        if not changes:
+            return
+        self.config_manager.update(changes)
         
         # Save to file
-        self.config_manager.save()
+        self.config_manager.save_deferred()
     
     def reset_to_defaults(self):
         """Reset all settings to default values."""
@@ -422,6 +481,6 @@ class ConfigDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             self.config_manager.reset_to_defaults()
-            self.config_manager.save()
+            self.config_manager.save_deferred()
             self.load_values()
             QMessageBox.information(self, "Success", "Settings reset to defaults!")
\ No newline at end of file
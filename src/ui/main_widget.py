@@ -1,15 +1,17 @@
 """Main break reminder widget with enhanced UI."""
 
 from PyQt5 import QtWidgets, QtCore, QtGui
-from PyQt5.QtCore import QTimer, QPointF, Qt
+from PyQt5.QtCore import QTimer, QPointF, Qt, pyqtSignal
 from PyQt5.QtGui import QColor, QCursor, QFont
 from PyQt5.QtWidgets import (QWidget, QLabel, QVBoxLayout, QHBoxLayout, 
                             QPushButton, QGraphicsDropShadowEffect, QApplication, QProgressBar)
 
 from ..core.break_logic import BreakLogic, BreakState
 from ..core.config import ConfigManager
+from ..core.schedule import SCHEDULE_KEYS
 from ..ui.styles import StyleManager, Theme
-from .config_dialog import ConfigDialog
+from ..utils.profiler import phase
+from ..utils.transition_timer import TransitionTimer
 
 
 class StatusIndicator(QLabel):
@@ -108,27 +110,38 @@ class StatusIndicator(QLabel):
 class BreakReminderWidget(QWidget):
     """Modern break reminder widget with enhanced UI."""
     
-    def __init__(self, config_manager: ConfigManager):
+    # Emitted whenever the window is hidden or closed
+    hidden = pyqtSignal()
+    
+    def __init__(self, config_manager: ConfigManager, break_logic: BreakLogic = None,
+                 transitions: TransitionTimer = None):
         super().__init__()
         self.config_manager = config_manager
         self.style_manager = StyleManager(Theme(config_manager.get("theme", "dark")))
-        self.break_logic = BreakLogic(config_manager.get_all())
+        if break_logic is None:
+            break_logic = BreakLogic(config_manager.snapshot(), typed=config_manager.typed_snapshot())
+        self.break_logic = break_logic
         
         # Widget state
         self.dragging = False
         self.drag_start_position = None
         self.close_timer_started = False
+        # Latest state snapshot, shared with other readers such as the tray
+        self.snapshot = None
         
         # Initialize UI
-        self.init_ui()
+        with phase("init_ui"):
+            self.init_ui()
         
-        # Setup update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(60000)  # Update every minute
+        # Update at each state boundary; the app shares its timer with the tray
+        if transitions is None:
+            transitions = TransitionTimer(self.break_logic, self)
+        self.transitions = transitions
+        self.transitions.ticked.connect(self.update_display)
         
         # Initial update
-        self.update_display()
+        with phase("first update_display"):
+            self.update_display()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -142,22 +155,29 @@ class BreakReminderWidget(QWidget):
         
         # Main container
         self.container = QWidget()
-        self.container.setStyleSheet(self.style_manager.get_style("main_window"))
+        with phase("stylesheets"):
+            self.container.setStyleSheet(self.style_manager.get_style("main_window"))
         self.container.setCursor(Qt.OpenHandCursor)
         
-        # Create UI components
-        self.create_status_indicator()
-        self.create_labels()
-        self.create_progress_bar()
-        self.create_buttons()
-        self.create_layout()
+        # Create UI components; the status indicator sizes its font from the font metrics
+        with phase("status indicator"):
+            self.create_status_indicator()
+        with phase("labels"):
+            self.create_labels()
+        with phase("progress bar"):
+            self.create_progress_bar()
+        with phase("buttons"):
+            self.create_buttons()
+        with phase("layout"):
+            self.create_layout()
         
         # Window setup with responsive sizing - fix geometry conflicts
         self.setMinimumSize(380, 160)  # Increased minimum height to prevent conflicts
         self.setMaximumSize(520, 280)  # Increased maximum height for better content display
         self.resize(400, 180)          # Set initial size within constraints
         self.position_window()
-        self.add_drop_shadow()
+        with phase("drop shadow"):
+            self.add_drop_shadow()
         
         # Tooltip for drag functionality
         self.setToolTip("💡 Click and drag to move • Right-click for options")
@@ -331,12 +351,14 @@ class BreakReminderWidget(QWidget):
     
     def update_display(self):
         """Update the display with current break information."""
-        state, info = self.break_logic.get_current_state()
+        snapshot = self.break_logic.get_snapshot()
+        self.snapshot = snapshot
+        state = snapshot.state
         
         # Update main message
-        message = info["message"]
+        message = snapshot.message
         if self.config_manager.get("debug_mode", False):
-            debug_info = info.get("debug_info", [])
+            debug_info = snapshot.debug_info
             if debug_info:
                 message += "\\n\\n" + "\\n".join(debug_info)
         
@@ -347,14 +369,16 @@ class BreakReminderWidget(QWidget):
         self.status_indicator.update_status(state, color)
         
         # Update progress bar
-        progress_percent = info.get("progress_percent", 0)
+        progress_percent = snapshot.progress_percent
         self.progress_bar.setValue(progress_percent)
-        self.progress_bar.setProperty("breakState", state.value)
-        self.progress_bar.setStyleSheet(self.style_manager.get_style("progress_bar"))
+        if self.progress_bar.property("breakState") != state.value:
+            # Restyle only when the state selector in the stylesheet changes
+            self.progress_bar.setProperty("breakState", state.value)
+            self.progress_bar.setStyleSheet(self.style_manager.get_style("progress_bar"))
         
         # Update progress bar tooltip with more info
-        next_event = info.get("next_event", "Unknown")
-        time_left = info.get("time_left", 0)
+        next_event = snapshot.next_event
+        time_left = snapshot.time_left
         if time_left > 0:
             self.progress_bar.setToolTip(f"{next_event} in {time_left} minutes ({progress_percent}% complete)")
         else:
@@ -363,11 +387,19 @@ class BreakReminderWidget(QWidget):
         # Adjust window size based on content
         self.adjust_window_size()
         
-        # Handle workday completion
-        if state == BreakState.DONE and not self.close_timer_started:
+        # Handle workday completion, re-arming auto close once a new day starts
+        if state != BreakState.DONE:
+            self.close_timer_started = False
+        elif not self.close_timer_started:
             self.close_timer_started = True
             auto_close_delay = self.config_manager.get("auto_close_delay", 30)
             QTimer.singleShot(auto_close_delay * 60 * 1000, self.close)
+        
+        self.schedule_next_update()
+    
+    def schedule_next_update(self):
+        """Arm the update timer for the next state transition."""
+        self.transitions.schedule()
     
     def adjust_window_size(self):
         """Dynamically adjust window size based on content with improved constraints."""
@@ -397,26 +429,43 @@ class BreakReminderWidget(QWidget):
             checked: Whether debug mode is enabled
         """
         self.config_manager.set("debug_mode", checked)
-        self.config_manager.save()
+        self.config_manager.save_deferred()
         self.update_display()
     
     def open_settings(self):
         """Open the settings dialog."""
+        version = self.config_manager.version
+        previous = self.config_manager.snapshot()
+        # Loaded on first use to keep it out of startup
+        from .config_dialog import ConfigDialog
+        
         dialog = ConfigDialog(self.config_manager, self)
-        if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            # Update break logic with new configuration
-            self.break_logic.update_config(self.config_manager.get_all())
-            
-            # Update theme if changed
+        if dialog.exec_() == QtWidgets.QDialog.Accepted and self.config_manager.changed_since(version):
+            self.apply_config_changes(self.config_manager.changed_keys(previous))
+    
+    def apply_config_changes(self, changed):
+        """Apply configuration changes, updating only what depends on them.
+        
+        Args:
+            changed: Configuration keys whose values changed
+        """
+        if not changed:
+            return
+        
+        # Recompile the schedule only for time related keys
+        self.break_logic.update_config(self.config_manager.snapshot(), changed,
+                                       self.config_manager.typed_snapshot())
+        
+        if "theme" in changed:
             new_theme = Theme(self.config_manager.get("theme", "dark"))
             if new_theme != self.style_manager.theme:
                 self.style_manager.set_theme(new_theme)
                 self.apply_theme()
-            
-            # Update window position if changed
+        
+        if "window_position" in changed:
             self.position_window()
-            
-            # Update display
+        
+        if not SCHEDULE_KEYS.isdisjoint(changed) or "debug_mode" in changed:
             self.update_display()
     
     def apply_theme(self):
@@ -430,7 +479,7 @@ class BreakReminderWidget(QWidget):
         self.progress_bar.setStyleSheet(self.style_manager.get_style("progress_bar"))
         
         # Update status indicator color
-        state, _ = self.break_logic.get_current_state()
+        state = self.break_logic.get_snapshot().state
         color = self.style_manager.get_status_color(state.value)
         self.status_indicator.update_status(state, color)
     
@@ -469,6 +518,17 @@ class BreakReminderWidget(QWidget):
         """Handle right-click context menu."""
         menu = QtWidgets.QMenu(self)
         
+        # Break actions
+        snooze_minutes = self.config_manager.get("snooze_minutes", 5)
+        snooze_action = menu.addAction(f"⏰ Snooze break {snooze_minutes} min")
+        snooze_action.triggered.connect(self.snooze_break)
+        skip_action = menu.addAction("⏭️ Skip break")
+        skip_action.triggered.connect(self.skip_break)
+        take_now_action = menu.addAction("☕ Take break now")
+        take_now_action.triggered.connect(self.take_break_now)
+        
+        menu.addSeparator()
+        
         # Settings action
         settings_action = menu.addAction("⚙️ Settings")
         settings_action.triggered.connect(self.open_settings)
@@ -498,6 +558,21 @@ class BreakReminderWidget(QWidget):
         
         menu.exec_(event.globalPos())
     
+    def snooze_break(self):
+        """Postpone the current or next break."""
+        if self.break_logic.snooze_break(self.config_manager.get("snooze_minutes", 5)):
+            self.update_display()
+    
+    def skip_break(self):
+        """Skip the current or next break."""
+        if self.break_logic.skip_break():
+            self.update_display()
+    
+    def take_break_now(self):
+        """Start the next break right away."""
+        if self.break_logic.take_break_now():
+            self.update_display()
+    
     def change_theme(self, theme: Theme):
         """Change the application theme.
         
@@ -506,7 +581,7 @@ class BreakReminderWidget(QWidget):
         """
         self.style_manager.set_theme(theme)
         self.config_manager.set("theme", theme.value)
-        self.config_manager.save()
+        self.config_manager.save_deferred()
         self.apply_theme()
     
     def show_about(self):
@@ -549,6 +624,11 @@ class BreakReminderWidget(QWidget):
             progress_height = max(18, int(font_metrics.height() * 1.2))
             self.progress_bar.setFixedHeight(progress_height)
     
+    def hideEvent(self, event):
+        """Handle window hide event."""
+        super().hideEvent(event)
+        self.hidden.emit()
+    
     def closeEvent(self, event):
         """Handle window close event."""
         # Save window position
@@ -12,7 +12,16 @@ class Theme(Enum):
 
 
 class StyleManager:
-    """Manages application styles and themes."""
+    """Manages application styles and themes.
+    
+    The styles of a theme are built the first time the theme is used.
+    """
+    
+    # Method building the styles of each theme
+    _THEME_BUILDERS = {
+        "dark": "_get_dark_theme",
+        "light": "_get_light_theme",
+    }
     
     def __init__(self, theme: Theme = Theme.DARK):
         """Initialize style manager.
@@ -21,18 +30,25 @@ class StyleManager:
             theme: Theme to use for styling
         """
         self.theme = theme
-        self._styles = self._load_styles()
+        self._styles: Dict[str, Dict[str, Any]] = {}
     
-    def _load_styles(self) -> Dict[str, Dict[str, str]]:
-        """Load all available styles.
+    def _theme_styles(self) -> Dict[str, Any]:
+        """Get the style definitions of the active theme, building them once.
         
         Returns:
             Dictionary of style definitions
         """
-        return {
-            "dark": self._get_dark_theme(),
-            "light": self._get_light_theme(),
-        }
+        theme_name = self.theme.value
+        if theme_name == "auto":
+            # For now, default to dark theme for auto
+            theme_name = "dark"
+        
+        styles = self._styles.get(theme_name)
+        if styles is None:
+            builder = self._THEME_BUILDERS.get(theme_name)
+            styles = getattr(self, builder)() if builder else {}
+            self._styles[theme_name] = styles
+        return styles
     
     def _get_dark_theme(self) -> Dict[str, str]:
         """Get dark theme styles.
@@ -207,6 +223,9 @@ class StyleManager:
                 QLineEdit::placeholder {
                     color: rgba(255, 255, 255, 0.5);
                 }
+                QLineEdit[invalid="true"] {
+                    border-color: #e53e3e;
+                }
             """,
             "dialog_button": """
                 QPushButton {
@@ -448,6 +467,9 @@ class StyleManager:
                 QLineEdit::placeholder {
                     color: #6c757d;
                 }
+                QLineEdit[invalid="true"] {
+                    border-color: #dc3545;
+                }
             """,
             "dialog_button": """
                 QPushButton {
@@ -526,12 +548,7 @@ class StyleManager:
         Returns:
             CSS style string
         """
-        theme_name = self.theme.value
-        if theme_name == "auto":
-            # For now, default to dark theme for auto
-            theme_name = "dark"
-        
-        return self._styles.get(theme_name, {}).get(element, "")
+        return self._theme_styles().get(element, "")
     
     def get_status_color(self, status: str) -> str:
         """Get color for a specific status.
@@ -542,11 +559,7 @@ class StyleManager:
         Returns:
             Color hex code
         """
-        theme_name = self.theme.value
-        if theme_name == "auto":
-            theme_name = "dark"
-        
-        colors = self._styles.get(theme_name, {}).get("status_colors", {})
+        colors = self._theme_styles().get("status_colors", {})
         return colors.get(status, "#ffffff")
     
     def set_theme(self, theme: Theme) -> None:
@@ -0,0 +1,23 @@
+"""Memory use of the running process."""
+
+from typing import Optional
+
+
+def resident_memory_mb(field: str = "VmRSS") -> Optional[float]:
+    """Get the memory use of this process from ``/proc/self/status``.
+
+    Args:
+        field: ``VmRSS`` for the current resident set size, ``VmHWM`` for
+            its peak
+
+    Returns:
+        Size in megabytes, or None where ``/proc`` is not available
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
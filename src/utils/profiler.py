@@ -0,0 +1,154 @@
+"""Startup profiling with per-phase timing."""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class StartupProfiler:
+    """Records how long each phase of the application startup takes.
+
+    Times come from ``time.perf_counter_ns`` and are reported relative to
+    the origin, normally the moment the entry point module started
+    importing. Phases may nest; nested phases are indented in the report.
+    """
+
+    def __init__(self, origin_ns: Optional[int] = None, label: str = ""):
+        """Initialize the profiler.
+
+        Args:
+            origin_ns: ``perf_counter_ns`` value at which startup began,
+                defaults to now
+            label: Free-form name of the run, e.g. "cold" or "warm"
+        """
+        self.origin_ns = time.perf_counter_ns() if origin_ns is None else origin_ns
+        self.label = label
+        self.phases: List[Dict[str, Any]] = []
+        self.first_paint_ns: Optional[int] = None
+        self._depth = 0
+
+    def record(self, name: str, start_ns: int, end_ns: int) -> None:
+        """Record a phase that has already ended.
+
+        Args:
+            name: Phase name
+            start_ns: ``perf_counter_ns`` value at the start of the phase
+            end_ns: ``perf_counter_ns`` value at the end of the phase
+        """
+        self.phases.append({"name": name, "depth": self._depth,
+                            "start_ns": start_ns, "end_ns": end_ns})
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase.
+
+        Args:
+            name: Phase name
+        """
+        entry = {"name": name, "depth": self._depth, "start_ns": time.perf_counter_ns(), "end_ns": None}
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry["end_ns"] = time.perf_counter_ns()
+
+    def mark_first_paint(self) -> None:
+        """Record the moment the first window was painted."""
+        if self.first_paint_ns is None:
+            self.first_paint_ns = time.perf_counter_ns()
+
+    def _ms(self, ns: int) -> float:
+        """Convert a timestamp to milliseconds since the origin."""
+        return round((ns - self.origin_ns) / 1e6, 3)
+
+    def report(self) -> Dict[str, Any]:
+        """Get the phase breakdown.
+
+        Returns:
+            Dictionary with the phases, time to first paint and total time
+            in milliseconds, plus details of the run
+        """
+        from .. import __version__
+
+        finished = [entry for entry in self.phases if entry["end_ns"] is not None]
+        end_ns = max([entry["end_ns"] for entry in finished] + [self.first_paint_ns or self.origin_ns])
+        return {
+            "label": self.label,
+            "version": __version__,
+            "python": "%d.%d.%d" % sys.version_info[:3],
+            "timestamp": time.time(),
+            "phases": [{"name": entry["name"], "depth": entry["depth"],
+                        "start_ms": self._ms(entry["start_ns"]),
+                        "duration_ms": round((entry["end_ns"] - entry["start_ns"]) / 1e6, 3)}
+                       for entry in finished],
+            "time_to_first_paint_ms": None if self.first_paint_ns is None else self._ms(self.first_paint_ns),
+            "total_ms": self._ms(end_ns),
+        }
+
+    def format_text(self) -> str:
+        """Format the phase breakdown as a table.
+
+        Returns:
+            Human readable report
+        """
+        report = self.report()
+        title = "Startup profile" + (f" ({report['label']})" if report["label"] else "")
+        lines = [title]
+        for entry in report["phases"]:
+            name = "  " * entry["depth"] + entry["name"]
+            lines.append(f"  {name:<32} {entry['duration_ms']:9.1f} ms  (at {entry['start_ms']:.1f} ms)")
+        first_paint = report["time_to_first_paint_ms"]
+        lines.append(f"  {'time to first paint':<32} "
+                     + ("no window shown" if first_paint is None else f"{first_paint:9.1f} ms"))
+        lines.append(f"  {'total':<32} {report['total_ms']:9.1f} ms")
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        """Append the report as one JSON line, so runs can be compared.
+
+        Args:
+            path: File to append to
+        """
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.report()) + "\n")
+
+
+# Profiler of the running startup, if profiling is enabled
+_active: Optional[StartupProfiler] = None
+
+
+def activate(profiler: Optional[StartupProfiler]) -> None:
+    """Set the profiler that ``phase`` records into.
+
+    Args:
+        profiler: Profiler to use, or None to stop profiling
+    """
+    global _active
+    _active = profiler
+
+
+def active() -> Optional[StartupProfiler]:
+    """Get the active profiler.
+
+    Returns:
+        The active profiler, or None if profiling is disabled
+    """
+    return _active
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a phase with the active profiler; does nothing without one.
+
+    Args:
+        name: Phase name
+    """
+    if _active is None:
+        yield
+    else:
+        with _active.phase(name):
+            yield
@@ -0,0 +1,49 @@
+"""Qt timer shared by every display of the break state."""
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from ..core.break_logic import BreakLogic
+from ..core.scheduler import TransitionScheduler
+
+
+class TransitionTimer(QObject):
+    """Single-shot timer armed for the next state transition.
+
+    The tray and the widget both connect to ``ticked`` instead of running
+    timers of their own, so the process wakes up once per transition.
+    Whoever refreshes the state outside a tick calls ``schedule`` to re-arm
+    the timer for the new next transition.
+    """
+
+    # Emitted when the next state transition is due
+    ticked = pyqtSignal()
+
+    def __init__(self, break_logic: BreakLogic, parent: QObject = None):
+        """Initialize the timer.
+
+        Args:
+            break_logic: Break logic whose transitions are followed
+            parent: Owner of the timer
+        """
+        super().__init__(parent)
+        self.scheduler = TransitionScheduler(break_logic)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.ticked)
+
+    def schedule(self) -> None:
+        """Arm the timer for the next state transition."""
+        self.timer.start(self.scheduler.next_delay_ms())
+
+    def stop(self) -> None:
+        """Stop the timer."""
+        self.timer.stop()
+
+    def isActive(self) -> bool:
+        """Check whether the timer is armed.
+
+        Returns:
+            True if a tick is pending
+        """
+        return self.timer.isActive()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Test script for detecting which settings changed."""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.config import ConfigManager
+
+
+def test_changed_keys():
+    """Only keys whose values differ from the earlier copy are reported."""
+    with tempfile.TemporaryDirectory() as directory:
+        config = ConfigManager(os.path.join(directory, "config.json"), system_file=None, environ={})
+        config.set("theme", "light")
+
+        previous = config.get_all()
+        config.set("theme", "light")
+        config.set("window_position", "bottom-left")
+        config.set("holidays", ["2025-12-24"])
+        assert config.changed_keys(previous) == {"window_position", "holidays"}
+        assert config.changed_keys(config.get_all()) == set()
+    print("✓ Configuration change detection works")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing configuration change detection...")
+
+    try:
+        test_changed_keys()
+
+        print("\n🎉 All change detection tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
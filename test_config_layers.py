@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Test script for layered configuration sources."""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+from datetime import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.config import REMOVED, ConfigManager, environment_overrides, parse_overrides
+from src.core.migrations import CONFIG_VERSION
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Opens the settings dialog over a directory, ticks one box and presses OK
+DIALOG_SCRIPT = """
+import json, os, sys
+from PyQt5.QtWidgets import QApplication
+from src.core.config import ConfigManager
+from src.ui.config_dialog import ConfigDialog
+
+app = QApplication(sys.argv[:1])
+directory = sys.argv[1]
+config = ConfigManager(os.path.join(directory, "user.json"),
+                       system_file=os.path.join(directory, "system.json"), environ={},
+                       overrides={"usual_start": "06:00"})
+dialog = ConfigDialog(config)
+dialog.save_settings()
+dialog.sound_check.setChecked(not config.get("sound_enabled"))
+dialog.save_settings()
+config.flush()
+print(json.dumps(config.read_file()))
+"""
+
+
+def write_json(path, values):
+    """Write settings to a file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(values, f)
+
+
+def make_manager(directory, system=None, user=None, environ=None, overrides=None):
+    """Create a manager over files in a directory."""
+    system_file = os.path.join(directory, "system.json")
+    user_file = os.path.join(directory, "user.json")
+    if system is not None:
+        write_json(system_file, system)
+    if user is not None:
+        write_json(user_file, user)
+    return ConfigManager(user_file, system_file=system_file, environ=environ or {},
+                         overrides=overrides)
+
+
+def test_precedence():
+    """Each layer overrides the ones below it and its source is tracked."""
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(
+            directory,
+            system={"usual_start": "07:00", "lunch_start": "11:00", "theme": "light"},
+            user={"lunch_start": "11:30", "workday_length": "07:30"},
+            environ={"BREAK_REMINDER_WORKDAY_LENGTH": "06:00", "BREAK_REMINDER_DEBUG_MODE": "true",
+                     "BREAK_REMINDER_UNKNOWN": "1", "PATH": "/bin"},
+            overrides={"debug_mode": False},
+        )
+        assert config.get("window_position") == "top-right"
+        assert config.source_of("window_position") == "defaults"
+        assert config.get("usual_start") == "07:00"
+        assert config.source_of("usual_start") == "system"
+        assert config.get("lunch_start") == "11:30"
+        assert config.source_of("lunch_start") == "user"
+        assert config.get("workday_length") == "06:00"
+        assert config.source_of("workday_length") == "env"
+        assert config.get("debug_mode") is False
+        assert config.source_of("debug_mode") == "cli"
+        assert config.get_typed("usual_start") == time(7)
+        assert config.source_of("unknown") is None
+    print("✓ Layers override each other in order")
+
+
+def test_only_user_layer_is_saved():
+    """Saving writes the user layer alone; overrides keep precedence."""
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(directory, system={"theme": "light"},
+                              environ={"BREAK_REMINDER_USUAL_START": "06:30"})
+        config.set("lunch_end", "12:45")
+        config.set("usual_start", "09:00")
+        assert config.get("usual_start") == "06:30"
+        config.save()
+        assert config.read_file() == {"config_version": CONFIG_VERSION,
+                                      "lunch_end": "12:45", "usual_start": "09:00"}
+
+        # Resetting falls back to the organization defaults
+        config.reset_to_defaults()
+        assert config.get("theme") == "light"
+        assert config.get("lunch_end") == "12:30"
+    print("✓ Only the user layer is saved")
+
+
+def test_settings_dialog_saves_changes_only():
+    """The settings dialog writes only the fields that were changed."""
+    with tempfile.TemporaryDirectory() as directory:
+        write_json(os.path.join(directory, "system.json"),
+                   {"theme": "light", "window_position": "bottom-left"})
+        env = dict(os.environ)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        result = subprocess.run([sys.executable, "-c", DIALOG_SCRIPT, directory], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    # Neither the override nor the organization defaults were copied
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == {"config_version": CONFIG_VERSION,
+                                                                 "sound_enabled": True}
+    print("✓ Settings dialog saves only changed fields")
+
+
+def test_replacing_a_layer():
+    """Replacing a layer rebuilds the merged view and reports changes."""
+    with tempfile.TemporaryDirectory() as directory:
+        user = {"config_version": CONFIG_VERSION, "theme": "dark", "snooze_minutes": 10}
+        config = make_manager(directory, system={"theme": "light"}, user=user)
+        assert config.external_changes(user) == {}
+        changes = config.external_changes({"config_version": CONFIG_VERSION, "snooze_minutes": 10})
+        assert changes == {"theme": REMOVED}
+        version = config.version
+        assert config.apply_external_changes(changes) == {"theme"}
+        assert config.get("theme") == "light" and config.source_of("theme") == "system"
+        assert config.version == version + 1
+        # A setting that no other layer holds disappears entirely
+        changes = config.external_changes({"config_version": CONFIG_VERSION, "snooze_minutes": 10,
+                                           "custom_plugin": 1})
+        assert config.apply_external_changes(changes) == {"custom_plugin"}
+        changes = config.external_changes({"config_version": CONFIG_VERSION, "snooze_minutes": 10})
+        assert changes == {"custom_plugin": REMOVED}
+        assert config.apply_external_changes(changes) == {"custom_plugin"}
+        assert config.get("custom_plugin") is None and config.source_of("custom_plugin") is None
+        # Unsaved changes made in the meantime win
+        config.set("snooze_minutes", 15)
+        assert config.apply_external_changes({"snooze_minutes": (20, 20)}) == set()
+        assert config.get("snooze_minutes") == 15
+
+        config.save()
+        changed = config.set_layer("user", {"snooze_minutes": 0, "usual_start": "09:00"})
+        assert changed == {"usual_start"}
+        assert config.get("theme") == "light"
+        # The invalid value keeps the previous one
+        assert config.get("snooze_minutes") == 15
+        assert set(config.field_errors) == {"snooze_minutes"}
+    print("✓ Replacing a layer applies only the changes")
+
+
+def test_snapshots_and_versions():
+    """Snapshots are shared, read-only and never change afterwards."""
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(directory)
+        version = config.version
+        snapshot = config.snapshot()
+        assert config.snapshot() is snapshot
+        try:
+            snapshot["theme"] = "light"
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Snapshots should be read-only")
+
+        # Setting an unchanged value keeps the version
+        config.set("theme", "dark")
+        assert not config.changed_since(version)
+        assert config.snapshot() is snapshot
+
+        config.set("theme", "light")
+        assert config.changed_since(version)
+        assert snapshot["theme"] == "dark"
+        assert config.snapshot()["theme"] == "light"
+        assert config.changed_keys(snapshot) == {"theme"}
+
+        version = config.version
+        assert config.set_layer("user", {"theme": "light"}) == set()
+        assert not config.changed_since(version)
+        config.reset_to_defaults()
+        assert config.version == version + 1
+    print("✓ Snapshots are versioned and immutable")
+
+
+def test_override_parsing():
+    """Overrides are decoded as JSON where possible."""
+    assert parse_overrides(["usual_start=09:00", "debug_mode=true", "workdays=[\"mon\"]"]) == {
+        "usual_start": "09:00", "debug_mode": True, "workdays": ["mon"]}
+    assert environment_overrides({"BREAK_REMINDER_AUTO_CLOSE_DELAY": "15"}) == {"auto_close_delay": 15}
+    try:
+        parse_overrides(["debug_mode"])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Override without a value should be rejected")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(directory, overrides={"theme": "purple"})
+        assert config.get("theme") == "dark"
+        assert set(config.field_errors) == {"theme"}
+    print("✓ Command-line and environment overrides are parsed")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing layered configuration...")
+
+    try:
+        test_precedence()
+        test_only_user_layer_is_saved()
+        test_settings_dialog_saves_changes_only()
+        test_replacing_a_layer()
+        test_snapshots_and_versions()
+        test_override_parsing()
+
+        print("\n🎉 All layer tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Stress test for configuration writes from many processes."""
+
+import sys
+import os
+import multiprocessing
+import statistics
+import tempfile
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.config import ConfigManager, merge_into_file, read_settings_file
+from src.core.migrations import CONFIG_VERSION
+
+
+WORKERS = 8
+WRITES = 25
+
+
+def write_settings(path, worker, results):
+    """Worker process: save its own settings one at a time."""
+    config = ConfigManager(path, system_file=None, environ={})
+    holds = []
+    for step in range(WRITES):
+        config.set(f"worker_{worker}_{step}", step)
+        config.set("snooze_minutes", worker * 100 + step + 1)
+        config.save()
+        holds.append(config.last_lock_hold)
+    results.put(holds)
+
+
+def test_no_lost_updates():
+    """Concurrent writers keep each other's changes."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=write_settings, args=(path, worker, results))
+                     for worker in range(WORKERS)]
+        for process in processes:
+            process.start()
+        holds = [hold for _ in processes for hold in results.get(timeout=60)]
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+
+        settings, stamps = read_settings_file(path)
+        for worker in range(WORKERS):
+            for step in range(WRITES):
+                assert settings[f"worker_{worker}_{step}"] == step
+        # The shared setting holds the newest write
+        assert settings["snooze_minutes"] % 100 == WRITES
+        assert set(stamps) == set(settings)
+
+        median, longest = statistics.median(holds), max(holds)
+        assert median < 0.02, f"Median lock hold {median * 1000:.1f} ms"
+        assert longest < 0.25, f"Longest lock hold {longest * 1000:.1f} ms"
+    print(f"✓ {WORKERS} processes wrote {WORKERS * WRITES} settings without losses "
+          f"(lock held {median * 1000:.2f} ms median, {longest * 1000:.2f} ms max)")
+
+
+def test_newest_change_wins():
+    """A stale change does not overwrite a newer one from another process."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        first = ConfigManager(path, system_file=None, environ={})
+        second = ConfigManager(path, system_file=None, environ={})
+
+        first.set("theme", "light")
+        second.set("theme", "dark")
+        second.set("debug_mode", True)
+        second.save()
+        first.save()
+        assert first.read_file() == {"config_version": CONFIG_VERSION, "theme": "dark", "debug_mode": True}
+
+        # Resetting removes the settings this process knows about
+        merge_into_file(path, {"sound_enabled": (time.time_ns(), True)})
+        second.reset_to_defaults()
+        second.save()
+        assert second.read_file() == {"config_version": CONFIG_VERSION, "sound_enabled": True}
+    print("✓ The newest change of a setting wins")
+
+
+def test_unchanged_values_are_not_stamped():
+    """Saving values that were not changed keeps another process's newer change."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        first = ConfigManager(path, system_file=None, environ={})
+        first.set("theme", "light")
+        first.save()
+
+        # Another process changes the theme while a settings dialog is open
+        second = ConfigManager(path, system_file=None, environ={})
+        second.set("theme", "dark")
+        second.save()
+        stamps = read_settings_file(path)[1]
+
+        first.update({"theme": "light", "sound_enabled": True})
+        first.set("theme", "light")
+        first.save()
+        settings, new_stamps = read_settings_file(path)
+        assert settings["theme"] == "dark" and settings["sound_enabled"] is True
+        assert new_stamps["theme"] == stamps["theme"]
+    print("✓ Unchanged values keep newer changes of other processes")
+
+
+def test_pending_changes_survive_reload():
+    """Reloading the file keeps changes that are not saved yet."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        config = ConfigManager(path, system_file=None, environ={})
+        config.set("theme", "light")
+        merge_into_file(path, {"usual_start": (time.time_ns(), "09:00")})
+
+        changed = config.set_layer("user", config.read_file())
+        assert changed == {"usual_start"}
+        assert config.get("theme") == "light"
+        config.save()
+        assert config.read_file() == {"config_version": CONFIG_VERSION,
+                                      "theme": "light", "usual_start": "09:00"}
+    print("✓ Unsaved changes survive a reload")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing concurrent configuration writes...")
+
+    try:
+        test_no_lost_updates()
+        test_newest_change_wins()
+        test_unchanged_values_are_not_stamped()
+        test_pending_changes_survive_reload()
+
+        print("\n🎉 All locking tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Test script for upgrading configuration files from earlier versions."""
+
+import sys
+import os
+import json
+import tempfile
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.config import ConfigManager, read_settings_file
+from src.core.migrations import CONFIG_VERSION, MIGRATIONS, migrate, needs_migration
+
+
+def test_migration_chain():
+    """Each step upgrades one version and the chain reaches the current one."""
+    assert len(MIGRATIONS) == CONFIG_VERSION
+    defaults = {"theme": "dark", "usual_start": "08:00"}
+    upgraded, version = migrate({"usual_start": "8:0", "workday_length": "7", "theme": "dark"}, defaults)
+    assert version == 0
+    # Settings equal to a default may have been chosen on purpose and stay
+    assert upgraded == {"usual_start": "08:00", "workday_length": "07:00", "theme": "dark",
+                        "config_version": CONFIG_VERSION}
+    assert not needs_migration(upgraded)
+
+    # Version 1 files keep their times untouched
+    upgraded, version = migrate({"config_version": 1, "usual_start": "8:0", "theme": "light"}, defaults)
+    assert version == 1
+    assert upgraded["usual_start"] == "8:0" and upgraded["theme"] == "light"
+    print("✓ Migration steps upgrade settings in one pass")
+
+
+def test_legacy_file_is_upgraded_once():
+    """A file of the legacy app is upgraded and saved on the first load only."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"usual_start": "9:5", "lunch_start": "11:00", "lunch_end": "12:30",
+                       "workday_length": "7"}, f)
+
+        config = ConfigManager(path, system_file=None, environ={})
+        assert config.migrated_from == 0
+        assert config.field_errors == {}
+        assert config.get("usual_start") == "09:05"
+        assert config.get("workday_length") == "07:00"
+
+        settings, stamps = read_settings_file(path)
+        assert settings == {"config_version": CONFIG_VERSION, "usual_start": "09:05",
+                            "lunch_start": "11:00", "lunch_end": "12:30", "workday_length": "07:00"}
+        assert set(stamps) == {"config_version", "usual_start", "workday_length"}
+
+        modified = os.stat(path).st_mtime_ns
+        started = time.perf_counter()
+        again = ConfigManager(path, system_file=None, environ={})
+        elapsed = time.perf_counter() - started
+        assert again.migrated_from is None
+        assert os.stat(path).st_mtime_ns == modified
+        assert again.get("usual_start") == "09:05"
+
+        # Resetting keeps the format version
+        again.reset_to_defaults()
+        again.save()
+        assert read_settings_file(path)[0] == {"config_version": CONFIG_VERSION}
+    print(f"✓ Legacy files are upgraded once (later loads take {elapsed * 1000:.1f} ms)")
+
+
+def test_new_file_is_current():
+    """A file first written by this release loads without a migration."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        config = ConfigManager(path, system_file=None, environ={})
+        config.set("theme", "light")
+        config.save()
+        assert read_settings_file(path)[0] == {"config_version": CONFIG_VERSION, "theme": "light"}
+
+        modified = os.stat(path).st_mtime_ns
+        again = ConfigManager(path, system_file=None, environ={})
+        assert again.migrated_from is None
+        assert os.stat(path).st_mtime_ns == modified
+        assert again.get("theme") == "light"
+    print("✓ New files are written in the current format")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing configuration migrations...")
+
+    try:
+        test_migration_chain()
+        test_legacy_file_is_upgraded_once()
+        test_new_file_is_current()
+
+        print("\n🎉 All migration tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Test script for atomic and deferred configuration saving."""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.config import ConfigManager, atomic_write
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Starts the app minimized and reports the tray messages shown
+APP_SCRIPT = """
+import json
+from PyQt5.QtWidgets import QSystemTrayIcon
+# Headless platforms have no tray; the icon works the same without one
+QSystemTrayIcon.isSystemTrayAvailable = staticmethod(lambda: True)
+messages = []
+QSystemTrayIcon.showMessage = lambda self, title, text, *args: messages.append(text)
+from src.main import BreakReminderApp
+
+app = BreakReminderApp(["test"])
+print(json.dumps(messages))
+"""
+
+
+def test_atomic_write():
+    """Atomic writes replace the file and leave no temporary files behind."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "nested", "config.json")
+        atomic_write(path, '{"a": 1}')
+        atomic_write(path, '{"a": 2}')
+        with open(path, encoding='utf-8') as f:
+            assert json.load(f) == {"a": 2}
+        assert os.listdir(os.path.dirname(path)) == ["config.json"]
+    print("✓ Atomic writes replace the file")
+
+
+def test_deferred_save_coalesces():
+    """Rapid changes are written once, in the background."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        config = ConfigManager(path, save_delay=0.2)
+
+        started = time.perf_counter()
+        for i in range(100):
+            config.set("auto_close_delay", i)
+            config.save_deferred()
+        elapsed = time.perf_counter() - started
+        assert elapsed < 0.1, f"Deferred saves blocked for {elapsed:.3f}s"
+        assert not os.path.exists(path)
+
+        deadline = time.monotonic() + 5
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        config.flush()
+        assert ConfigManager(path).get("auto_close_delay") == 99
+
+        config.set("theme", "light")
+        config.save_deferred()
+        config.flush()
+        assert ConfigManager(path).get("theme") == "light"
+    print("✓ Deferred saves are coalesced and flushed")
+
+
+def test_corrupt_file_is_kept():
+    """A corrupt file is moved aside instead of being silently ignored."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"usual_start": "09:00", "theme":')
+
+        config = ConfigManager(path)
+        assert config.get("usual_start") == "08:00"
+        assert config.load_error and "config.json.corrupt" in config.load_error
+        assert not os.path.exists(path)
+        with open(path + ".corrupt", encoding='utf-8') as f:
+            assert f.read().startswith('{"usual_start": "09:00"')
+
+        config.save()
+        assert ConfigManager(path).load_error is None
+    print("✓ Corrupt configuration files are backed up")
+
+
+def test_load_problems_are_reported():
+    """The app tells the user when it falls back to defaults."""
+    with tempfile.TemporaryDirectory() as home:
+        with open(os.path.join(home, ".break_reminder_config.json"), 'w', encoding='utf-8') as f:
+            f.write('{"start_minimized": tr')
+        env = dict(os.environ, HOME=home, USERPROFILE=home, XDG_RUNTIME_DIR=home,
+                   BREAK_REMINDER_SNOOZE_MINUTES="0")
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        result = subprocess.run([sys.executable, "-c", APP_SCRIPT], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    messages = json.loads(result.stdout.strip().splitlines()[-1])
+    assert len(messages) == 1
+    assert "moved to" in messages[0] and "snooze_minutes" in messages[0]
+    assert messages[0] in result.stderr
+    print("✓ Load problems are shown in the tray and on stderr")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing configuration persistence...")
+
+    try:
+        test_atomic_write()
+        test_deferred_save_coalesces()
+        test_corrupt_file_is_kept()
+        test_load_problems_are_reported()
+
+        print("\n🎉 All persistence tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Test script for the typed configuration schema."""
+
+import sys
+import os
+import json
+import tempfile
+from datetime import date, time, timedelta
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.break_logic import BreakLogic
+from src.core.config import ConfigManager
+from src.core.schedule import DAY_RULE_KEYS, ScheduleCompiler
+from src.core.schema import (DAY_RULE_FIELDS, SCHEMA, ConfigValidationError,
+                             parse_clock_time, parse_duration)
+
+
+def expect_error(key, value):
+    """Convert an invalid value and get the resulting error."""
+    try:
+        SCHEMA.convert(key, value)
+    except ConfigValidationError as e:
+        assert e.field == key
+        return e
+    raise AssertionError(f"{key}={value!r} should be rejected")
+
+
+def test_conversion():
+    """Values are converted to their typed form."""
+    assert SCHEMA.convert("usual_start", "8:05") == time(8, 5)
+    assert SCHEMA.convert("workday_length", "07:30") == timedelta(hours=7, minutes=30)
+    assert SCHEMA.convert("workday_length", "6") == timedelta(hours=6)
+    assert SCHEMA.convert("break_points", [0.75, 0.25]) == (0.25, 0.75)
+    assert SCHEMA.convert("workdays", ["mon", "fri"]) == {0, 4}
+    assert SCHEMA.convert("holidays", ["2025-12-24"]) == {date(2025, 12, 24)}
+    assert SCHEMA.convert("weekday_overrides", {"fri": {"workday_length": "06:00"}}) == {
+        "fri": {"workday_length": timedelta(hours=6)}}
+    reminder, = SCHEMA.convert("reminders", [{"name": "Eye rest", "every_minutes": 20,
+                                              "quiet": [["11:00", "12:00"]]}])
+    assert reminder["every"] == timedelta(minutes=20)
+    assert reminder["quiet"] == ((time(11), time(12)),)
+    # Unknown keys pass through unchanged
+    assert SCHEMA.convert("future_setting", {"a": 1}) == {"a": 1}
+    assert set(DAY_RULE_FIELDS) == set(DAY_RULE_KEYS)
+    print("✓ Values are converted to typed values")
+
+
+def test_field_errors():
+    """Invalid values give precise errors naming the field."""
+    assert "hours" in expect_error("usual_start", "24:00").message
+    assert "minutes" in expect_error("lunch_start", "12:60").message
+    assert "HH:MM" in expect_error("lunch_end", "noon").message
+    expect_error("usual_start", 8)
+    expect_error("workday_length", "00:00")
+    expect_error("workday_length", ["08:00"])
+    assert "dark" in expect_error("theme", "purple").message
+    expect_error("auto_close_delay", -1)
+    expect_error("debug_mode", "yes")
+    expect_error("break_points", [0.5, 1.5])
+    expect_error("workdays", ["monday"])
+    expect_error("holidays", ["24.12.2025"])
+    assert "fri.usual_start" in expect_error("weekday_overrides", {"fri": {"usual_start": "25:00"}}).message
+    assert "theme" in expect_error("weekday_overrides", {"fri": {"theme": "light"}}).message
+    expect_error("reminders", [{"name": "Eye rest", "every_minutes": 0}])
+    print("✓ Invalid values are reported per field")
+
+
+def test_parsers_are_cached():
+    """Repeated parsing of the same string is served from the cache."""
+    parse_clock_time.cache_clear()
+    parse_duration.cache_clear()
+    for _ in range(100):
+        parse_clock_time("08:00")
+        parse_duration("08:00")
+    assert parse_clock_time.cache_info().misses == 1
+    assert parse_duration.cache_info().misses == 1
+    print("✓ Parsed values are cached")
+
+
+def test_config_manager_validation():
+    """The manager validates on set and load and keeps typed values."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"usual_start": "09:15", "lunch_start": "25:00", "theme": "purple"}, f)
+
+        config = ConfigManager(path)
+        assert config.get_typed("usual_start") == time(9, 15)
+        assert config.get("lunch_start") == "10:45"
+        assert config.get_typed("lunch_start") == time(10, 45)
+        assert config.get("theme") == "dark"
+        assert set(config.field_errors) == {"lunch_start", "theme"}
+
+        config.set("workday_length", "07:00")
+        assert config.get_typed("workday_length") == timedelta(hours=7)
+        try:
+            config.set("workday_length", "seven")
+        except ConfigValidationError as e:
+            assert e.field == "workday_length"
+        else:
+            raise AssertionError("Invalid value should be rejected")
+        assert config.get("workday_length") == "07:00"
+
+        # A batch with an invalid value changes nothing
+        try:
+            config.update({"usual_start": "07:00", "snooze_minutes": 0})
+        except ConfigValidationError as e:
+            assert e.field == "snooze_minutes"
+        else:
+            raise AssertionError("Invalid update should be rejected")
+        assert config.get("usual_start") == "09:15"
+
+        # Invalid values in a changed file keep the current setting
+        changes = config.external_changes({"usual_start": "10:00", "workday_length": "x"})
+        assert changes["usual_start"] == ("10:00", time(10, 0))
+        assert "workday_length" not in changes
+        assert set(config.field_errors) == {"workday_length"}
+    print("✓ ConfigManager validates and caches typed values")
+
+
+def test_schedule_uses_typed_values():
+    """The schedule is compiled from the manager's typed values, not reparsed."""
+    with tempfile.TemporaryDirectory() as directory:
+        config = ConfigManager(os.path.join(directory, "config.json"), system_file=None, environ={})
+        config.update({"usual_start": "09:15", "holidays": ["2026-03-03"]})
+        typed = config.typed_snapshot()
+        assert typed["holidays"] == frozenset({date(2026, 3, 3)})
+        logic = BreakLogic(config.snapshot(), typed=typed)
+        assert logic.compiler.typed is typed
+
+        parse_clock_time.cache_clear()
+        parse_duration.cache_clear()
+        timeline = logic.compiler.timeline(date(2026, 3, 2))
+        assert timeline.start_time.time() == time(9, 15)
+        assert not logic.compiler.timeline(date(2026, 3, 3)).is_workday
+        assert parse_clock_time.cache_info().misses == parse_duration.cache_info().misses == 0
+
+        # The typed view changes along with the settings
+        config.set("usual_start", "08:30")
+        assert config.typed_snapshot() is not typed and typed["usual_start"] == time(9, 15)
+
+    # Plain dictionaries are converted, and invalid ones rejected
+    assert ScheduleCompiler({"usual_start": "07:00"}).timeline(date(2026, 3, 2)).start_time.hour == 7
+    try:
+        ScheduleCompiler({"usual_start": "7 am"})
+    except ConfigValidationError as e:
+        assert e.field == "usual_start"
+    else:
+        raise AssertionError("Invalid schedule should be rejected")
+    print("✓ Schedule is compiled from typed values")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing configuration schema...")
+
+    try:
+        test_conversion()
+        test_field_errors()
+        test_parsers_are_cached()
+        test_config_manager_validation()
+        test_schedule_uses_typed_values()
+
+        print("\n🎉 All schema tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
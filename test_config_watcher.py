@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Test script for live reloading of the configuration file."""
+
+import sys
+import os
+import contextlib
+import io
+import json
+import tempfile
+import threading
+import time
+import datetime
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.config import ConfigManager, atomic_write
+from src.core import watcher as watcher_module
+from src.core.watcher import ConfigWatcher
+
+
+def watch_and_rewrite(use_inotify):
+    """Rewrite a watched file a few times and time the callback."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        atomic_write(path, json.dumps({"theme": "dark"}))
+        other = os.path.join(directory, "other.json")
+
+        fired = threading.Event()
+        calls = []
+
+        def callback():
+            calls.append(time.perf_counter())
+            fired.set()
+
+        watcher = ConfigWatcher(path, callback, debounce=0.1, poll_interval=0.1, use_inotify=use_inotify)
+        watcher.start()
+        try:
+            time.sleep(0.2)
+            # Unrelated files in the same directory are ignored
+            atomic_write(other, "{}")
+            time.sleep(0.4)
+            assert not calls, "Unrelated file should not trigger a reload"
+
+            # A burst of rewrites results in one callback
+            started = time.perf_counter()
+            for theme in ("light", "dark", "light"):
+                atomic_write(path, json.dumps({"theme": theme}))
+            assert fired.wait(5), "Change was not detected"
+            latency = calls[0] - started
+            time.sleep(0.4)
+            assert len(calls) == 1, f"Expected one callback, got {len(calls)}"
+        finally:
+            watcher.stop()
+        return watcher.backend, latency
+
+
+def test_inotify_watcher():
+    """The inotify backend notices replaced files quickly."""
+    backend, latency = watch_and_rewrite(use_inotify=True)
+    assert latency < 1, f"Reload took {latency:.2f}s"
+    print(f"✓ {backend} watcher noticed the change in {latency * 1000:.0f} ms")
+
+
+def test_polling_watcher():
+    """The polling fallback notices changes too."""
+    backend, latency = watch_and_rewrite(use_inotify=False)
+    assert backend == "polling"
+    assert latency < 1, f"Reload took {latency:.2f}s"
+    print(f"✓ Polling watcher noticed the change in {latency * 1000:.0f} ms")
+
+
+def test_external_changes():
+    """Only settings that differ are reported."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        config = ConfigManager(path)
+        config.set("theme", "light")
+        config.save()
+
+        atomic_write(path, json.dumps({"theme": "light", "usual_start": "09:00"}))
+        changes = config.external_changes(config.read_file())
+        assert changes == {"usual_start": ("09:00", datetime.time(9, 0))}
+        assert config.apply_external_changes(changes) == {"usual_start"}
+        assert config.get_typed("usual_start") == datetime.time(9, 0)
+
+        # A half written file is ignored and left in place
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"theme": ')
+        assert config.read_file() is None
+        assert os.path.exists(path)
+    print("✓ External changes are reported per key")
+
+
+def test_inotify_filters_events():
+    """Writes to other files do not wake the watcher, and failed reloads are logged."""
+    if not sys.platform.startswith("linux"):
+        print("⚠ inotify is Linux only, skipping")
+        return
+    reads = []
+    read_events = watcher_module._Inotify.read_events
+
+    def counting_read_events(self):
+        events = read_events(self)
+        reads.append(events)
+        return events
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        atomic_write(path, json.dumps({"theme": "dark"}))
+        other = os.path.join(directory, "other.log")
+        with open(other, 'w', encoding='utf-8') as f:
+            f.write("")
+
+        fired = threading.Event()
+
+        def callback():
+            fired.set()
+            raise ValueError("broken reload")
+
+        watcher = ConfigWatcher(path, callback, debounce=0.1)
+        stderr = io.StringIO()
+        watcher_module._Inotify.read_events = counting_read_events
+        try:
+            with contextlib.redirect_stderr(stderr):
+                watcher.start()
+                assert watcher.backend == "inotify"
+                for n in range(20):
+                    with open(other, 'a', encoding='utf-8') as f:
+                        f.write(f"line {n}\n")
+                time.sleep(0.3)
+                assert reads == [], "Writes to another file woke the watcher"
+
+                # Writing the file in place is noticed, and errors are reported
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps({"theme": "light"}))
+                assert fired.wait(5), "In-place write was not detected"
+                time.sleep(0.1)
+                fired.clear()
+                atomic_write(path, json.dumps({"theme": "dark"}))
+                assert fired.wait(5), "The watcher stopped after a failed reload"
+                time.sleep(0.1)
+        finally:
+            watcher.stop()
+            watcher_module._Inotify.read_events = read_events
+    assert stderr.getvalue().count("broken reload") == 2, stderr.getvalue()
+    print("✓ Only events of the watched file wake the watcher")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing configuration reloading...")
+
+    try:
+        test_inotify_watcher()
+        test_polling_watcher()
+        test_inotify_filters_events()
+        test_external_changes()
+
+        print("\n🎉 All reload tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
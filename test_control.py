@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Test script for the single-instance guard and the control socket."""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.control import ControlClient, InstanceLock, send_command
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Runs the app's entry point; headless platforms have no tray, which works
+# the same without one
+LAUNCHER = """
+import sys
+from PyQt5.QtWidgets import QSystemTrayIcon
+QSystemTrayIcon.isSystemTrayAvailable = staticmethod(lambda: True)
+from src.main import main
+sys.exit(main(["break_reminder"] + sys.argv[1:]))
+"""
+
+
+def launch(env, *args):
+    """Start the app in the background."""
+    return subprocess.Popen([sys.executable, "-c", LAUNCHER, *args], cwd=ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def run(env, *args):
+    """Launch the app and wait for it to exit."""
+    return subprocess.run([sys.executable, "-c", LAUNCHER, *args], cwd=ROOT, env=env,
+                          capture_output=True, text=True, timeout=30)
+
+
+def wait_for(path, timeout=20):
+    """Wait until a file exists."""
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        assert time.monotonic() < deadline, f"{path} did not appear"
+        time.sleep(0.05)
+
+
+def test_client_without_qt():
+    """The client side of the control channel does not import Qt."""
+    result = subprocess.run([sys.executable, "-c", "import sys, src.core.control; "
+                             "print(any(name.startswith('PyQt5') for name in sys.modules))"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=30)
+    assert result.stdout.strip() == "False", result.stderr
+    print("✓ Control client imports without Qt")
+
+
+def test_instance_lock():
+    """Only one holder of the instance lock at a time."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "control.lock")
+        first, second = InstanceLock(path), InstanceLock(path)
+        assert first.acquire()
+        if os.name == "posix":
+            assert not second.acquire()
+        first.release()
+        assert second.acquire()
+        second.release()
+    print("✓ Instance lock is exclusive")
+
+
+def test_single_instance():
+    """A second launch hands its command to the running instance."""
+    with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as runtime_dir:
+        env = dict(os.environ, HOME=home, USERPROFILE=home, XDG_RUNTIME_DIR=runtime_dir)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        socket_path = os.path.join(runtime_dir, "break_reminder.sock")
+
+        assert run(env, "status").returncode == 1
+
+        # Two launches at once start a single instance
+        first, second = launch(env), launch(env)
+        try:
+            wait_for(socket_path)
+            exited = [process for process in (first, second) if process.poll() is not None]
+            deadline = time.monotonic() + 20
+            while not exited and time.monotonic() < deadline:
+                time.sleep(0.05)
+                exited = [process for process in (first, second) if process.poll() is not None]
+            assert len(exited) == 1, "Both launches kept running"
+            assert exited[0].returncode == 0, exited[0].stderr.read()
+
+            result = run(env, "status")
+            assert result.returncode == 0, result.stderr
+            assert json.loads(result.stdout)["window"] == "shown"
+
+            assert run(env, "hide").returncode == 0
+            reply = send_command("status", socket_path)
+            assert reply["ok"] and reply["status"]["window"] == "hidden"
+            assert reply["status"]["state"] in ("work", "break", "lunch", "done")
+            assert send_command("reload", socket_path) == {"ok": True}
+            assert not send_command("restart", socket_path)["ok"]
+
+            # Round trips over an open connection
+            with ControlClient(socket_path) as client:
+                timings = []
+                for _ in range(200):
+                    started = time.perf_counter()
+                    client.send("status")
+                    timings.append(time.perf_counter() - started)
+            median_ms = sorted(timings)[len(timings) // 2] * 1000
+            print(f"   Median status round trip: {median_ms:.3f} ms")
+            assert median_ms < 1, f"Round trip took {median_ms:.3f} ms"
+
+            assert send_command("quit", socket_path) == {"ok": True}
+            running = first if first.poll() is None else second
+            assert running.wait(timeout=20) == 0
+            assert not os.path.exists(socket_path)
+        finally:
+            for process in (first, second):
+                if process.poll() is None:
+                    process.kill()
+                process.communicate()
+    print("✓ Second launch forwards its command")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing control socket...")
+
+    try:
+        test_client_without_qt()
+        test_instance_lock()
+        test_single_instance()
+
+        print("\n🎉 All control socket tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Import-time report and lazy loading checks for the application modules."""
+
+import sys
+import os
+import subprocess
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Cumulative import time allowed for the entry point, in seconds
+IMPORT_BUDGET_SECONDS = 0.5
+
+# Modules that must only be loaded on first use
+DEFERRED_MODULES = ("src.ui.main_widget", "src.ui.config_dialog", "tkinter", "PyQt5.QtNetwork",
+                    "src.core.watcher", "src.core.reminders", "src.core.shared_state")
+
+
+def import_times(module):
+    """Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Dictionary of cumulative import time in seconds per imported module
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def report(times, count=10):
+    """Print the modules with the highest cumulative import time."""
+    for name, seconds in sorted(times.items(), key=lambda item: item[1], reverse=True)[:count]:
+        print(f"    {seconds * 1000:8.1f} ms  {name}")
+
+
+def test_entry_point_imports():
+    """The entry point imports only what startup needs, within budget."""
+    # The first run warms the bytecode and file system caches
+    import_times("src.main")
+    times = import_times("src.main")
+    report(times)
+    for module in DEFERRED_MODULES:
+        assert module not in times, f"{module} is imported at startup"
+    assert times["src.main"] < IMPORT_BUDGET_SECONDS, f"src.main took {times['src.main']:.3f}s to import"
+    print(f"✓ src.main imports in {times['src.main'] * 1000:.0f} ms without deferred modules")
+
+
+def test_widget_defers_dialog():
+    """The main widget loads the settings dialog only when it is opened."""
+    times = import_times("src.ui.main_widget")
+    assert "src.ui.config_dialog" not in times
+    print("✓ The settings dialog is loaded on first use")
+
+
+def test_themes_built_on_first_use():
+    """Only the styles of themes in use are built."""
+    from src.ui.styles import StyleManager, Theme
+
+    manager = StyleManager(Theme.LIGHT)
+    assert manager._styles == {}
+    assert manager.get_style("main_window")
+    assert set(manager._styles) == {"light"}
+    manager.set_theme(Theme.DARK)
+    manager.get_status_color("work")
+    assert set(manager._styles) == {"light", "dark"}
+    print("✓ Theme styles are built on first use")
+
+
+if __name__ == "__main__":
+    print("🧪 Measuring import times...")
+
+    try:
+        test_entry_point_imports()
+        test_widget_defers_dialog()
+        test_themes_built_on_first_use()
+
+        print("\n🎉 All import time checks passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Test script for break policies and the interval index."""
+
+import sys
+import os
+import time
+from datetime import date, datetime, timedelta
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.break_logic import BreakLogic, BreakState
+from src.core.clock import VirtualClock
+from src.core.policy import BreakPolicy, IntervalIndex, policy_from_config
+from src.core.schedule import ScheduleCompiler
+
+
+DAY = date(2026, 3, 2)
+
+POMODORO = {
+    "usual_start": "08:00",
+    "lunch_start": "11:00",
+    "lunch_end": "11:30",
+    "workday_length": "08:00",
+    "break_policy": "cycle",
+    "cycle_work_minutes": 25,
+    "cycle_break_minutes": 5,
+    "cycle_long_break_minutes": 15,
+    "cycle_long_break_every": 4,
+}
+
+
+def at(hours, minutes=0):
+    """Get a time on the test day."""
+    return datetime.combine(DAY, datetime.min.time()) + timedelta(hours=hours, minutes=minutes)
+
+
+def test_pomodoro_cycles():
+    """Cycles alternate work and breaks with a long break every fourth."""
+    timeline = ScheduleCompiler(POMODORO).timeline(DAY)
+    breaks = timeline.breaks
+    assert [(b.start, b.end, b.long) for b in breaks[:4]] == [
+        (at(8, 25), at(8, 30), False),
+        (at(8, 55), at(9, 0), False),
+        (at(9, 25), at(9, 30), False),
+        (at(9, 55), at(10, 10), True),
+    ]
+    # Lunch pauses the cycle clock: 10:40 + 20 min before lunch, 5 after it
+    assert breaks[5].start == at(11, 35)
+    assert all(b.end <= c.start for b, c in zip(breaks, breaks[1:]))
+    assert breaks[-1].start < timeline.workday_end
+    print("✓ Pomodoro cycles are placed around lunch")
+
+
+def test_cycle_states():
+    """Timed breaks count down to their own end."""
+    clock = VirtualClock(at(8, 10))
+    logic = BreakLogic(POMODORO, clock=clock)
+
+    snapshot = logic.get_snapshot()
+    assert snapshot.state == BreakState.WORK
+    assert snapshot.time_left == 15
+    assert snapshot.next_event == "Break at 08:25"
+
+    clock.set(at(8, 26))
+    snapshot = logic.get_snapshot()
+    assert snapshot.state == BreakState.BREAK
+    assert snapshot.time_left == 4
+    assert snapshot.progress_percent == 20
+
+    clock.set(at(8, 30))
+    assert logic.get_snapshot().state == BreakState.WORK
+    assert logic.get_next_state_change() == at(8, 55)
+    print("✓ Cycle breaks drive the break state")
+
+
+def test_spacing_and_lunch_shift():
+    """Breaks move out of lunch and keep their minimum spacing."""
+    rules = {"break_points": [0.3, 0.35, 0.8], "shift_breaks_for_lunch": True, "min_break_spacing": 60}
+    policy = policy_from_config(rules)
+    breaks = policy.breaks(at(8), at(10, 20), at(11), at(16))
+    # 0.3 is at 10:24 and its window overlaps lunch, so it moves after it;
+    # 0.35 (10:48) lands on the same spot and merges into it
+    assert [b.work_target for b in breaks] == [at(11, 6), at(14, 24)]
+    assert breaks[0].start > at(11)
+
+    spaced = policy_from_config({"break_points": [0.5, 0.52], "min_break_spacing": 30})
+    assert len(spaced.breaks(at(8), at(12), at(12), at(16))) == 1
+    print("✓ Breaks are shifted for lunch and spaced out")
+
+
+def test_interval_index():
+    """The index answers active and next lookups over many days."""
+    compiler = ScheduleCompiler(POMODORO)
+    index = compiler.break_index(DAY, 60)
+    assert len(index) > 500
+
+    intervals = list(index)
+    for interval, following in zip(intervals, intervals[1:]):
+        middle = interval.start + (interval.end - interval.start) / 2
+        assert index.active_at(interval.start) is interval
+        assert index.active_at(middle) is interval
+        assert index.active_at(interval.end) is not interval
+        assert index.next_after(interval.start) is following
+    assert index.active_at(at(7)) is None
+    assert index.next_after(at(7)) is intervals[0]
+    assert index.next_after(intervals[-1].start) is None
+
+    # Overlapping intervals keep the earliest one
+    overlapping = IntervalIndex([intervals[1], intervals[0], intervals[0]])
+    assert list(overlapping) == intervals[:2]
+
+    started = time.perf_counter()
+    for interval in intervals:
+        index.active_at(interval.start)
+    elapsed = time.perf_counter() - started
+    assert elapsed < 0.5, f"Lookups took {elapsed:.2f}s"
+    print(f"✓ Interval index over {len(index)} breaks works")
+
+
+def test_unknown_policy():
+    """Unknown policy names are rejected."""
+    try:
+        policy_from_config({"break_policy": "random"})
+    except ValueError:
+        print("✓ Unknown policies are rejected")
+    else:
+        raise AssertionError("Unknown policy should raise ValueError")
+
+
+def test_policy_needs_generate():
+    """A policy without a generate method cannot be created."""
+    class Incomplete(BreakPolicy):
+        pass
+
+    try:
+        Incomplete()
+    except TypeError:
+        print("✓ Policies must implement generate")
+    else:
+        raise AssertionError("A policy without generate should raise TypeError")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing break policies...")
+
+    try:
+        test_pomodoro_cycles()
+        test_cycle_states()
+        test_spacing_and_lunch_shift()
+        test_interval_index()
+        test_unknown_policy()
+        test_policy_needs_generate()
+
+        print("\n🎉 All policy tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
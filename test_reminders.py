@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Test script for periodic reminder streams."""
+
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.clock import VirtualClock
+from src.core.reminders import ReminderMultiplexer, ReminderStream
+from src.core.schema import SCHEMA
+from src.core.scheduler import ReminderScheduler
+
+
+CONFIG = {
+    "reminders": [
+        {"name": "Eye rest", "every_minutes": 20, "quiet": [["11:00", "12:00"]]},
+        {"name": "Hydration", "message": "Drink water", "every_minutes": 60, "quiet": [["18:00", "08:00"]]},
+    ]
+}
+
+# The reminders setting as the configuration manager caches it
+REMINDERS = SCHEMA.convert("reminders", CONFIG["reminders"])
+
+
+def test_stream_occurrences():
+    """Streams follow their grid and skip quiet windows."""
+    eye, water = (ReminderStream.from_config(entry) for entry in REMINDERS)
+    day = datetime(2026, 3, 2)
+
+    assert eye.next_after(day.replace(hour=9, minute=5)) == day.replace(hour=9, minute=20)
+    assert eye.next_after(day.replace(hour=9, minute=20)) == day.replace(hour=9, minute=40)
+    assert eye.next_after(day.replace(hour=10, minute=45)) == day.replace(hour=12)
+    assert water.next_after(day.replace(hour=17, minute=30)) == day.replace(hour=8) + timedelta(days=1)
+    assert water.next_after(day.replace(hour=2)) == day.replace(hour=8)
+    assert water.message == "Drink water" and eye.message == "Eye rest"
+
+    always_quiet = ReminderStream("Never", timedelta(minutes=5), "", [(datetime.min.time(), datetime.max.time())])
+    assert always_quiet.next_after(day) is None
+    print("✓ Reminder streams skip quiet windows")
+
+
+def test_multiplexer():
+    """The multiplexer yields the earliest reminder across all streams."""
+    clock = VirtualClock(datetime(2026, 3, 2, 8, 50))
+    reminders = ReminderMultiplexer.from_config(REMINDERS, clock)
+    assert reminders.next_time() == datetime(2026, 3, 2, 9, 0)
+
+    clock.set(datetime(2026, 3, 2, 9, 0))
+    due = reminders.pop_due()
+    assert [r.name for r in due] == ["Eye rest", "Hydration"]
+    assert reminders.next_time() == datetime(2026, 3, 2, 9, 20)
+    assert reminders.pop_due() == []
+
+    # After a long sleep each stream fires once and resumes from now
+    clock.set(datetime(2026, 3, 2, 15, 7))
+    assert len(reminders.pop_due()) == 2
+    assert reminders.next_time() == datetime(2026, 3, 2, 15, 20)
+
+    scheduler = ReminderScheduler(reminders)
+    assert scheduler.clock is clock and scheduler.max_delay_ms == ReminderScheduler.MAX_DELAY_MS
+    assert scheduler.next_delay_ms() == 13 * 60 * 1000 + scheduler.margin_ms
+    print("✓ Reminder streams are merged in time order")
+
+
+def test_many_streams():
+    """Firing reminders stays cheap with many streams."""
+    streams = [ReminderStream(f"Stream {i}", timedelta(minutes=5 + i % 50), "") for i in range(1000)]
+    clock = VirtualClock(datetime(2026, 3, 2))
+    reminders = ReminderMultiplexer(streams, clock)
+
+    started = time.perf_counter()
+    fired = 0
+    end = datetime(2026, 3, 3)
+    while reminders.next_time() < end:
+        clock.set(reminders.next_time())
+        fired += len(reminders.pop_due())
+    elapsed = time.perf_counter() - started
+
+    assert fired > 10000
+    assert elapsed < 5, f"Merging took {elapsed:.2f}s"
+    print(f"✓ Merged {fired} reminders from 1,000 streams in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing reminder streams...")
+
+    try:
+        test_stream_occurrences()
+        test_multiplexer()
+        test_many_streams()
+
+        print("\n🎉 All reminder tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test script for the multi-day schedule compiler."""
+
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.schedule import ScheduleCompiler
+from src.core.timeline import BreakState
+
+
+BASE_CONFIG = {
+    "usual_start": "08:00",
+    "lunch_start": "11:00",
+    "lunch_end": "11:30",
+    "workday_length": "08:00",
+    "break_points": [0.25, 0.75],
+}
+
+
+def test_weekday_rules_and_holidays():
+    """Workdays, holidays and weekday overrides are applied per day."""
+    config = dict(BASE_CONFIG,
+                  workdays=["mon", "tue", "wed", "thu", "fri"],
+                  holidays=["2026-03-04"],
+                  weekday_overrides={"fri": {"workday_length": "06:00"}})
+    compiler = ScheduleCompiler(config)
+
+    monday = compiler.timeline(date(2026, 3, 2))
+    assert monday.is_workday
+    assert monday.workday_end == datetime(2026, 3, 2, 16, 0)
+
+    assert not compiler.timeline(date(2026, 3, 4)).is_workday, "Holiday should be a day off"
+    assert not compiler.timeline(date(2026, 3, 7)).is_workday, "Saturday should be a day off"
+
+    friday = compiler.timeline(date(2026, 3, 6))
+    assert friday.workday_end == datetime(2026, 3, 6, 14, 0)
+    assert friday.break_times[0] == datetime(2026, 3, 6, 9, 30)
+
+    saturday_noon = datetime(2026, 3, 7, 12, 0)
+    assert compiler.timeline(saturday_noon.date()).state_at(saturday_noon)[0] == BreakState.DONE
+    print("✓ Weekday rules and holidays work")
+
+
+def test_night_shift():
+    """A shift crossing midnight keeps its lunch and end on the next morning."""
+    config = dict(BASE_CONFIG, usual_start="22:00", lunch_start="02:00", lunch_end="02:30")
+    compiler = ScheduleCompiler(config)
+
+    shift = compiler.timeline(date(2026, 3, 2))
+    assert shift.start_time == datetime(2026, 3, 2, 22, 0)
+    assert shift.lunch_start == datetime(2026, 3, 3, 2, 0)
+    assert shift.lunch_end == datetime(2026, 3, 3, 2, 30)
+    assert shift.workday_end == datetime(2026, 3, 3, 6, 0)
+
+    # Yesterday's shift stays active after midnight until it ends
+    assert compiler.active_day(datetime(2026, 3, 3, 2, 15)) == date(2026, 3, 2)
+    assert compiler.active_day(datetime(2026, 3, 3, 6, 0)) == date(2026, 3, 3)
+    assert shift.state_at(datetime(2026, 3, 3, 2, 15))[0] == BreakState.LUNCH
+    assert compiler.active_span(date(2026, 3, 3)) == (datetime(2026, 3, 3, 6, 0), datetime(2026, 3, 4, 6, 0))
+    print("✓ Night shifts roll over past midnight")
+
+
+def test_midnight_rollover():
+    """A regular day hands over to the next day at midnight."""
+    compiler = ScheduleCompiler(BASE_CONFIG)
+    start, end = compiler.active_span(date(2026, 3, 2))
+    assert start == datetime(2026, 3, 2)
+    assert end == datetime(2026, 3, 3)
+    assert compiler.active_day(end - timedelta(microseconds=1)) == date(2026, 3, 2)
+    assert compiler.active_day(end) == date(2026, 3, 3)
+
+    # Compiled days are cached
+    assert compiler.timeline(date(2026, 3, 3)) is compiler.timeline(date(2026, 3, 3))
+    print("✓ Midnight rollover works")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing schedule compiler...")
+
+    try:
+        test_weekday_rules_and_holidays()
+        test_night_shift()
+        test_midnight_rollover()
+
+        print("\n🎉 All schedule tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
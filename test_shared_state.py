@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Test script for the break state shared through a memory-mapped file."""
+
+import sys
+import os
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.break_logic import BreakLogic, BreakState
+from src.core.clock import VirtualClock
+from src.core.shared_state import StatePublisher, StateReader
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+CONFIG = {
+    "usual_start": "08:00",
+    "lunch_start": "10:45",
+    "lunch_end": "12:30",
+    "workday_length": "08:00",
+    "break_points": [0.25, 0.75],
+}
+
+# Publishes states of different sizes as fast as it can until killed
+WRITER_SCRIPT = """
+import sys
+from src.core.shared_state import StatePublisher
+publisher = StatePublisher(sys.argv[1])
+states = [{"state": "work", "n": n, "fill": "x" * (n * 97 % 3000)} for n in range(50)]
+publisher.publish(states[0])
+print("ready", flush=True)
+while True:
+    for state in states:
+        publisher.publish(state)
+"""
+
+
+def at(hours, minutes=0, seconds=0):
+    """Get a time on the test day."""
+    return datetime(2026, 3, 2, hours, minutes, seconds)
+
+
+def test_round_trip():
+    """Published states are read back until the publisher closes."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "break_reminder.state")
+        publisher = StatePublisher(path)
+        assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+        with StateReader(path) as reader:
+            assert reader.read() is None
+            publisher.publish({"state": "work", "message": "Työaika ☕"})
+            first = reader.sequence()
+            assert reader.read() == {"state": "work", "message": "Työaika ☕"}
+            assert reader.writer_pid() == os.getpid()
+
+            publisher.publish({"state": "break"})
+            assert reader.sequence() > first
+            assert reader.read() == {"state": "break"}
+
+            publisher.close()
+            assert reader.read() is None and reader.writer_pid() == 0
+
+            # A restarted app keeps counting, so pollers notice it
+            stopped = reader.sequence()
+            restarted = StatePublisher(path)
+            restarted.publish({"state": "work"})
+            assert reader.sequence() > stopped
+            assert reader.read() == {"state": "work"}
+            restarted.close()
+
+        try:
+            StatePublisher(path).publish({"fill": "x" * 5000})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("A state larger than the file should raise ValueError")
+    print("✓ States are published, read back and cleared")
+
+
+def test_concurrent_reads():
+    """Reads racing a busy writer never return a torn state."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "break_reminder.state")
+        writer = subprocess.Popen([sys.executable, "-c", WRITER_SCRIPT, path], cwd=ROOT,
+                                  stdout=subprocess.PIPE, text=True)
+        try:
+            assert writer.stdout.readline().strip() == "ready"
+            seen = set()
+            with StateReader(path) as reader:
+                deadline = time.monotonic() + 1
+                while time.monotonic() < deadline:
+                    state = reader.read()
+                    assert state["fill"] == "x" * (state["n"] * 97 % 3000), state["n"]
+                    seen.add(state["n"])
+        finally:
+            writer.kill()
+            writer.wait()
+    assert len(seen) > 1, "The writer did not make progress"
+    print(f"✓ {len(seen)} different states read consistently during writes")
+
+
+def test_transitions_only():
+    """Listeners hear about new states, not about minute ticks."""
+    clock = VirtualClock(at(9, 30))
+    logic = BreakLogic(CONFIG, clock=clock)
+    published = []
+    logic.add_listener(published.append)
+
+    for _ in range(27):
+        logic.get_snapshot()
+        clock.advance(timedelta(minutes=1))
+    assert [snapshot.state for snapshot in published] == [BreakState.WORK, BreakState.BREAK]
+    # The break window was reported at the first query after it opened
+    opened = published[0].state_until
+    assert opened <= published[1].now < opened + timedelta(minutes=1)
+    assert published[1].target == at(10)
+
+    # Moving a break is a transition of its own
+    assert logic.snooze_break(5)
+    logic.get_snapshot()
+    assert len(published) == 3 and published[2].state == BreakState.WORK
+    logic.get_snapshot()
+    assert len(published) == 3
+    print("✓ Listeners run on state transitions only")
+
+
+def test_reader_without_qt():
+    """Status bars can read the state without importing Qt."""
+    result = subprocess.run([sys.executable, "-c", "import sys, src.core.shared_state; "
+                             "print(any(name.startswith('PyQt5') for name in sys.modules))"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=30)
+    assert result.stdout.strip() == "False", result.stderr
+    print("✓ Shared state imports without Qt")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing shared state...")
+
+    try:
+        test_round_trip()
+        test_concurrent_reads()
+        test_transitions_only()
+        test_reader_without_qt()
+
+        print("\n🎉 All shared state tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
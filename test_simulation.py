@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Test script for the virtual clock and schedule simulation."""
+
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.break_logic import BreakLogic, BreakState
+from src.core.clock import Clock, VirtualClock
+from src.core.simulation import simulate
+
+
+CONFIG = {
+    "usual_start": "08:00",
+    "lunch_start": "10:45",
+    "lunch_end": "12:30",
+    "workday_length": "08:00",
+    "break_points": [0.25, 0.75],
+}
+
+
+def test_virtual_clock():
+    """BreakLogic reads time only from the injected clock."""
+    clock = VirtualClock(datetime(2026, 3, 2, 9, 56))
+    logic = BreakLogic(CONFIG, clock=clock)
+
+    state, info = logic.get_current_state()
+    assert state == BreakState.BREAK
+    assert info["time_left"] == 4
+
+    clock.set(datetime(2026, 3, 2, 11, 0))
+    assert logic.get_current_state()[0] == BreakState.LUNCH
+    assert not logic.is_workday_complete()
+
+    clock.advance(timedelta(hours=6))
+    assert logic.get_current_state()[0] == BreakState.DONE
+    assert logic.is_workday_complete()
+
+    # A clock must tell the time
+    class Broken(Clock):
+        pass
+
+    try:
+        Broken()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("A clock without now() should raise TypeError")
+    print("✓ Virtual clock drives BreakLogic")
+
+
+def test_snapshot_renders_lazily():
+    """Snapshots render texts on demand and match the legacy info dict."""
+    clock = VirtualClock(datetime(2026, 3, 2, 9, 30))
+    logic = BreakLogic(CONFIG, clock=clock)
+
+    snapshot = logic.get_snapshot()
+    assert snapshot.state == BreakState.WORK
+    assert snapshot._message is None and snapshot._debug_info is None
+    assert snapshot.message == "💼 Next break: 10:00\n⏰ 30 minutes to go"
+    assert snapshot.message is snapshot.message
+    assert not hasattr(snapshot, "__dict__")
+
+    state, info = logic.get_current_state()
+    assert state == snapshot.state
+    assert info == snapshot.as_dict()
+    assert info["next_event"] == "Break at 10:00"
+    assert info["debug_info"][0] == "📅 Now: 2026-03-02 09:30:00"
+
+    # Break time labels are formatted once per compiled day
+    assert logic.timeline.format_time(snapshot.next_break) is logic.timeline.format_time(snapshot.next_break)
+    print("✓ Snapshots render texts lazily")
+
+
+def test_snapshot_cache():
+    """Snapshots are reused inside their validity window."""
+    clock = VirtualClock(datetime(2026, 3, 2, 9, 30, 10))
+    logic = BreakLogic(CONFIG, clock=clock)
+
+    snapshot = logic.get_snapshot()
+    # The minutes left tick over just after 09:31; the progress stays the same
+    assert snapshot.valid_until == datetime(2026, 3, 2, 9, 31, 0, 1)
+    assert logic.get_next_transition() == snapshot.valid_until
+
+    clock.advance(timedelta(seconds=30))
+    assert logic.get_snapshot() is snapshot
+
+    # Leaving the window or jumping back in time recomputes
+    clock.set(snapshot.valid_until)
+    later = logic.get_snapshot()
+    assert later is not snapshot and later.time_left == 28
+    clock.set(datetime(2026, 3, 2, 9, 0))
+    assert logic.get_snapshot().time_left == 60
+
+    # Settings that don't affect the schedule keep the compiled timeline
+    timeline = logic.timeline
+    logic.update_config(dict(CONFIG, theme="light"), {"theme"})
+    assert logic.timeline is timeline
+
+    # A new configuration drops the cached snapshot
+    cached = logic.get_snapshot()
+    logic.update_config(dict(CONFIG, usual_start="07:00"))
+    assert logic.get_snapshot() is not cached
+    assert logic.get_snapshot().state == BreakState.BREAK
+    print("✓ Snapshots are cached until they expire")
+
+
+def test_simulated_day():
+    """A simulated day produces the expected transition stream."""
+    start = datetime(2026, 3, 2)
+    transitions = list(simulate(CONFIG, start, start + timedelta(days=1)))
+    states = [(t.at.strftime('%H:%M'), t.state) for t in transitions]
+    assert states == [
+        ("00:00", BreakState.WORK),
+        ("09:54", BreakState.BREAK),
+        ("10:00", BreakState.WORK),
+        ("10:45", BreakState.LUNCH),
+        ("12:30", BreakState.WORK),
+        ("13:54", BreakState.BREAK),
+        ("14:00", BreakState.WORK),
+        ("16:00", BreakState.DONE),
+    ], states
+    assert all(t.previous != t.state for t in transitions)
+    print("✓ Simulated day has the expected transitions")
+
+
+def test_simulated_week_is_fast():
+    """A full week with every minute tick replays far faster than real time."""
+    start = datetime(2026, 3, 2)
+    config = dict(CONFIG, workdays=["mon", "tue", "wed", "thu", "fri"])
+
+    started = time.perf_counter()
+    transitions = list(simulate(config, start, start + timedelta(days=7), include_ticks=True))
+    elapsed = time.perf_counter() - started
+
+    assert transitions, "Simulation should produce transitions"
+    assert all(a.at < b.at for a, b in zip(transitions, transitions[1:]))
+    weekend = [t for t in transitions if t.at.weekday() >= 5]
+    assert all(t.state == BreakState.DONE for t in weekend)
+    assert elapsed < 5, f"Week simulation took {elapsed:.2f}s"
+    print(f"✓ Simulated week in {elapsed * 1000:.0f} ms ({len(transitions)} ticks)")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing schedule simulation...")
+
+    try:
+        test_virtual_clock()
+        test_snapshot_renders_lazily()
+        test_snapshot_cache()
+        test_simulated_day()
+        test_simulated_week_is_fast()
+
+        print("\n🎉 All simulation tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
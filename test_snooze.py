@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Test script for snoozing, skipping and moving breaks."""
+
+import sys
+import os
+from datetime import datetime
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.break_logic import BreakLogic, BreakState
+from src.core.clock import VirtualClock
+from src.core.events import EventQueue
+
+
+CONFIG = {
+    "usual_start": "08:00",
+    "lunch_start": "10:45",
+    "lunch_end": "12:30",
+    "workday_length": "08:00",
+    "break_points": [0.25, 0.75],
+}
+
+
+def at(hours, minutes=0, seconds=0):
+    """Get a time on the test day."""
+    return datetime(2026, 3, 2, hours, minutes, seconds)
+
+
+def test_event_queue():
+    """Events come out in time order and can be rescheduled or cancelled."""
+    queue = EventQueue()
+    queue.push("a", at(10), 1)
+    queue.push("b", at(9), 2)
+    queue.push("c", at(11), 3)
+    queue.push("b", at(12), 4)
+    assert queue.cancel("c") and not queue.cancel("c")
+    assert len(queue) == 2 and "b" in queue and "c" not in queue
+    assert queue.peek() == (at(10), "a", 1)
+    assert queue.pop() == (at(10), "a", 1)
+    assert queue.pop() == (at(12), "b", 4)
+    assert not queue
+    try:
+        queue.pop()
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("Popping an empty queue should raise IndexError")
+    print("✓ Event queue orders, reschedules and cancels events")
+
+
+def test_snooze():
+    """A snoozed break moves back and can be snoozed again."""
+    clock = VirtualClock(at(9, 56))
+    logic = BreakLogic(CONFIG, clock=clock)
+    assert logic.get_snapshot().state == BreakState.BREAK
+
+    assert logic.snooze_break(5)
+    snapshot = logic.get_snapshot()
+    assert snapshot.state == BreakState.WORK
+    assert snapshot.time_left == 10
+
+    clock.set(at(10, 1))
+    assert logic.get_snapshot().state == BreakState.BREAK
+    assert logic.snooze_break(10)
+    assert logic.get_snapshot().state == BreakState.WORK
+    clock.set(at(10, 11))
+    assert logic.get_snapshot().state == BreakState.BREAK
+
+    # Adjustments survive reconfiguration
+    logic.update_config(dict(CONFIG, lunch_end="12:00"))
+    assert logic.get_snapshot().state == BreakState.BREAK
+    clock.set(at(10, 17))
+    assert logic.get_snapshot().state == BreakState.WORK
+    assert logic.get_snapshot().next_break == at(14)
+    print("✓ Snoozed breaks are rescheduled")
+
+
+def test_skip_and_take_now():
+    """Skipped breaks disappear and breaks can be taken early."""
+    clock = VirtualClock(at(9, 0))
+    logic = BreakLogic(CONFIG, clock=clock)
+
+    assert logic.skip_break()
+    assert logic.get_snapshot().next_break == at(14)
+    clock.set(at(9, 57))
+    assert logic.get_snapshot().state == BreakState.WORK
+
+    assert logic.take_break_now()
+    snapshot = logic.get_snapshot()
+    assert snapshot.state == BreakState.BREAK
+    assert snapshot.time_left == 5
+
+    clock.set(at(16, 30))
+    assert not logic.snooze_break()
+    assert not logic.skip_break()
+    print("✓ Breaks can be skipped and taken early")
+
+
+def test_moved_break_pushes_later_breaks():
+    """Breaks that overlap a moved break follow it."""
+    config = dict(CONFIG, break_policy="cycle", cycle_work_minutes=25, cycle_break_minutes=5)
+    clock = VirtualClock(at(8, 10))
+    logic = BreakLogic(config, clock=clock)
+
+    assert logic.snooze_break(28)
+    starts = [brk.start for brk in logic.timeline.breaks[:3]]
+    assert starts == [at(8, 53), at(8, 58), at(9, 25)], starts
+    print("✓ Moved breaks push later breaks back")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing break adjustments...")
+
+    try:
+        test_event_queue()
+        test_snooze()
+        test_skip_and_take_now()
+        test_moved_break_pushes_later_breaks()
+
+        print("\n🎉 All break adjustment tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark of the application's cold start time and memory use."""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Budgets for starting up with the widget shown, in a fresh interpreter
+STARTUP_BUDGET_SECONDS = 1.5
+MEMORY_BUDGET_MB = 120
+
+# Mirrors BreakReminderApp's startup up to the first paint of the widget
+STARTUP_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+{toolkit}
+import src.main
+from PyQt5.QtWidgets import QApplication
+from src.core.break_logic import BreakLogic
+from src.core.config import ConfigManager
+from src.ui.main_widget import BreakReminderWidget
+
+app = QApplication(sys.argv)
+config = ConfigManager()
+widget = BreakReminderWidget(config, BreakLogic(config.snapshot()))
+widget.show()
+app.processEvents()
+elapsed = time.perf_counter() - started
+# Peak RSS of this program; ru_maxrss would include the parent from before exec
+try:
+    with open("/proc/self/status") as f:
+        rss_mb = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:")) / 1024
+except OSError:
+    rss_mb = None
+print(json.dumps({{"seconds": elapsed, "rss_mb": rss_mb, "tkinter": "tkinter" in sys.modules}}))
+"""
+
+# The Tk root the app used to create next to the QApplication
+TK_ROOT = """
+import tkinter
+root = tkinter.Tk()
+root.title("Break Reminder Enhanced")
+root.geometry("400x300")
+"""
+
+# Starts the real application with the widget shown
+APP_SCRIPT = """
+import json, sys
+from PyQt5.QtWidgets import QSystemTrayIcon
+# Headless platforms have no tray; the icon works the same without one
+QSystemTrayIcon.isSystemTrayAvailable = staticmethod(lambda: True)
+from src.main import BreakReminderApp
+
+app = BreakReminderApp(sys.argv[:1])
+app.app.processEvents()
+print(json.dumps({"widget_shown": app.main_widget is not None and app.main_widget.isVisible(),
+                  "tk_modules": sorted(name for name in sys.modules if "tkinter" in name)}))
+"""
+
+
+def measure_startup(toolkit="", runs=3):
+    """Start the app in fresh interpreters and keep the fastest run.
+
+    Returns:
+        Dictionary with seconds, rss_mb and whether tkinter was loaded,
+        or None if the script could not run, e.g. Tk without a display
+    """
+    best = None
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        for _ in range(runs):
+            result = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT.format(toolkit=toolkit)],
+                                    cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+            if result.returncode != 0:
+                return None
+            sample = json.loads(result.stdout.strip().splitlines()[-1])
+            if best is None or sample["seconds"] < best["seconds"]:
+                best = sample
+    return best
+
+
+def test_qt_only_startup():
+    """Startup loads a single toolkit and stays within its budgets."""
+    qt_only = measure_startup()
+    assert qt_only is not None, "Startup script failed"
+    assert not qt_only["tkinter"], "tkinter was imported during startup"
+    assert qt_only["seconds"] < STARTUP_BUDGET_SECONDS, f"Startup took {qt_only['seconds']:.2f}s"
+    if qt_only["rss_mb"] is not None:
+        assert qt_only["rss_mb"] < MEMORY_BUDGET_MB, f"Startup used {qt_only['rss_mb']:.0f} MB"
+    report = f"✓ Qt-only startup: {qt_only['seconds'] * 1000:.0f} ms"
+    if qt_only["rss_mb"] is not None:
+        report += f", {qt_only['rss_mb']:.0f} MB peak RSS"
+
+    dual = measure_startup(TK_ROOT)
+    if dual is None:
+        report += " (Tk needs a display, dual-toolkit comparison skipped)"
+    else:
+        report += f"; with a Tk root: {dual['seconds'] * 1000:.0f} ms"
+        if dual["rss_mb"] is not None:
+            report += f", {dual['rss_mb']:.0f} MB"
+        assert qt_only["seconds"] <= dual["seconds"], "Qt-only startup is slower than with a Tk root"
+        if qt_only["rss_mb"] is not None and dual["rss_mb"] is not None:
+            assert qt_only["rss_mb"] <= dual["rss_mb"], "Qt-only startup uses more memory than with a Tk root"
+    print(report)
+
+
+def test_app_without_tk():
+    """Starting the real application never loads Tk."""
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, USERPROFILE=home, XDG_RUNTIME_DIR=home)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        result = subprocess.run([sys.executable, "-c", APP_SCRIPT], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report["widget_shown"]
+    assert report["tk_modules"] == [], f"Startup loaded {report['tk_modules']}"
+    print("✓ The application starts without loading Tk")
+
+
+if __name__ == "__main__":
+    print("🧪 Benchmarking startup...")
+
+    try:
+        test_qt_only_startup()
+        test_app_without_tk()
+
+        print("\n🎉 Startup is within budget!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
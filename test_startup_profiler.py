@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Test script for the --profile-startup phase profiler."""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.utils import profiler
+from src.utils.profiler import StartupProfiler, phase
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Profiles the widget the way BreakReminderApp builds it, up to the first paint
+WIDGET_SCRIPT = """
+import json, sys
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+from src.main import FirstPaintWatcher
+from src.core.break_logic import BreakLogic
+from src.core.config import ConfigManager
+from src.utils import profiler
+
+app = QApplication(sys.argv)
+startup = profiler.StartupProfiler(label="widget")
+profiler.activate(startup)
+from src.ui.main_widget import BreakReminderWidget
+
+config = ConfigManager()
+widget = BreakReminderWidget(config, BreakLogic(config.snapshot()))
+watcher = FirstPaintWatcher()
+watcher.painted.connect(startup.mark_first_paint)
+watcher.painted.connect(app.quit)
+widget.installEventFilter(watcher)
+widget.show()
+QTimer.singleShot(10000, app.quit)
+app.exec_()
+print(json.dumps(startup.report()))
+"""
+
+# Starts the whole app with --profile-startup and quits after the first paint
+APP_SCRIPT = """
+import sys
+from PyQt5.QtWidgets import QSystemTrayIcon
+# Headless platforms have no tray; the icon works the same without one
+QSystemTrayIcon.isSystemTrayAvailable = staticmethod(lambda: True)
+from src.main import main
+sys.exit(main(sys.argv))
+"""
+
+
+def test_phases():
+    """Phases are timed relative to the origin and may nest."""
+    startup = StartupProfiler(label="cold")
+    startup.record("imports", startup.origin_ns, startup.origin_ns + 2_000_000)
+    with startup.phase("widget"):
+        with startup.phase("drop shadow"):
+            pass
+    report = startup.report()
+    assert report["label"] == "cold"
+    assert [(entry["name"], entry["depth"]) for entry in report["phases"]] == [
+        ("imports", 0), ("widget", 0), ("drop shadow", 1)]
+    assert report["phases"][0] == {"name": "imports", "depth": 0, "start_ms": 0.0, "duration_ms": 2.0}
+    assert report["time_to_first_paint_ms"] is None
+    assert report["total_ms"] >= 2.0
+
+    startup.mark_first_paint()
+    first_paint = startup.report()["time_to_first_paint_ms"]
+    startup.mark_first_paint()
+    assert startup.report()["time_to_first_paint_ms"] == first_paint
+    text = startup.format_text()
+    assert "Startup profile (cold)" in text
+    assert "    drop shadow" in text
+    assert "time to first paint" in text
+    print("✓ Phases are timed and nested")
+
+
+def test_json_lines():
+    """Each run appends one JSON line so runs can be compared."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "startup.jsonl")
+        for label in ("cold", "warm"):
+            startup = StartupProfiler(label=label)
+            with startup.phase("QApplication"):
+                pass
+            startup.write_json(path)
+        with open(path, encoding='utf-8') as f:
+            runs = [json.loads(line) for line in f]
+    assert [run["label"] for run in runs] == ["cold", "warm"]
+    assert all(run["phases"][0]["name"] == "QApplication" for run in runs)
+    print("✓ Reports are appended as JSON lines")
+
+
+def test_disabled_by_default():
+    """Without an active profiler, phases do nothing."""
+    assert profiler.active() is None
+    with phase("anything"):
+        pass
+    startup = StartupProfiler()
+    profiler.activate(startup)
+    try:
+        with phase("config"):
+            pass
+    finally:
+        profiler.activate(None)
+    assert [entry["name"] for entry in startup.report()["phases"]] == ["config"]
+    print("✓ Phases are only recorded while profiling")
+
+
+def test_widget_phases():
+    """The widget reports its setup phases and its first paint."""
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        result = subprocess.run([sys.executable, "-c", WIDGET_SCRIPT], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    names = [entry["name"] for entry in report["phases"]]
+    for name in ("init_ui", "stylesheets", "status indicator", "drop shadow", "first update_display"):
+        assert name in names, f"{name} phase missing"
+    assert report["time_to_first_paint_ms"] is not None
+    assert report["time_to_first_paint_ms"] >= report["phases"][-1]["start_ms"]
+    print(f"✓ Widget phases recorded, first paint after {report['time_to_first_paint_ms']:.1f} ms")
+
+
+def test_app_phases():
+    """The app reports its imports and the instance check as separate phases."""
+    with tempfile.TemporaryDirectory() as home:
+        path = os.path.join(home, "startup.jsonl")
+        env = dict(os.environ, HOME=home, USERPROFILE=home, XDG_RUNTIME_DIR=home)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        result = subprocess.run([sys.executable, "-c", APP_SCRIPT, "--profile-startup", path,
+                                 "--profile-exit"], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        with open(path, encoding='utf-8') as f:
+            report = json.loads(f.readline())
+    imports, check = report["phases"][:2]
+    assert (imports["name"], check["name"]) == ("imports", "instance check")
+    # The imports end before argument parsing and the handoff begin
+    assert imports["start_ms"] + imports["duration_ms"] <= check["start_ms"]
+    print(f"✓ Imports took {imports['duration_ms']:.1f} ms, "
+          f"the instance check {check['duration_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing startup profiler...")
+
+    try:
+        test_phases()
+        test_json_lines()
+        test_disabled_by_default()
+        test_widget_phases()
+        test_app_phases()
+
+        print("\n🎉 All startup profiler tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
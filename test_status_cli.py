@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark and tests of the Qt-free status command."""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Time the status command may add to the standard library modules that any
+# command-line tool with JSON output loads, in a fresh interpreter
+STATUS_BUDGET_MS = 30
+
+# Times the code in a fresh interpreter and reports the modules it loaded
+TIMING_SCRIPT = """
+import time
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+import json, sys
+sys.stderr.write(json.dumps({{"ms": elapsed * 1000, "modules": sorted(sys.modules)}}) + "\\n")
+"""
+
+STDLIB_FLOOR = "import argparse, json, datetime, typing"
+
+STATUS_QUERY = """
+import contextlib, io
+from src.cli import main
+with contextlib.redirect_stdout(io.StringIO()):
+    main(["status", "--json"])
+"""
+
+
+def make_env(home):
+    """Environment with a separate home directory."""
+    return dict(os.environ, HOME=home, USERPROFILE=home)
+
+
+def measure(code, env, runs=5):
+    """Run code in fresh interpreters and keep the fastest run."""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", TIMING_SCRIPT.format(code=code)],
+                                cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        sample = json.loads(result.stderr.strip().splitlines()[-1])
+        if best is None or sample["ms"] < best["ms"]:
+            best = sample
+    return best
+
+
+def test_status_output():
+    """The status command prints a line of text or JSON."""
+    with tempfile.TemporaryDirectory() as home:
+        env = make_env(home)
+        text = subprocess.run([sys.executable, "-m", "src.cli", "status"], cwd=ROOT, env=env,
+                              capture_output=True, text=True, timeout=60)
+        assert text.returncode == 0, text.stderr
+        assert len(text.stdout.strip().splitlines()) == 1
+
+        result = subprocess.run([sys.executable, "-m", "src.cli", "status", "--json"], cwd=ROOT,
+                                env=env, capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        status = json.loads(result.stdout)
+        assert status["state"] in ("work", "break", "lunch", "done")
+        assert text.stdout.strip().startswith(status["next_event"])
+
+        launcher = subprocess.run([sys.executable, "break_reminder_status.py", "--json"], cwd=ROOT,
+                                  env=env, capture_output=True, text=True, timeout=60)
+        assert launcher.returncode == 0, launcher.stderr
+        assert json.loads(launcher.stdout)["next_event"] == status["next_event"]
+    print("✓ Status is printed as text and JSON, also by the launcher")
+
+
+def test_status_budget():
+    """The status command imports only the core and answers within budget.
+
+    The budget is relative: it is the time a query adds to a fresh
+    interpreter that imports the standard library modules any JSON printing
+    tool needs, not the absolute time of the process, which depends on the
+    machine and the interpreter's own startup.
+    """
+    with tempfile.TemporaryDirectory() as home:
+        env = make_env(home)
+        floor = measure(STDLIB_FLOOR, env)
+        query = measure(STATUS_QUERY, env)
+
+    loaded = [name for name in query["modules"] if name.startswith(("PyQt5", "tkinter", "src."))]
+    assert all(name in ("src.cli", "src.core") or name.startswith("src.core.") for name in loaded), loaded
+    added_ms = query["ms"] - floor["ms"]
+    print(f"   Status query: {query['ms']:.1f} ms, {added_ms:.1f} ms over the standard library")
+    assert added_ms < STATUS_BUDGET_MS, f"Status query took {added_ms:.1f} ms"
+    print("✓ Status query stays within its budget")
+
+
+def test_watch_prints_changes():
+    """Watch mode prints at once and again when the state changes."""
+    with tempfile.TemporaryDirectory() as home:
+        path = os.path.join(home, ".break_reminder_config.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"config_version": 2, "workdays": []}, f)
+        process = subprocess.Popen([sys.executable, "-m", "src.cli", "status", "--json", "--watch"],
+                                   cwd=ROOT, env=make_env(home), stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE, text=True)
+        try:
+            first = json.loads(process.stdout.readline())
+            assert first["next_event"] == "Day off"
+
+            # Give the watcher time to start, then make every day a workday
+            time.sleep(0.5)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({"config_version": 2}, f)
+            second = json.loads(process.stdout.readline())
+            assert second != first
+        finally:
+            process.kill()
+            process.communicate()
+    print("✓ Watch mode prints each change")
+
+
+def test_status_leaves_files_alone():
+    """A query neither moves a half-written file nor upgrades an old one."""
+    with tempfile.TemporaryDirectory() as home:
+        path = os.path.join(home, ".break_reminder_config.json")
+        for content in ('{"usual_start": "09:', '{"usual_start": "9:00", "workdays": []}'):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            result = subprocess.run([sys.executable, "-m", "src.cli", "status", "--json"], cwd=ROOT,
+                                    env=make_env(home), capture_output=True, text=True, timeout=60)
+            assert result.returncode == 0, result.stderr
+            with open(path, encoding='utf-8') as f:
+                assert f.read() == content
+            assert sorted(os.listdir(home)) == [".break_reminder_config.json"]
+        # The old file was still upgraded in memory
+        assert json.loads(result.stdout)["next_event"] == "Day off"
+    print("✓ Status queries leave the config file untouched")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing status command...")
+
+    try:
+        test_status_output()
+        test_status_budget()
+        test_watch_prints_changes()
+        test_status_leaves_files_alone()
+
+        print("\n🎉 All status command tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
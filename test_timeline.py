@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Test script for the compiled day timeline."""
+
+import sys
+import os
+import random
+from datetime import datetime, timedelta
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.timeline import BreakState, DayTimeline
+
+
+SCHEDULES = [
+    # start, lunch start, lunch end, workday length, break points
+    ("08:00", "10:45", "12:30", (8, 0), [0.25, 0.75]),
+    ("09:00", "12:00", "13:00", (8, 0), [0.25, 0.75]),
+    ("08:07", "11:00", "11:33", (7, 37), [0.13, 0.5, 0.77]),
+    ("07:30", "09:55", "10:01", (4, 0), [0.5, 0.52, 0.9]),
+    ("10:00", "09:00", "09:30", (6, 15), []),
+    ("08:00", "10:45", "12:30", (8, 5), [0.25, 0.75]),
+]
+
+
+def build_timeline(schedule, day):
+    """Build a timeline the same way BreakLogic does."""
+    start_str, lunch_start_str, lunch_end_str, (hours, minutes), break_points = schedule
+    start = datetime.combine(day, datetime.strptime(start_str, '%H:%M').time())
+    lunch_start = datetime.combine(day, datetime.strptime(lunch_start_str, '%H:%M').time())
+    lunch_end = datetime.combine(day, datetime.strptime(lunch_end_str, '%H:%M').time())
+    length = timedelta(hours=hours, minutes=minutes)
+    total_hours = length.total_seconds() / 3600
+    break_times = [start + timedelta(hours=total_hours * p) for p in break_points]
+    return DayTimeline(start, lunch_start, lunch_end, start + length, break_times)
+
+
+def reference_state(timeline, now):
+    """Original comparison chain, evaluated from scratch for every query."""
+    if now >= timeline.workday_end:
+        return BreakState.DONE, 0, 100
+    if timeline.lunch_start <= now <= timeline.lunch_end:
+        time_left = int((timeline.lunch_end - now).total_seconds() // 60)
+        total = int((timeline.lunch_end - timeline.lunch_start).total_seconds() // 60)
+        progress = int(((total - time_left) / total) * 100) if total > 0 else 0
+        return BreakState.LUNCH, time_left, progress
+
+    break_times = list(timeline.break_times)
+    idx = 0
+    while idx < len(break_times) and now > break_times[idx]:
+        idx += 1
+    if idx < len(break_times):
+        target = break_times[idx]
+        segment_start = timeline.start_time if idx == 0 else break_times[idx - 1]
+    else:
+        target = timeline.workday_end
+        segment_start = break_times[-1] if break_times else timeline.start_time
+    time_left = int((target - now).total_seconds() // 60)
+    total = int((target - segment_start).total_seconds() // 60)
+    elapsed = int((now - segment_start).total_seconds() // 60)
+    progress = int((elapsed / total) * 100) if total > 0 else 0
+    progress = max(0, min(100, progress))
+    if idx < len(break_times) and 0 <= time_left <= 5:
+        return BreakState.BREAK, time_left, progress
+    return BreakState.WORK, time_left, progress
+
+
+def sample_times(day):
+    """Every minute of the day plus random sub-minute offsets."""
+    midnight = datetime.combine(day, datetime.min.time())
+    rng = random.Random(42)
+    for minute in range(24 * 60):
+        base = midnight + timedelta(minutes=minute)
+        yield base
+        yield base + timedelta(microseconds=1)
+        yield base + timedelta(seconds=rng.uniform(0, 60))
+
+
+def test_matches_reference():
+    """Timeline lookups give the same result as the original logic."""
+    day = datetime(2026, 3, 2).date()
+    for schedule in SCHEDULES:
+        timeline = build_timeline(schedule, day)
+        for now in sample_times(day):
+            state, _, time_left, progress = timeline.state_at(now)
+            assert (state, time_left, progress) == reference_state(timeline, now), \
+                f"Mismatch at {now} for {schedule}"
+    print("✓ Timeline matches the original state logic")
+
+
+def test_segments_are_sorted_and_contiguous():
+    """Segments tile the whole time axis without gaps or overlaps."""
+    day = datetime(2026, 3, 2).date()
+    for schedule in SCHEDULES:
+        timeline = build_timeline(schedule, day)
+        segments = timeline.segments
+        assert segments[0].start == datetime.min
+        assert segments[-1].end == datetime.max
+        for previous, current in zip(segments, segments[1:]):
+            assert previous.end == current.start
+            assert current.length == current.end - current.start
+    print("✓ Segments are sorted and contiguous")
+
+
+def test_next_transition():
+    """Nothing changes between now and the next transition."""
+    day = datetime(2026, 3, 2).date()
+    for schedule in SCHEDULES:
+        timeline = build_timeline(schedule, day)
+        now = datetime.combine(day, datetime.min.time())
+        while True:
+            transition = timeline.next_transition(now)
+            if transition is None:
+                assert timeline.state_at(now)[0] == BreakState.DONE
+                break
+            assert transition > now
+            state, _, time_left, progress = timeline.state_at(now)
+            before = timeline.state_at(transition - timedelta(microseconds=1))
+            assert (state, time_left, progress) == (before[0], before[2], before[3])
+            now = transition
+    print("✓ Next transition is exact")
+
+
+def test_transitions_change_state():
+    """Every transition changes the segment, the minutes left or the progress."""
+    day = datetime(2026, 3, 2).date()
+    for schedule in SCHEDULES:
+        timeline = build_timeline(schedule, day)
+        now = timeline.start_time
+        while True:
+            transition = timeline.next_transition(now)
+            if transition is None:
+                break
+            state, segment, time_left, progress = timeline.state_at(transition)
+            before = timeline.state_at(transition - timedelta(microseconds=1))
+            assert segment is not before[1] or (time_left, progress) != (before[2], before[3]), \
+                f"Nothing changes at {transition} for {schedule}"
+            now = transition
+    print("✓ Transitions skip minutes in which nothing changes")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing compiled day timeline...")
+
+    try:
+        test_matches_reference()
+        test_segments_are_sorted_and_contiguous()
+        test_next_transition()
+        test_transitions_change_state()
+
+        print("\n🎉 All timeline tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
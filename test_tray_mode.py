@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Test script for the tray-only mode and releasing the hidden widget."""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Starts minimized, then shows and releases the widget several times
+TRAY_SCRIPT = """
+import gc, json, sys
+from PyQt5 import sip
+from PyQt5.QtCore import QCoreApplication, QEvent, QTimer
+from PyQt5.QtWidgets import QSystemTrayIcon
+# Headless platforms have no tray; the icon works the same without one
+QSystemTrayIcon.isSystemTrayAvailable = staticmethod(lambda: True)
+from src.main import BreakReminderApp
+from src.utils.memory import resident_memory_mb
+
+app = BreakReminderApp(sys.argv[:1])
+result = {"ui_loaded": "src.ui.main_widget" in sys.modules,
+          "widget_built": app.main_widget is not None,
+          "tooltip": app.tray_icon.toolTip(),
+          "status": app.status_action.text(),
+          "tray_timer_active": app.transition_timer.isActive(),
+          "published": app.state_publisher is not None and app.state_publisher.sequence > 0,
+          "tray_only_mb": resident_memory_mb(),
+          "cycles": []}
+for _ in range(5):
+    app.show_main_widget()
+    app.app.processEvents()
+    shown_mb = resident_memory_mb()
+    widget = app.main_widget
+    # The widget follows the tray's transition timer instead of its own
+    result["shared_timer"] = (widget.transitions is app.transition_timer
+                              and not any(timer.isActive() for timer in widget.findChildren(QTimer)))
+    app.hide_main_widget()
+    result["release_armed"] = app.release_timer.isActive()
+    result["menu_after_hide"] = app.show_action.text()
+    app.release_main_widget()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    gc.collect()
+    result["deleted"] = sip.isdeleted(widget) and app.main_widget is None
+    result["cycles"].append([shown_mb, resident_memory_mb()])
+print(json.dumps(result))
+"""
+
+
+def run_tray_script(config):
+    """Run the tray script with a config file and get its report."""
+    with tempfile.TemporaryDirectory() as home:
+        with open(os.path.join(home, ".break_reminder_config.json"), 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        env = dict(os.environ, HOME=home, USERPROFILE=home, XDG_RUNTIME_DIR=home)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        result = subprocess.run([sys.executable, "-c", TRAY_SCRIPT], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_tray_only_startup():
+    """Starting minimized runs the tray from the core logic alone."""
+    report = run_tray_script({"config_version": 2, "start_minimized": True})
+    assert not report["ui_loaded"], "UI modules were imported in tray-only mode"
+    assert not report["widget_built"]
+    assert report["tooltip"].startswith("Break Reminder\n")
+    assert report["tooltip"].endswith(report["status"])
+    assert report["tray_timer_active"]
+    assert report["published"]
+    print("✓ Tray tooltip and menu run without the widget")
+
+
+def test_widget_release():
+    """A hidden widget is destroyed and rebuilt on demand without leaking."""
+    report = run_tray_script({"config_version": 2, "start_minimized": True, "release_widget_after": 5})
+    assert report["release_armed"]
+    assert report["shared_timer"], "The widget runs a timer of its own"
+    assert report["menu_after_hide"] == "Show Break Reminder"
+    assert report["deleted"]
+
+    cycles = report["cycles"]
+    if report["tray_only_mb"] is not None:
+        first_release, last_release = cycles[0][1], cycles[-1][1]
+        # Rebuilding the widget reuses the memory freed by the last one
+        assert last_release - first_release < 5, f"Grew by {last_release - first_release:.1f} MB"
+        print(f"   Resident memory: {report['tray_only_mb']:.1f} MB tray only, "
+              f"{cycles[-1][0]:.1f} MB shown, {last_release:.1f} MB after release")
+    print("✓ Hidden widget is released and rebuilt")
+
+
+def test_release_disabled():
+    """Without a release period the hidden widget is kept."""
+    report = run_tray_script({"config_version": 2, "start_minimized": True, "release_widget_after": 0})
+    assert not report["release_armed"]
+    print("✓ Hidden widget is kept when releasing is off")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing tray-only mode...")
+
+    try:
+        test_tray_only_startup()
+        test_widget_release()
+        test_release_disabled()
+
+        print("\n🎉 All tray mode tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)